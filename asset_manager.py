@@ -0,0 +1,418 @@
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+import pygame
+
+ASSET_DIR = "assets/"
+BACKGROUND_DIR = "assets/backgrounds/"
+MANIFEST_PATH = "assets/manifest.json"
+BAKED_DIR = "assets/baked/"
+BAKED_INDEX_NAME = "index.json"
+# How many bytes of pixel data the cache may hold before it starts evicting, overridden by settings
+DEFAULT_MEMORY_BUDGET = 128 * 1024 * 1024
+
+# Pixel formats get_image can hand out, fastest blit first:
+#   "opaque"        no alpha at all, blits are plain copies
+#   "colorkey"      pixels are either fully opaque or fully transparent, blitted with an RLE encoded colorkey
+#   "rle"           real per-pixel alpha with large transparent areas, RLE encoded so transparent runs are skipped
+#   "alpha"         plain per-pixel alpha
+#   "premultiplied" per-pixel alpha with the colors premultiplied, blit it with special_flags=pygame.BLEND_PREMULTIPLIED
+# "auto" looks at the pixels and picks the first of opaque, colorkey, rle or alpha that draws the same image
+# (SDL's RLE alpha blitter may round half transparent edge pixels differently by one step).
+AUTO_FORMAT = "auto"
+# Color the transparent pixels of a colorkey surface are filled with
+COLORKEY = (255, 0, 255)
+# Share of fully transparent pixels above which RLE encoding pays off
+RLE_TRANSPARENT_FRACTION = 0.3
+
+def detect_format(surface):
+    """Picks the fastest pixel format that draws a surface the same way per-pixel alpha would.
+
+    Parameters:
+        surface (Surface): The image to look at, as loaded or after convert_alpha.
+
+    Returns:
+        string: "opaque", "colorkey", "rle" or "alpha".
+    """
+    if not surface.get_flags() & pygame.SRCALPHA:
+        return "opaque"
+
+    area = surface.get_width() * surface.get_height()
+    opaque_mask = pygame.mask.from_surface(surface, 254)
+    opaque = opaque_mask.count()
+    if opaque == area:
+        return "opaque"
+
+    visible_mask = pygame.mask.from_surface(surface, 0)
+    visible = visible_mask.count()
+    if visible == opaque:
+        # No half transparent pixels, a colorkey works unless the image itself uses the key color
+        key_mask = pygame.mask.from_threshold(surface, COLORKEY + (255,), (1, 1, 1, 255))
+        if key_mask.overlap_area(visible_mask, (0, 0)) == 0:
+            return "colorkey"
+
+    if (area - visible) / area >= RLE_TRANSPARENT_FRACTION:
+        return "rle"
+    return "alpha"
+
+def read_manifest(manifest_path = MANIFEST_PATH):
+    """Reads the list of (asset, target size, format) entries the game uses.
+
+    Parameters:
+        manifest_path (string): The path of the manifest JSON file. Defaults to MANIFEST_PATH.
+
+    Returns:
+        List[dict]: One dictionary per entry with the keys "path", "size", "format" and "scenes".
+    """
+    with open(manifest_path, "r") as f:
+        return json.load(f)["assets"]
+
+def output_key(path, size, fmt):
+    """Builds the key that identifies one baked or packed output, like "assets/andrew.png|55x110|auto".
+    """
+    return f"{path}|{size[0]}x{size[1]}|{fmt}"
+
+def surface_bytes(surface):
+    """Returns how many bytes of pixel data a surface holds (width x height x bytes per pixel).
+    """
+    return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+def file_hash(path):
+    """Returns the sha1 of a file's contents, used to tell when a baked output is stale.
+    """
+    with open(path, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+class AssetManager:
+    """Shared cache for every image the scenes draw. Images are decoded once, converted to the display's pixel
+    format once and scaled once per target size, so scenes can ask for the same surface every frame for free.
+    Images are looked up in the memory mapped asset pack (asset_pack.py) first, then in the pre-scaled copies from
+    the bake step (bake_assets.py), and only then decoded from the loose files.
+
+    Unless a scene asks for a specific format, each image gets the fastest pixel format that still looks the same
+    (see detect_format), so opaque backgrounds are plain copies and sprites with hard edges use RLE colorkeys.
+
+    Every cached surface is accounted in bytes and tagged with the scenes that asked for it. When the total goes
+    over the memory budget, the least recently used surfaces that the current scene does not use are evicted.
+    """
+
+    def __init__(self, baked_dir = BAKED_DIR, memory_budget = DEFAULT_MEMORY_BUDGET):
+        """Default constructor. Creates the empty caches.
+
+        Parameters:
+            baked_dir (string): The folder bake_assets.py writes to. Defaults to BAKED_DIR.
+            memory_budget (int): How many bytes of pixel data to keep before evicting. Defaults to DEFAULT_MEMORY_BUDGET.
+        """
+        # Converted surfaces keyed by (path, size, format), least recently used first. A size of None is the original.
+        self.surfaces = OrderedDict()
+        # Accounting for each cached surface, keyed like surfaces
+        self.surface_sizes = {}
+        self.surface_owners = {}
+        # The format "auto" resolved to, keyed like surfaces
+        self.surface_formats = {}
+        self.total_bytes = 0
+        self.memory_budget = memory_budget
+        self.evictions = 0
+        # The scene new surfaces are tagged with, set by main.py when it builds a scene
+        self.owner = None
+        # Loads running on the streamer's worker threads, keyed like surfaces
+        self.pending = {}
+        self.lock = threading.Lock()
+
+        self.pack = None
+        self.pack_opened = False
+
+        self.baked_dir = baked_dir
+        self.baked_index = None
+        # Sources whose baked outputs match the file on disk, keyed by path
+        self.fresh_sources = {}
+
+    def get_size(self, path):
+        """Returns the size of the original image, so scenes can work out aspect-correct target sizes.
+
+        Parameters:
+            path (string): The path of the image file, relative to the game folder.
+
+        Returns:
+            (int, int): The width and height of the original image.
+        """
+        # The pack and the bake index remember the original size, so the full image does not have to be decoded
+        pack = self._get_pack()
+        if pack is not None and pack.get_size(path) is not None:
+            return pack.get_size(path)
+        if self._is_fresh(path):
+            return tuple(self.baked_index["sources"][path]["size"])
+        return self._get_original(path).get_size()
+
+    def get_image(self, path, size = None, fmt = AUTO_FORMAT, owner = None):
+        """Returns the image at path converted to the display format and scaled to size. The surface is shared
+        between every scene that asks for the same key, so callers must not draw onto it.
+
+        Parameters:
+            path (string): The path of the image file, relative to the game folder.
+            size ((float, float)): The target size. Fractional sizes are truncated like pygame.transform.scale does.
+                Defaults to None, which keeps the original size.
+            fmt (string): The pixel format, see the notes at the top of this file. Defaults to "auto".
+            owner (string): The scene to account the surface to. Defaults to None, which uses the current owner.
+
+        Returns:
+            Surface: The converted and scaled image.
+        """
+        if size is not None:
+            size = (int(size[0]), int(size[1]))
+        if owner is None:
+            owner = self.owner
+
+        key = (path, size, fmt)
+        with self.lock:
+            surface = self.surfaces.get(key)
+            if surface is not None:
+                # Mark as most recently used
+                self.surfaces.move_to_end(key)
+                self.surface_owners[key].add(owner)
+                return surface
+            future = self.pending.get(key)
+
+        # If a worker is already loading it, wait for that instead of loading it twice
+        if future is not None:
+            return future.result()
+        return self._load(key, owner)
+
+    def prefetch(self, executor, path, size = None, fmt = AUTO_FORMAT, owner = None):
+        """Starts loading an image on a worker thread, so a later get_image for the same key finds it ready.
+
+        Parameters:
+            executor (Executor): The thread pool to load on.
+            path (string): The path of the image file, relative to the game folder.
+            size ((float, float)): The target size. Defaults to None, which keeps the original size.
+            fmt (string): The pixel format. Defaults to "auto".
+            owner (string): The scene to account the surface to. Defaults to None, which uses the current owner.
+
+        Returns:
+            Future: The running load, or None if the image is already cached or loading.
+        """
+        if size is not None:
+            size = (int(size[0]), int(size[1]))
+
+        key = (path, size, fmt)
+        with self.lock:
+            if key in self.surfaces or key in self.pending:
+                return None
+            future = executor.submit(self._load, key, owner if owner is not None else self.owner)
+            self.pending[key] = future
+        return future
+
+    def get_background(self, name, size):
+        """Returns a background from the backgrounds folder scaled to fill the screen.
+
+        Parameters:
+            name (string): The file name of the background, like "classroom.png".
+            size ((int, int)): The size of the screen.
+
+        Returns:
+            Surface: The converted and scaled background.
+        """
+        return self.get_image(BACKGROUND_DIR + name, size)
+
+    def clear(self):
+        """Drops every cached surface, for example after the display mode changes.
+        """
+        with self.lock:
+            self.surfaces.clear()
+            self.surface_sizes.clear()
+            self.surface_owners.clear()
+            self.surface_formats.clear()
+            self.total_bytes = 0
+        self.baked_index = None
+        self.fresh_sources.clear()
+        # The pack stays mapped, surfaces built on it may still be in use
+
+    def report(self, top = 10):
+        """Summarizes what the cache is holding, biggest first.
+
+        Parameters:
+            top (int): How many of the biggest surfaces to list. Defaults to 10.
+
+        Returns:
+            dict: "total_bytes", "memory_budget", "evictions", "owners" (bytes per scene, where a surface shared by
+                several scenes counts for each of them) and "surfaces" (a list of (bytes, key, owners)).
+        """
+        with self.lock:
+            owners = {}
+            for key, size in self.surface_sizes.items():
+                for owner in self.surface_owners[key]:
+                    owners[owner] = owners.get(owner, 0) + size
+
+            biggest = sorted(((size, key, sorted(map(str, self.surface_owners[key]))) for key, size in self.surface_sizes.items()), reverse = True)
+            return {
+                "total_bytes": self.total_bytes,
+                "memory_budget": self.memory_budget,
+                "evictions": self.evictions,
+                "owners": owners,
+                "surfaces": biggest[:top],
+            }
+
+    def format_report(self, top = 10):
+        """Returns report() as readable text, used by the F9 memory dump in main.py.
+        """
+        summary = self.report(top)
+        mb = 1024 * 1024
+        lines = [f"Asset memory: {summary['total_bytes'] / mb:.1f} MB of {summary['memory_budget'] / mb:.1f} MB budget, "
+                 f"{len(self.surfaces)} surfaces, {summary['evictions']} evicted"]
+
+        lines.append("By scene:")
+        for owner, size in sorted(summary["owners"].items(), key = lambda item: item[1], reverse = True):
+            lines.append(f"  {owner}: {size / mb:.1f} MB")
+
+        lines.append("Biggest surfaces:")
+        for size, key, owners in summary["surfaces"]:
+            path, target_size, fmt = key
+            size_text = "original" if target_size is None else f"{target_size[0]}x{target_size[1]}"
+            lines.append(f"  {size / mb:6.2f} MB  {path} ({size_text}, {self.surface_formats.get(key, fmt)})  {', '.join(owners)}")
+        return "\n".join(lines)
+
+    def _get_original(self, path):
+        # The decoded original that scaled copies are made from. It is cached without an owner, so the budget can
+        # drop it once the copies exist, unless a scene asks for the original itself
+        key = (path, None, "alpha")
+        with self.lock:
+            surface = self.surfaces.get(key)
+            if surface is not None:
+                self.surfaces.move_to_end(key)
+                return surface
+        return self._load(key, None, tag = False)
+
+    def _load(self, key, owner, tag = True):
+        # Pack first, then the baked copies, then decode and scale the original. tag is False for intermediate
+        # originals, which no scene holds on to
+        path, size, fmt = key
+        shares_memory = False
+        if size is None:
+            # Decode the file and convert it to the display format
+            surface = pygame.image.load(path).convert_alpha()
+        else:
+            surface = self._load_packed(path, size, fmt)
+            shares_memory = surface is not None
+            if surface is None:
+                surface = self._load_baked(path, size, fmt)
+            if surface is None:
+                surface = self._get_original(path)
+                if size != surface.get_size():
+                    surface = pygame.transform.scale(surface, size)
+                else:
+                    # Same size as the cached original, copy it so finishing cannot change the original
+                    surface = surface.copy()
+
+        surface, resolved = self._finish(surface, fmt, shares_memory)
+
+        with self.lock:
+            self.pending.pop(key, None)
+            if key in self.surfaces:
+                # Another thread finished the same load first, keep one copy
+                return self.surfaces[key]
+
+            self.surfaces[key] = surface
+            self.surface_sizes[key] = surface_bytes(surface)
+            self.surface_owners[key] = {owner} if tag else set()
+            self.surface_formats[key] = resolved
+            self.total_bytes += self.surface_sizes[key]
+            self._evict(key)
+        return surface
+
+    def _finish(self, surface, fmt, shares_memory):
+        # Turn a convert_alpha style surface into the requested pixel format
+        if fmt == AUTO_FORMAT:
+            fmt = detect_format(surface)
+
+        if fmt == "opaque":
+            if shares_memory:
+                # Keep pointing at the pack, just stop blending
+                surface.set_alpha(None)
+            else:
+                surface = surface.convert()
+        elif fmt == "colorkey":
+            keyed = pygame.Surface(surface.get_size()).convert()
+            keyed.fill(COLORKEY)
+            keyed.blit(surface, (0, 0))
+            keyed.set_colorkey(COLORKEY, pygame.RLEACCEL)
+            surface = keyed
+        elif fmt == "rle":
+            surface.set_alpha(255, pygame.RLEACCEL)
+        elif fmt == "premultiplied":
+            surface = surface.premul_alpha()
+        return surface, fmt
+
+    def _evict(self, keep):
+        # Drop least recently used surfaces until under budget. Surfaces the current scene uses are kept, evicting
+        # them would not free anything because the scene still holds them
+        if self.total_bytes <= self.memory_budget:
+            return
+
+        for key in list(self.surfaces):
+            if self.total_bytes <= self.memory_budget:
+                break
+            if key == keep or self.owner in self.surface_owners[key]:
+                continue
+
+            del self.surfaces[key]
+            self.total_bytes -= self.surface_sizes.pop(key)
+            del self.surface_owners[key]
+            self.surface_formats.pop(key, None)
+            self.evictions += 1
+
+    def _get_pack(self):
+        # Map the pack the first time an image is asked for, after the display exists
+        with self.lock:
+            if not self.pack_opened:
+                from asset_pack import open_pack
+                self.pack = open_pack()
+                self.pack_opened = True
+        return self.pack
+
+    def _load_packed(self, path, size, fmt):
+        # Build the surface straight on top of the mapped pack, no decode and no scale
+        pack = self._get_pack()
+        if pack is None:
+            return None
+        return pack.get_image(path, size, fmt)
+
+    def _load_baked(self, path, size, fmt):
+        # Use the pre-scaled output from the bake step if there is one for this exact key
+        if not self._is_fresh(path):
+            return None
+
+        file_name = self.baked_index["outputs"].get(output_key(path, size, fmt))
+        if file_name is None:
+            return None
+
+        baked_path = os.path.join(self.baked_dir, file_name)
+        if not os.path.exists(baked_path):
+            return None
+
+        return pygame.image.load(baked_path).convert_alpha()
+
+    def _is_fresh(self, path):
+        # A source is fresh when it was baked from the same bytes that are on disk now
+        fresh = self.fresh_sources.get(path)
+        if fresh is None:
+            with self.lock:
+                if self.baked_index is None:
+                    self.baked_index = self._read_baked_index()
+
+            source = self.baked_index["sources"].get(path)
+            fresh = source is not None and os.path.exists(path) and source["hash"] == file_hash(path)
+            self.fresh_sources[path] = fresh
+        return fresh
+
+    def _read_baked_index(self):
+        index_path = os.path.join(self.baked_dir, BAKED_INDEX_NAME)
+        if not os.path.exists(index_path):
+            return {"sources": {}, "outputs": {}}
+
+        with open(index_path, "r") as f:
+            return json.load(f)
+
+# Process-wide instance that every scene shares
+assets = AssetManager()
@@ -0,0 +1,168 @@
+import json
+import mmap
+import os
+import struct
+import pygame
+from asset_manager import MANIFEST_PATH, AUTO_FORMAT, read_manifest, output_key
+
+# Run "python asset_pack.py" from the game folder to build assets/assets.pack from assets/manifest.json.
+# The pack holds every manifest entry already scaled and already in the display's pixel layout, so loading
+# an image is a memory map lookup instead of a PNG/JPEG decode.
+
+PACK_PATH = "assets/assets.pack"
+PACK_MAGIC = b"SRPK"
+PACK_VERSION = 1
+# magic, version, index length
+HEADER_FORMAT = "<4sII"
+# Pixel blobs start on a 16 byte boundary so SDL's blitters get aligned rows
+BLOB_ALIGNMENT = 16
+# Byte order of a 32-bit ARGB8888 surface on little-endian machines, which is what convert_alpha() gives
+PIXEL_FORMAT = "BGRA"
+
+def _source_stamp(path):
+    # Size and modification time are enough to notice an edited source without reading it
+    stat = os.stat(path)
+    return [stat.st_size, stat.st_mtime_ns]
+
+def _align(offset):
+    return (offset + BLOB_ALIGNMENT - 1) // BLOB_ALIGNMENT * BLOB_ALIGNMENT
+
+def build_pack(manifest_path = MANIFEST_PATH, pack_path = PACK_PATH):
+    """Writes every manifest entry into one pack file: a header, a JSON index and the raw pixel blobs.
+
+    Parameters:
+        manifest_path (string): The path of the manifest JSON file. Defaults to MANIFEST_PATH.
+        pack_path (string): Where to write the pack. Defaults to PACK_PATH.
+
+    Returns:
+        int: How many images were packed.
+    """
+    index = {"format": PIXEL_FORMAT, "sources": {}, "entries": {}}
+    originals = {}
+    blobs = []
+    offset = 0
+
+    for entry in read_manifest(manifest_path):
+        path = entry["path"]
+        size = tuple(entry["size"])
+        fmt = entry.get("format", AUTO_FORMAT)
+
+        if path not in originals:
+            originals[path] = pygame.image.load(path)
+            index["sources"][path] = {"stamp": _source_stamp(path), "size": list(originals[path].get_size())}
+
+        # Same nearest-neighbour scale the runtime loader uses
+        pixels = pygame.image.tobytes(pygame.transform.scale(originals[path], size), PIXEL_FORMAT)
+
+        offset = _align(offset)
+        index["entries"][output_key(path, size, fmt)] = {"offset": offset, "size": list(size), "format": fmt}
+        blobs.append((offset, pixels))
+        offset += len(pixels)
+
+    index_bytes = json.dumps(index).encode()
+    data_start = _align(struct.calcsize(HEADER_FORMAT) + len(index_bytes))
+
+    with open(pack_path, "wb") as f:
+        f.write(struct.pack(HEADER_FORMAT, PACK_MAGIC, PACK_VERSION, len(index_bytes)))
+        f.write(index_bytes)
+        for blob_offset, pixels in blobs:
+            f.seek(data_start + blob_offset)
+            f.write(pixels)
+
+    return len(blobs)
+
+class AssetPack:
+    """Read side of the pack file. The file is memory mapped once and every surface is built straight on top of
+    the mapped pixels, so there is no decode and no copy when the display uses the packed pixel layout.
+    """
+
+    def __init__(self, pack_path = PACK_PATH):
+        """Opens and maps the pack. Raises OSError if the file can't be read, and ValueError, struct.error or
+        KeyError if it is not a pack or is truncated.
+
+        Parameters:
+            pack_path (string): The path of the pack file. Defaults to PACK_PATH.
+        """
+        with open(pack_path, "rb") as f:
+            # Copy-on-write mapping, so a scene drawing onto a packed surface can never change the file
+            self.data = mmap.mmap(f.fileno(), 0, access = mmap.ACCESS_COPY)
+
+        magic, version, index_length = struct.unpack_from(HEADER_FORMAT, self.data, 0)
+        if magic != PACK_MAGIC or version != PACK_VERSION:
+            raise ValueError(f"{pack_path} is not a version {PACK_VERSION} asset pack")
+
+        header_size = struct.calcsize(HEADER_FORMAT)
+        index = json.loads(self.data[header_size:header_size + index_length])
+        self.data_start = _align(header_size + index_length)
+        self.entries = index["entries"]
+        self.sources = index["sources"]
+
+        # Every blob has to lie inside the file, so a truncated pack is turned down here instead of failing in
+        # the middle of a scene
+        for key, entry in self.entries.items():
+            width, height = entry["size"]
+            start = self.data_start + entry["offset"]
+            if entry["offset"] < 0 or width < 0 or height < 0 or start + width * height * 4 > len(self.data):
+                raise ValueError(f"{pack_path} is truncated, {key} does not fit in it")
+        self.fresh_sources = {}
+        self.display_masks = None
+
+    def get_size(self, path):
+        """Returns the original size of a packed source, or None if it is not packed or has changed on disk.
+        """
+        if not self.is_fresh(path):
+            return None
+        return tuple(self.sources[path]["size"])
+
+    def get_image(self, path, size, fmt):
+        """Returns a surface for a packed entry, or None if the entry is not in the pack or its source has
+        changed since the pack was built.
+
+        Parameters:
+            path (string): The path of the source image.
+            size ((int, int)): The target size.
+            fmt (string): The format the entry was requested in, like "auto".
+
+        Returns:
+            Surface: A per-pixel alpha surface that shares memory with the pack, or None.
+        """
+        entry = self.entries.get(output_key(path, size, fmt))
+        if entry is None or not self.is_fresh(path):
+            return None
+
+        width, height = entry["size"]
+        start = self.data_start + entry["offset"]
+        pixels = memoryview(self.data)[start:start + width * height * 4]
+        surface = pygame.image.frombuffer(pixels, (width, height), PIXEL_FORMAT)
+
+        # Only fall back to a converted copy if the display does not use the packed layout
+        if self.display_masks is None:
+            self.display_masks = pygame.Surface((1, 1), pygame.SRCALPHA).convert_alpha().get_masks()
+        if surface.get_masks() != self.display_masks:
+            surface = surface.convert_alpha()
+        return surface
+
+    def is_fresh(self, path):
+        """Whether the source at path is unchanged since the pack was built.
+        """
+        fresh = self.fresh_sources.get(path)
+        if fresh is None:
+            source = self.sources.get(path)
+            fresh = source is not None and os.path.exists(path) and source["stamp"] == _source_stamp(path)
+            self.fresh_sources[path] = fresh
+        return fresh
+
+def open_pack(pack_path = PACK_PATH):
+    """Opens the pack if it exists and is valid, otherwise returns None so callers fall back to loose files.
+    """
+    if not os.path.exists(pack_path):
+        return None
+    try:
+        return AssetPack(pack_path)
+    except (OSError, ValueError, struct.error, KeyError) as error:
+        print(f"Ignoring asset pack: {error}")
+        return None
+
+if __name__ == "__main__":
+    count = build_pack()
+    print(f"Packed {count} assets into {PACK_PATH}")
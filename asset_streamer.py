@@ -0,0 +1,47 @@
+from concurrent.futures import ThreadPoolExecutor
+from asset_manager import AUTO_FORMAT, read_manifest
+
+class AssetStreamer:
+    """Loads the assets of the scene that comes next on worker threads while the current scene is playing, so
+    building the next scene only picks up surfaces that are already decoded, converted and scaled.
+
+    Which assets belong to which scene comes from the "scenes" list of each entry in assets/manifest.json, and
+    which scene comes next comes from the current scene's default_next_scene.
+    """
+
+    def __init__(self, asset_manager, workers = 2):
+        """Default constructor. Starts the worker threads and reads the manifest.
+
+        Parameters:
+            asset_manager (AssetManager): The cache the loaded surfaces go into.
+            workers (int): How many images can be loaded at the same time. Defaults to 2.
+        """
+        self.assets = asset_manager
+        self.executor = ThreadPoolExecutor(max_workers = workers, thread_name_prefix = "asset_streamer")
+
+        # Manifest entries grouped by the scenes that use them
+        self.scene_assets = {}
+        for entry in read_manifest():
+            for scene_key in entry.get("scenes", []):
+                self.scene_assets.setdefault(scene_key, []).append(entry)
+
+    def prefetch(self, scene_key):
+        """Queues every asset of a scene that is not cached yet. Returns right away.
+
+        Parameters:
+            scene_key (string): The key of the scene in main.SCENES, usually the current scene's default_next_scene.
+
+        Returns:
+            int: How many loads were started.
+        """
+        started = 0
+        for entry in self.scene_assets.get(scene_key, []):
+            fmt = entry.get("format", AUTO_FORMAT)
+            if self.assets.prefetch(self.executor, entry["path"], entry["size"], fmt, scene_key) is not None:
+                started += 1
+        return started
+
+    def shutdown(self):
+        """Stops the worker threads without waiting for loads nobody needs anymore.
+        """
+        self.executor.shutdown(wait = False, cancel_futures = True)
@@ -0,0 +1,70 @@
+import hashlib
+import json
+import os
+import pygame
+from asset_manager import MANIFEST_PATH, BAKED_DIR, BAKED_INDEX_NAME, AUTO_FORMAT, read_manifest, output_key, file_hash
+
+# Run "python bake_assets.py" from the game folder after changing any image or any sprite size.
+# It reads assets/manifest.json and writes pre-scaled copies to assets/baked/, which the AssetManager
+# loads instead of decoding and rescaling the full-size originals.
+
+def baked_file_name(path, size, fmt, source_hash):
+    """Names a baked output after its content, so a changed source or size always gets a new file.
+    """
+    content_key = hashlib.sha1(f"{source_hash}|{size[0]}x{size[1]}|{fmt}".encode()).hexdigest()[:16]
+    stem = os.path.splitext(os.path.basename(path))[0]
+    return f"{stem}_{size[0]}x{size[1]}_{fmt}_{content_key}.png"
+
+def bake(manifest_path = MANIFEST_PATH, baked_dir = BAKED_DIR):
+    """Writes every manifest entry to baked_dir, skipping outputs that are already up to date and deleting
+    outputs that no entry uses anymore.
+
+    Parameters:
+        manifest_path (string): The path of the manifest JSON file. Defaults to MANIFEST_PATH.
+        baked_dir (string): The folder to write the baked outputs and index to. Defaults to BAKED_DIR.
+
+    Returns:
+        (int, int): How many outputs were written and how many were already up to date.
+    """
+    os.makedirs(baked_dir, exist_ok = True)
+
+    index = {"sources": {}, "outputs": {}}
+    originals = {}
+    written = 0
+    skipped = 0
+
+    for entry in read_manifest(manifest_path):
+        path = entry["path"]
+        size = tuple(entry["size"])
+        fmt = entry.get("format", AUTO_FORMAT)
+
+        if path not in index["sources"]:
+            originals[path] = pygame.image.load(path)
+            index["sources"][path] = {"hash": file_hash(path), "size": list(originals[path].get_size())}
+
+        file_name = baked_file_name(path, size, fmt, index["sources"][path]["hash"])
+        index["outputs"][output_key(path, size, fmt)] = file_name
+
+        out_path = os.path.join(baked_dir, file_name)
+        if os.path.exists(out_path):
+            skipped += 1
+            continue
+
+        # Same nearest-neighbour scale the runtime loader uses, so baked and unbaked frames look identical
+        pygame.image.save(pygame.transform.scale(originals[path], size), out_path)
+        written += 1
+
+    # Remove outputs from older manifests or older versions of the sources
+    used = set(index["outputs"].values())
+    for file_name in os.listdir(baked_dir):
+        if file_name.endswith(".png") and file_name not in used:
+            os.remove(os.path.join(baked_dir, file_name))
+
+    with open(os.path.join(baked_dir, BAKED_INDEX_NAME), "w") as f:
+        json.dump(index, f, indent=4)
+
+    return written, skipped
+
+if __name__ == "__main__":
+    written, skipped = bake()
+    print(f"Baked {written} assets ({skipped} already up to date) into {BAKED_DIR}")
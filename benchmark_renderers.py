@@ -0,0 +1,138 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import pygame
+import save_manager
+
+# Run "python benchmark_renderers.py" from the game folder to compare the surface and texture backends scene by
+# scene. Every scene is built from a new game in a temporary save file and played for a number of frames without
+# input, and the time spent drawing the frame and presenting it is measured separately. Each backend runs in its
+# own process, because pygame can't switch a running game between them. vsync is off so the numbers are not capped
+# by the monitor. The texture backend's renderer can put off the drawing until the frame is presented, so compare
+# the sum of both times.
+
+FRAMES = 300
+
+BACKENDS = ["surface", "texture"]
+
+def make_scenes():
+    """Returns the scene classes by key, in the order they are played.
+    """
+    from scenes.c1_title_screen import title_screen
+    from scenes.c2_instructions import instructions_screen
+    from scenes.c3_load_save_menu import load_save_menu
+    from scenes.c4_brother_a_transition import brother_a_transition
+    from scenes.c5_brother_b_transition import brother_b_transition
+    from scenes.c6_ending import ending
+    from scenes.s1_classroom import classroom
+    from scenes.s2_playground import playground
+    from scenes.s3_hallway import hallway
+    from scenes.s4_street import street
+    from scenes.s5a_store import store
+    from scenes.s5b_costco import costco
+    return {
+        "title_screen": title_screen,
+        "instructions": instructions_screen,
+        "load_save": load_save_menu,
+        "brother_a_transition": brother_a_transition,
+        "classroom": classroom,
+        "playground": playground,
+        "hallway": hallway,
+        "brother_b_transition": brother_b_transition,
+        "street": street,
+        "store": store,
+        "costco": costco,
+        "ending": ending,
+    }
+
+def reset_save(path):
+    """Makes path the save file and writes a new game to it, with time left over from the street for the store
+    and costco.
+
+    Parameters:
+        path (string): The path of the save file.
+    """
+    # The load save menu points the save manager at the real save files when it reads them for its buttons
+    save_manager.SAVE_PATH = path
+    save_manager.save_data(dict(save_manager.DEFAULT_DATA, brother_b_remaining_time=60.0))
+
+def run_backend(backend, frames = FRAMES):
+    """Plays every scene on one backend.
+
+    Parameters:
+        backend (string): "surface" or "texture".
+        frames (int): How many frames to play each scene for. Defaults to FRAMES.
+
+    Returns:
+        dict: (render ms, present ms) per frame by scene key, or None when the backend is not available.
+    """
+    from texture_renderer import TextureBackend, texture_backend_available
+    from window import open_window
+
+    pygame.init()
+    if backend == "texture":
+        if not texture_backend_available():
+            return None
+        texture_backend = TextureBackend(vsync=False)
+        frame = texture_backend.frame
+        present = texture_backend.present
+    else:
+        frame = open_window(vsync=False)
+        present = pygame.display.flip
+
+    # The scenes save as they play, which must not touch the real save files
+    save_dir = tempfile.TemporaryDirectory()
+    save_path = os.path.join(save_dir.name, "benchmark.json")
+
+    results = {}
+    for key, scene_class in make_scenes().items():
+        reset_save(save_path)
+        scene = scene_class()
+        render_time = 0.0
+        present_time = 0.0
+        for _ in range(frames):
+            # Keep the window responsive, the benchmark sends the scenes no input
+            pygame.event.pump()
+            scene.process_input([])
+            scene.update(1 / 60)
+            start = time.perf_counter()
+            scene.render(frame)
+            middle = time.perf_counter()
+            present()
+            present_time += time.perf_counter() - middle
+            render_time += middle - start
+        results[key] = (render_time * 1000 / frames, present_time * 1000 / frames)
+    if backend == "texture":
+        texture_backend.close()
+    pygame.quit()
+    save_dir.cleanup()
+    return results
+
+def main():
+    if len(sys.argv) == 3 and sys.argv[1] == "--backend":
+        print(json.dumps(run_backend(sys.argv[2])))
+        return
+
+    results = {}
+    for backend in BACKENDS:
+        output = subprocess.run([sys.executable, __file__, "--backend", backend], capture_output=True, text=True, check=True)
+        # pygame prints its banner first, the results are the last line
+        results[backend] = json.loads(output.stdout.strip().splitlines()[-1])
+
+    header = f"{'scene':22}" + "".join(f"{backend + ' render':>18}{backend + ' present':>18}" for backend in BACKENDS)
+    print(header)
+    for key in make_scenes():
+        line = f"{key:22}"
+        for backend in BACKENDS:
+            if results[backend] is None:
+                line += f"{'n/a':>18}{'n/a':>18}"
+            else:
+                render_ms, present_ms = results[backend][key]
+                line += f"{render_ms:>15.2f} ms{present_ms:>15.2f} ms"
+        print(line)
+
+if __name__ == "__main__":
+    main()
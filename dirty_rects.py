@@ -0,0 +1,127 @@
+from contextlib import contextmanager, nullcontext
+import pygame
+
+# Optional renderer that only pushes the parts of the window that changed, turned on by the "dirty_rects" setting.
+# Scenes still draw the whole frame, but they draw it onto a DirtyRectSurface, which remembers where everything
+# except the background was drawn. Only those areas are copied to the window, which saves most of the cost of
+# presenting a 1280x720 frame on software-rendered displays.
+
+# When more than this share of the screen changed, one full update is cheaper than many small ones
+FULL_UPDATE_FRACTION = 0.5
+
+class DirtyRectSurface(pygame.Surface):
+    """An off-screen frame that records the rect of every blit and fill made onto it.
+
+    Something that is drawn every frame is covered both where it is now and where it was last frame, so moving,
+    appearing and vanishing sprites and text all get updated. The background is drawn inside untracked(), because
+    it looks the same every frame. Shapes drawn with pygame.draw are not recorded; a scene that draws a shape that
+    moves or comes and goes without a blit under it reports it with mark_dirty().
+    """
+
+    def __init__(self, size):
+        """Default constructor.
+
+        Parameters:
+            size ((int, int)): The size of the frame, the same as the window.
+        """
+        super().__init__(size)
+        # Rects drawn this frame and last frame
+        self.rects = []
+        self.previous_rects = []
+        self.tracking = True
+        # Whether the next present() has to push the whole frame
+        self.full_update = True
+
+    def blit(self, source, dest, area = None, special_flags = 0):
+        rect = super().blit(source, dest, area, special_flags)
+        if self.tracking:
+            self.rects.append(rect)
+        return rect
+
+    def blits(self, blit_sequence, doreturn = True):
+        rects = super().blits(blit_sequence, doreturn = True)
+        if self.tracking:
+            self.rects.extend(rects)
+        return rects if doreturn else None
+
+    def fill(self, color, rect = None, special_flags = 0):
+        rect = super().fill(color, rect, special_flags)
+        if self.tracking:
+            self.rects.append(rect)
+        return rect
+
+    def mark_dirty(self, rect):
+        """Records a changed area that was not drawn with blit or fill, like a shape from pygame.draw.
+        """
+        self.rects.append(pygame.Rect(rect))
+
+    @contextmanager
+    def untracked(self):
+        """Context manager for drawing that looks the same every frame, like the background.
+        """
+        self.tracking = False
+        try:
+            yield self
+        finally:
+            self.tracking = True
+
+    def invalidate(self):
+        """Makes the next present() push the whole frame, for example after the scene changed.
+        """
+        self.full_update = True
+
+    def take_changes(self):
+        """Returns the areas that changed since the last time, clipped to the frame, and starts recording the next
+        frame.
+
+        Returns:
+            List[Rect]: The changed areas, or None when the whole frame has to be pushed.
+        """
+        changed = self.rects + self.previous_rects
+        self.previous_rects = self.rects
+        self.rects = []
+
+        frame_area = self.get_width() * self.get_height()
+        changed_area = sum(rect.width * rect.height for rect in changed)
+        if self.full_update or changed_area > frame_area * FULL_UPDATE_FRACTION:
+            self.full_update = False
+            return None
+
+        # Only the changed areas are stale, the rest still shows the same background
+        frame_rect = self.get_rect()
+        changed = [rect.clip(frame_rect) for rect in changed]
+        return [rect for rect in changed if rect.width and rect.height]
+
+    def present(self, display):
+        """Copies the changed areas of the frame to the display surface and updates them in the window.
+
+        Parameters:
+            display (Surface): The display surface from pygame.display.set_mode().
+        """
+        changed = self.take_changes()
+        if changed is None:
+            display.blit(self, (0, 0))
+            pygame.display.flip()
+            return
+
+        for rect in changed:
+            display.blit(self, rect, rect)
+        pygame.display.update(changed)
+
+def mark_dirty(surface, rect):
+    """Reports a changed area to surface if it is a DirtyRectSurface, and does nothing otherwise, so scenes can call
+    it without knowing whether dirty rect mode is on.
+
+    Parameters:
+        surface (Surface): The surface the scene is drawing onto.
+        rect (Rect): The area that changed, like the rect returned by a pygame.draw function.
+    """
+    if isinstance(surface, DirtyRectSurface):
+        surface.mark_dirty(rect)
+
+def untracked(surface):
+    """Returns surface.untracked() for a DirtyRectSurface, or a context manager that does nothing for any other surface.
+    """
+    if isinstance(surface, DirtyRectSurface):
+        return surface.untracked()
+    return nullcontext(surface)
@@ -1,6 +1,15 @@
+import time
 import pygame
 from save_manager import load_save, save_data
+from asset_manager import assets
+from asset_streamer import AssetStreamer
+from dirty_rects import DirtyRectSurface
+from window import open_window, toggle_fullscreen
+from texture_renderer import TextureBackend, texture_backend_available
+from quality import quality, QUALITY_LEVELS
 
+from scenes.text_cache import text_cache
+from scenes.surface_pool import surface_pool
 from scenes.c1_title_screen import title_screen
 from scenes.c2_instructions import instructions_screen
 from scenes.c3_load_save_menu import load_save_menu
@@ -32,30 +41,168 @@ SCENES = {
 save = load_save()
 
 pygame.init()
-screen = pygame.display.set_mode((1280, 720))
+fullscreen = save["settings"].get("fullscreen", False)
+vsync = save["settings"].get("vsync", True)
+# "surface" draws through the window surface, "texture" through an SDL2 Renderer, see texture_renderer.py
+if save["settings"].get("renderer", "surface") == "texture" and texture_backend_available():
+    texture_backend = TextureBackend(fullscreen=fullscreen, vsync=vsync)
+    screen = texture_backend.screen
+else:
+    texture_backend = None
+    screen = open_window(fullscreen, vsync)
 clock = pygame.time.Clock()
 
+# Cap on cached image memory, so the game fits on low-memory machines
+assets.memory_budget = save["settings"].get("asset_memory_mb", 128) * 1024 * 1024
+
+# "auto" lowers the drawing quality when frames run late and raises it again when there is time, "low", "medium"
+# and "high" keep one tier
+quality_setting = save["settings"].get("quality", "auto")
+if quality_setting in QUALITY_LEVELS:
+    quality.adaptive = False
+    quality.set_level(QUALITY_LEVELS[quality_setting])
+
+# Loads the next scene's images in the background while the current one plays
+streamer = AssetStreamer(assets)
+
+# In dirty rect mode scenes draw onto an off-screen frame and only the parts that changed are pushed to the window.
+# The texture backend has a frame of its own that draws with the renderer.
+if texture_backend is not None:
+    frame = texture_backend.frame
+elif save["settings"].get("dirty_rects", False):
+    frame = DirtyRectSurface(screen.get_size())
+else:
+    frame = screen
+
+# What the game does while its window is minimized, hidden or not focused:
+# "low_fps" keeps running and drawing at background_fps, "no_render" keeps the game running without drawing it,
+# and "pause" stops everything until the window is back, only drawing the frame again when the window uncovers it
+background_mode = save["settings"].get("background_mode", "low_fps")
+background_fps = save["settings"].get("background_fps", 5)
+window_focused = True
+window_hidden = False
+
+def present_frame():
+    # Shows the frame the scene drew in the window
+    if texture_backend is not None:
+        texture_backend.present()
+    elif frame is screen:
+        pygame.display.flip()
+    else:
+        frame.present(screen)
+
+assets.owner = "title_screen"
 current_scene = SCENES["title_screen"]()
+streamer.prefetch(current_scene.default_next_scene)
 
 running = True
+# Whether the current scene has not been drawn yet, so the loop must not sleep before drawing it
+scene_changed = True
 while running:
-    ########## initialize the time and create the variable for it #########
-    dt = clock.tick(60) / 1000.0
-    events = pygame.event.get()
+    in_background = window_hidden or not window_focused
+    paused = in_background and background_mode == "pause"
+
+    ########## wait for input in scenes where nothing moves on its own, otherwise run at 60 FPS #########
+    idle_timeout = current_scene.get_idle_timeout()
+    frame_started = None
+    if paused:
+        # Sleep until something happens to the window, the time spent paused is dropped below
+        events = [pygame.event.wait()] + pygame.event.get()
+        dt = 0.0
+    elif idle_timeout is not None and not scene_changed:
+        event = pygame.event.wait(idle_timeout)
+        events = [] if event.type == pygame.NOEVENT else [event]
+        events += pygame.event.get()
+        dt = clock.tick() / 1000.0
+    elif in_background and background_mode == "low_fps":
+        dt = clock.tick(background_fps) / 1000.0
+        events = pygame.event.get()
+    else:
+        dt = clock.tick(60) / 1000.0
+        events = pygame.event.get()
+        # Only frames that run at full speed are measured for the quality tiers
+        frame_started = time.perf_counter()
+    scene_changed = False
     keys = pygame.key.get_pressed()
+    # Whether part of the window was uncovered and has to be drawn again
+    exposed = False
 
     ######## check for the event "quit" and exit out if needed #########
     for event in events:
-        if event.type == pygame.QUIT:
+        if event.type in (pygame.QUIT, pygame.WINDOWCLOSE):
             running = False
+        elif event.type == pygame.WINDOWFOCUSLOST:
+            window_focused = False
+        elif event.type == pygame.WINDOWFOCUSGAINED:
+            window_focused = True
+        elif event.type in (pygame.WINDOWMINIMIZED, pygame.WINDOWHIDDEN):
+            window_hidden = True
+        elif event.type in (pygame.WINDOWRESTORED, pygame.WINDOWSHOWN):
+            window_hidden = False
+        elif event.type == pygame.WINDOWEXPOSED:
+            exposed = True
+        elif event.type == pygame.KEYDOWN and event.key == pygame.K_F9:
+            # Dump what the asset and text caches and the surface pool are holding
+            print(assets.format_report())
+            print(text_cache.format_report())
+            print(surface_pool.format_report())
+            print(quality.format_report())
+            if texture_backend is not None:
+                print(texture_backend.frame.format_report())
+        elif event.type == pygame.KEYDOWN and event.key == pygame.K_F11:
+            # Switch between a window and full screen, and remember the choice in the save that is being played
+            if texture_backend is not None:
+                switched = texture_backend.toggle_fullscreen()
+            else:
+                switched = toggle_fullscreen()
+            if switched:
+                fullscreen = not fullscreen
+                # Only the setting is written, the progress made in the scene is saved when the scene saves it
+                disk_save = load_save()
+                disk_save["settings"]["fullscreen"] = fullscreen
+                save_data(disk_save)
+                # The scene's copy too, so its next save does not switch the setting back
+                current_scene.save["settings"]["fullscreen"] = fullscreen
+                if isinstance(frame, DirtyRectSurface):
+                    frame.invalidate()
+
+    ######## coming back from the background #########
+    if in_background and window_focused and not window_hidden:
+        # Restart the frame clock so the time spent in the background does not land in one big step
+        clock.tick()
+        if isinstance(frame, DirtyRectSurface):
+            frame.invalidate()
+    elif paused:
+        if exposed:
+            # Draw the paused scene again without updating it, the window may have lost what was there
+            if isinstance(frame, DirtyRectSurface):
+                frame.invalidate()
+            current_scene.render(frame)
+            present_frame()
+        continue
+
+    drawing = not (in_background and background_mode == "no_render")
 
     current_scene.process_input(events)
     current_scene.update(dt)
-    current_scene.render(screen)
+    if drawing:
+        current_scene.render(frame)
 
     if current_scene.next_scene != current_scene:
+        assets.owner = current_scene.next_scene
         current_scene = SCENES[current_scene.next_scene]()
+        streamer.prefetch(current_scene.default_next_scene)
+        scene_changed = True
+        if isinstance(frame, DirtyRectSurface):
+            frame.invalidate()
 
-    pygame.display.flip()
+    if drawing:
+        # The time spent updating and drawing, not presenting, which can wait for the monitor with vsync
+        if frame_started is not None:
+            quality.record((time.perf_counter() - frame_started) * 1000)
+        present_frame()
 
+streamer.shutdown()
+if texture_backend is not None:
+    texture_backend.close()
 pygame.quit()
\ No newline at end of file
@@ -0,0 +1,123 @@
+from collections import deque
+
+# Quality tiers, from cheapest to best. Each tier drops some of the drawing the one above it does:
+# QUALITY_MEDIUM skips decorations, like the playground's background crowd and the collision debug overlay, and
+# draws translucent overlays, like the hint bar, see-through panels and the teacher's vision, with one surface alpha
+# instead of per-pixel alpha.
+# QUALITY_LOW also renders new text without antialiasing.
+QUALITY_LOW = 0
+QUALITY_MEDIUM = 1
+QUALITY_HIGH = 2
+
+# The "quality" setting, "auto" lets the controller pick the tier
+QUALITY_LEVELS = {"low": QUALITY_LOW, "medium": QUALITY_MEDIUM, "high": QUALITY_HIGH}
+
+# The time one frame may take at 60 FPS
+FRAME_BUDGET_MS = 1000 / 60
+
+# How many frames the average work time is taken over
+SAMPLE_FRAMES = 60
+
+# The tier goes down when the average frame takes more than this share of the budget, and back up when it takes
+# less than RAISE_FRACTION for RAISE_FRAMES frames in a row, so it does not flip back and forth at the edge
+LOWER_FRACTION = 0.9
+RAISE_FRACTION = 0.5
+RAISE_FRAMES = 180
+
+class QualityController:
+    """Watches how long frames take to process and draw, and moves through the quality tiers to keep the game
+    inside its frame budget. Scenes ask it what to draw through antialias, alpha_overlays and decorations.
+    """
+
+    def __init__(self, level = QUALITY_HIGH, adaptive = True, budget_ms = FRAME_BUDGET_MS):
+        """Default constructor.
+
+        Parameters:
+            level (int): The tier to start at, like QUALITY_HIGH. Defaults to QUALITY_HIGH.
+            adaptive (bool): Whether record() may change the tier. Defaults to True.
+            budget_ms (float): The time one frame may take, in milliseconds. Defaults to FRAME_BUDGET_MS.
+        """
+        self.level = level
+        self.adaptive = adaptive
+        self.budget_ms = budget_ms
+        # Work time of the last frames in milliseconds, and their sum
+        self.samples = deque(maxlen = SAMPLE_FRAMES)
+        self.total_ms = 0.0
+        # How many frames in a row had enough headroom to raise the tier
+        self.headroom_frames = 0
+        self.changes = 0
+
+    @property
+    def antialias(self):
+        """Whether text is rendered with smooth edges.
+        """
+        return self.level > QUALITY_LOW
+
+    @property
+    def alpha_overlays(self):
+        """Whether translucent overlays use per-pixel alpha, otherwise they use a colorkey and one surface alpha.
+        """
+        return self.level >= QUALITY_HIGH
+
+    @property
+    def decorations(self):
+        """Whether things that are only there for looks, and debug overlays, are drawn.
+        """
+        return self.level >= QUALITY_HIGH
+
+    def set_level(self, level):
+        """Switches to a tier and starts measuring it from scratch.
+
+        Parameters:
+            level (int): The tier, like QUALITY_MEDIUM.
+        """
+        if level != self.level:
+            self.level = level
+            self.changes += 1
+        self.samples.clear()
+        self.total_ms = 0.0
+        self.headroom_frames = 0
+
+    def record(self, work_ms):
+        """Adds the time one frame took, and lowers or raises the tier when the average calls for it.
+
+        Parameters:
+            work_ms (float): The time the frame took without waiting for the frame clock, like Clock.get_rawtime().
+
+        Returns:
+            bool: Whether the tier changed.
+        """
+        if not self.adaptive:
+            return False
+        if len(self.samples) == self.samples.maxlen:
+            self.total_ms -= self.samples[0]
+        self.samples.append(work_ms)
+        self.total_ms += work_ms
+        # Judge a tier only once a whole window of its own frames is in
+        if len(self.samples) < self.samples.maxlen:
+            return False
+
+        average_ms = self.total_ms / len(self.samples)
+        if average_ms > self.budget_ms * LOWER_FRACTION and self.level > QUALITY_LOW:
+            self.set_level(self.level - 1)
+            return True
+        if average_ms < self.budget_ms * RAISE_FRACTION and self.level < QUALITY_HIGH:
+            self.headroom_frames += 1
+            if self.headroom_frames >= RAISE_FRAMES:
+                self.set_level(self.level + 1)
+                return True
+        else:
+            self.headroom_frames = 0
+        return False
+
+    def format_report(self):
+        """Returns the tier and frame times as text for the debug dump.
+        """
+        names = {level: name for name, level in QUALITY_LEVELS.items()}
+        average_ms = self.total_ms / len(self.samples) if self.samples else 0
+        mode = "auto" if self.adaptive else "fixed"
+        return (f"Quality: {names[self.level]} ({mode}), {average_ms:.1f} ms average frame, "
+                f"{self.changes} tier changes")
+
+# One controller for the whole game, main.py feeds it frame times and scenes read it
+quality = QualityController()
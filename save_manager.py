@@ -17,12 +17,121 @@ DEFAULT_DATA = {
     "has_costco_membership": False,
     "settings": {
         "fullscreen": False,
+        "vsync": True,
         "audio": 100,
+        "asset_memory_mb": 128,
+        "dirty_rects": False,
+        "renderer": "surface",
+        "quality": "auto",
+        "background_mode": "low_fps",
+        "background_fps": 5,
     }
 }
 
+class SaveModel(dict):
+    """The save data, as a dictionary that tells subscribers whenever a value in it changes. Scenes use it exactly
+    like the plain dictionary it replaces, and the HUD and save_data() use the change events to skip work when
+    nothing changed.
+
+    Changes are named by their key, with nested keys joined by dots, like "money" or "candy.woozers". Subscribing
+    to a key also gets the changes below it, so "candy" gets "candy.woozers". Dictionaries stored in the model are
+    copied into nested models, so keep using them through the model after storing them.
+    """
+
+    def __init__(self, data = None, prefix = "", root = None):
+        """Default constructor.
+
+        Parameters:
+            data (dict): The save data to wrap. Defaults to None.
+            prefix (string): The dotted key of a nested model plus a dot, "" for the top level. Defaults to "".
+            root (SaveModel): The top level model, which keeps the subscribers. Defaults to None for a top level model.
+        """
+        super().__init__()
+        self.prefix = prefix
+        self.root = root if root is not None else self
+        if root is None:
+            # key -> callbacks, None gets every change
+            self.subscribers = {}
+            # Whether anything changed since the data was last loaded or written, and where it was
+            self.changed = False
+            self.saved_to = None
+        for key, value in (data or {}).items():
+            dict.__setitem__(self, key, self._wrap(key, value))
+
+    def _wrap(self, key, value):
+        # Nested dictionaries become models too, so changes inside them are published with their dotted key
+        if isinstance(value, dict):
+            return SaveModel(value, f"{self.prefix}{key}.", self.root)
+        return value
+
+    def subscribe(self, key, callback):
+        """Calls callback(key, old, new) whenever the value at key, or anything below it, changes.
+
+        Parameters:
+            key (string): A dotted key like "money" or "candy.woozers", or None for every change.
+            callback (function): The function to call. Missing values are passed as None.
+
+        Returns:
+            function: The callback, for unsubscribe().
+        """
+        self.root.subscribers.setdefault(key, []).append(callback)
+        return callback
+
+    def unsubscribe(self, key, callback):
+        """Stops calling a callback added with subscribe().
+        """
+        callbacks = self.root.subscribers.get(key, [])
+        if callback in callbacks:
+            callbacks.remove(callback)
+
+    def _publish(self, key, old, new):
+        root = self.root
+        root.changed = True
+        for subscribed_key, callbacks in list(root.subscribers.items()):
+            if subscribed_key is None or key == subscribed_key or key.startswith(subscribed_key + "."):
+                for callback in list(callbacks):
+                    callback(key, old, new)
+
+    def __setitem__(self, key, value):
+        old = self.get(key)
+        if key in self and old == value:
+            return
+        dict.__setitem__(self, key, self._wrap(key, value))
+        self._publish(f"{self.prefix}{key}", old, value)
+
+    def __delitem__(self, key):
+        old = self[key]
+        dict.__delitem__(self, key)
+        self._publish(f"{self.prefix}{key}", old, None)
+
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def setdefault(self, key, default = None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def pop(self, key, *default):
+        if key not in self:
+            if default:
+                return default[0]
+            raise KeyError(key)
+        value = self[key]
+        del self[key]
+        return value
+
+    def popitem(self):
+        key = next(reversed(self))
+        return key, self.pop(key)
+
+    def clear(self):
+        for key in list(self):
+            del self[key]
+
 def load_save(save_file = None):
-    """Load game data from JSON. If not found, create default."""
+    """Load game data from JSON into a SaveModel. If not found, create default."""
     #chooses a different save file####
     global SAVE_PATH
     if save_file is not None:
@@ -30,13 +139,23 @@ def load_save(save_file = None):
         
     if not os.path.exists(SAVE_PATH):
         save_data(DEFAULT_DATA)  #creates a new save file
-        return DEFAULT_DATA.copy()
+        data = DEFAULT_DATA
+    else:
+        with open(SAVE_PATH, "r") as f:
+            data = json.load(f)
 
-    with open(SAVE_PATH, "r") as f:
-        data = json.load(f)
-    return data
+    # The model copies every nested dictionary, so changing it never changes DEFAULT_DATA
+    model = SaveModel(data)
+    model.saved_to = SAVE_PATH
+    return model
 
 def save_data(data):
-    """Write the data dictionary to the JSON file."""
+    """Write the data dictionary to the JSON file. A SaveModel that has not changed since it was loaded from or
+    written to the same file is not written again."""
+    if isinstance(data, SaveModel):
+        if not data.changed and data.saved_to == SAVE_PATH:
+            return
+        data.changed = False
+        data.saved_to = SAVE_PATH
     with open(SAVE_PATH, "w") as f:
         json.dump(data, f, indent=4)
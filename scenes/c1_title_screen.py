@@ -1,14 +1,21 @@
 import pygame
 from .scene_template import Scene
-from .ui_button import Button
+from window import LOGICAL_SIZE
+from texture_renderer import draw_rect
+from .ui_button import Button, ButtonIndex
+from .font_registry import get_font
+from .text_cache import text_cache
+from .surface_pool import surface_pool
 
 class title_screen(Scene):
     def __init__(self):
         super().__init__(None, "brother_a_transition", "title_bg.png")
+        ##### nothing moves here, only redraw on input
+        self.idle_capable = True
 
         ##### fonts ######
-        self.title_font = pygame.font.Font(None, 120)
-        self.button_font = pygame.font.Font(None, 60)
+        self.title_font = get_font(120)
+        self.button_font = get_font(60)
 
         #### buttons
         self.buttons = []
@@ -29,7 +36,7 @@ class title_screen(Scene):
         ]
 
     def make_buttons(self):
-        screen_w, screen_h = 900, 600
+        screen_w, screen_h = LOGICAL_SIZE
         cx = screen_w // 2
 
         self.play_btn = Button("PLAY", (cx, 280), self.button_font, (255,255,255), (255,200,0))
@@ -38,6 +45,7 @@ class title_screen(Scene):
         self.quit_btn = Button("QUIT", (cx, 520), self.button_font, (255,255,255), (255,100,100))
 
         self.buttons = [self.play_btn, self.load_btn, self.instructions_btn, self.quit_btn]
+        self.button_index = ButtonIndex(self.buttons)
 
     def process_input(self, events):
         super().process_input(events)
@@ -58,34 +66,33 @@ class title_screen(Scene):
                     quit()
 
             ### button clicks ###
-            for btn in self.buttons:
-                if btn.clicked(mouse_pos, e):
-                    if btn == self.play_btn:
-                        # reset save to default values for new game
-                        from save_manager import DEFAULT_DATA, save_data
-                        save_data(DEFAULT_DATA.copy())
-                        self.switch_to("brother_a_transition")
-                    elif btn == self.load_btn:
-                        self.switch_to("load_save")  # you'll create this scene
-                    elif btn == self.instructions_btn:
-                        self.switch_to("instructions")
-                    elif btn == self.quit_btn:
-                        pygame.quit()
-                        quit()
+            btn = self.button_index.clicked(mouse_pos, e)
+            if btn == self.play_btn:
+                # reset save to default values for new game
+                from save_manager import DEFAULT_DATA, save_data
+                save_data(DEFAULT_DATA.copy())
+                self.switch_to("brother_a_transition")
+            elif btn == self.load_btn:
+                self.switch_to("load_save")  # you'll create this scene
+            elif btn == self.instructions_btn:
+                self.switch_to("instructions")
+            elif btn == self.quit_btn:
+                pygame.quit()
+                quit()
 
     def update(self, dt):
         super().update(dt)
         mouse_pos = pygame.mouse.get_pos()
 
+        ##### only the buttons whose hover look changes are touched
         if not self.show_instructions:
-            for btn in self.buttons:
-                btn.update(mouse_pos)
+            self.button_index.update(mouse_pos)
 
     def render(self, screen):
         super().render(screen, tool_tips=False)
 
         # ######### TITLE ######
-        title_surf = self.title_font.render("SUGAR RUSH", True, (255, 215, 0))
+        title_surf = text_cache.render(self.title_font, "SUGAR RUSH", True, (255, 215, 0))
         rect = title_surf.get_rect(center=(screen.get_width() // 2, 150))
         screen.blit(title_surf, rect)
 
@@ -102,21 +109,18 @@ class title_screen(Scene):
         w, h = screen.get_size()
 
         ##### dim background
-        overlay = pygame.Surface((w, h))
-        overlay.set_alpha(180)
-        overlay.fill((0, 0, 0))
-        screen.blit(overlay, (0, 0))
+        screen.blit(surface_pool.get((w, h), alpha=180, fill=(0, 0, 0)), (0, 0))
 
         #### popup
         box_w, box_h = 600, 400
         box_rect = pygame.Rect((w-box_w)//2, (h-box_h)//2, box_w, box_h)
 
-        pygame.draw.rect(screen, (50, 50, 50), box_rect)
-        pygame.draw.rect(screen, (200, 200, 200), box_rect, 4)
+        draw_rect(screen, (50, 50, 50), box_rect)
+        draw_rect(screen, (200, 200, 200), box_rect, 4)
 
         ###### Text lines #####
         y = box_rect.y + 40
         for line in self.instruction_text:
-            surf = self.font.render(line, True, (255, 255, 255))
+            surf = text_cache.render(self.font, line, True, (255, 255, 255))
             screen.blit(surf, (box_rect.x + 40, y))
             y += 40
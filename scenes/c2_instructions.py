@@ -1,24 +1,22 @@
 import pygame
 from .scene_template import Scene
+from dirty_rects import mark_dirty
+from texture_renderer import draw_rect
 from .ui_button import Button
+from .font_registry import get_font
+from .text_cache import text_cache
 
 class instructions_screen(Scene):
     def __init__(self):
-        super().__init__(None, "title_screen")
-        
-        # background
-        try:
-            self.background = pygame.image.load("assets/backgrounds/title_bg.png").convert()
-        except:
-            self.background = None
-        
-        self.bg_scaled = None
+        super().__init__(None, "title_screen", "title_bg.png")
+        # only scrolls and hovers on input, so no need to redraw every frame
+        self.idle_capable = True
         
         # fonts
-        self.title_font = pygame.font.Font(None, 80)
-        self.section_font = pygame.font.Font(None, 50)
-        self.text_font = pygame.font.Font(None, 32)
-        self.small_font = pygame.font.Font(None, 28)
+        self.title_font = get_font(80)
+        self.section_font = get_font(50)
+        self.text_font = get_font(32)
+        self.small_font = get_font(28)
         
         # scroll position
         self.scroll_y = 0
@@ -36,6 +34,9 @@ class instructions_screen(Scene):
         self.line_height = 35
         self.section_spacing = 50
         
+        # every section is rendered once up front, scrolling just picks the slice in view
+        self.section_surfaces = self._render_sections()
+        
     def _build_instructions(self):
         """Build the instruction text structure"""
         sections = []
@@ -289,129 +290,131 @@ class instructions_screen(Scene):
         mouse_pos = pygame.mouse.get_pos()
         self.back_btn.update(mouse_pos)
         
-        # calculate max scroll based on content height
-        # shis will be recalculated in render with actual screen size
+        # max scroll depends on the screen size, so it is calculated in render
         self.scroll_y = max(0, self.scroll_y)
     
-    def _calculate_content_height(self):
-        """Calculate total height of all content"""
-        height = 100  # sop padding
-        for section in self.instruction_sections:
-            if section["type"] == "title":
-                height += 60
-            elif section["type"] == "section":
-                height += 50  # section title
-                if "content" in section:
-                    height += len(section["content"]) * self.line_height
-                if "subsections" in section:
-                    for subsection in section["subsections"]:
-                        height += 40  # subsection title
-                        height += len(subsection["content"]) * self.line_height
-            height += self.section_spacing
-        return height
-    
-    def render(self, screen):
-        super().render(screen, tool_tips=False)
-        
-        # scale background if needed
-        if self.background:
-            if self.bg_scaled is None:
-                self.bg_scaled = pygame.transform.scale(self.background, screen.get_size())
-            screen.blit(self.bg_scaled, (0, 0))
-        else:
-            # pastel background color if no image
-            screen.fill((255, 240, 245))  # Light pink pastel
-        
-        # draing main content box with rounded corners effect
-        screen_w, screen_h = screen.get_size()
-        box_x = (screen_w - self.content_width) // 2
-        box_y = 100
-        box_h = screen_h - 200
-        
-        # calculate max scroll based on actual content  
-        total_height = self._calculate_content_height()
-        self.max_scroll = max(0, total_height - box_h + 40)
-        self.scroll_y = max(0, min(self.scroll_y, self.max_scroll))
-        
-        # drawing shadows; GenAI helped us with this #
-        shadow_rect = pygame.Rect(box_x + 5, box_y + 5, self.content_width, box_h)
-        pygame.draw.rect(screen, (200, 200, 200, 100), shadow_rect, border_radius=15)
-        
-        # draw a main popup box
-        main_rect = pygame.Rect(box_x, box_y, self.content_width, box_h)
-        pygame.draw.rect(screen, (255, 250, 220), main_rect, border_radius=15)
-        pygame.draw.rect(screen, (200, 180, 150), main_rect, width=3, border_radius=15)
-        
-        # creating a surface for scrollable content
-        content_surface = pygame.Surface((self.content_width - 20, self._calculate_content_height()))
-        content_surface.fill((255, 250, 220))  # matching the background
-        
-        # drawing the content on scrollable surface
-        y_offset = 20 - self.scroll_y
-        
+    def _render_sections(self):
+        """Lays out every section and renders it once into its own surface, so scrolling only blits the sections in view.
+
+        Returns:
+            list: A (top, surface) pair per section, top being where the section starts in the scrolled content.
+        """
+        width = self.content_width - 20
+        sections = []
+        top = 20  # top padding
         for section in self.instruction_sections:
+            # where each line of the section goes, relative to the section
+            lines = []
+            y_offset = 0
             if section["type"] == "title":
-                title_surf = self.title_font.render(section["text"], True, (139, 69, 19)) 
-                content_surface.blit(title_surf, (self.content_padding, y_offset))
+                lines.append((text_cache.render(self.title_font, section["text"], True, (139, 69, 19)), (self.content_padding, y_offset)))
                 y_offset += 60
             
             elif section["type"] == "section":
                 # section title
-                section_surf = self.section_font.render(section["title"], True, (255, 100, 150))  
-                content_surface.blit(section_surf, (self.content_padding, y_offset))
+                lines.append((text_cache.render(self.section_font, section["title"], True, (255, 100, 150)), (self.content_padding, y_offset)))
                 y_offset += 50
                 
                 # section content
                 if "content" in section:
                     for line in section["content"]:
                         if line:  # skip empty lines
-                            text_surf = self.text_font.render(line, True, (50, 50, 50))  # Dark gray
-                            content_surface.blit(text_surf, (self.content_padding + 20, y_offset))
+                            lines.append((text_cache.render(self.text_font, line, True, (50, 50, 50)), (self.content_padding + 20, y_offset)))  # Dark gray
                         y_offset += self.line_height
                 
                 # subsections
                 if "subsections" in section:
                     for subsection in section["subsections"]:
                         # subsection title
-                        sub_title_surf = self.small_font.render(subsection["title"], True, (100, 150, 255))  # Light blue
-                        content_surface.blit(sub_title_surf, (self.content_padding + 20, y_offset))
+                        lines.append((text_cache.render(self.small_font, subsection["title"], True, (100, 150, 255)), (self.content_padding + 20, y_offset)))  # Light blue
                         y_offset += 40
                         
                         # subsection content
                         for line in subsection["content"]:
                             if line:  # skip empty lines
-                                text_surf = self.text_font.render(line, True, (50, 50, 50))
-                                content_surface.blit(text_surf, (self.content_padding + 40, y_offset))
+                                lines.append((text_cache.render(self.text_font, line, True, (50, 50, 50)), (self.content_padding + 40, y_offset)))
                             y_offset += self.line_height
                 
                 y_offset += self.section_spacing
+
+            section_surface = pygame.Surface((width, y_offset))
+            section_surface.fill((255, 250, 220))  # matching the background
+            section_surface.blits(lines, doreturn=False)
+            sections.append((top, section_surface))
+            top += y_offset
+        return sections
+
+    def _calculate_content_height(self):
+        """Calculate total height of all content"""
+        top, surface = self.section_surfaces[-1]
+        return top + surface.get_height() + 20  # bottom padding
+
+    def _get_content_box(self, screen_size):
+        """Returns the rect of the content box for the screen size"""
+        screen_w, screen_h = screen_size
+        return pygame.Rect((screen_w - self.content_width) // 2, 100, self.content_width, screen_h - 200)
+
+    def draw_static(self, layer):
+        box_rect = self._get_content_box(layer.get_size())
+        
+        # drawing shadows; GenAI helped us with this #
+        shadow_rect = box_rect.move(5, 5)
+        pygame.draw.rect(layer, (200, 200, 200, 100), shadow_rect, border_radius=15)
         
-        # clip and blit scrollable content with scroll offset
-        viewport_rect = pygame.Rect(0, self.scroll_y, self.content_width - 20, box_h - 40)
-        screen.blit(content_surface, (box_x + 10, box_y + 20), viewport_rect)
+        # draw a main popup box
+        pygame.draw.rect(layer, (255, 250, 220), box_rect, border_radius=15)
+        pygame.draw.rect(layer, (200, 180, 150), box_rect, width=3, border_radius=15)
+        
+        # scroll hint
+        if self._calculate_content_height() > box_rect.height - 40:
+            hint_text = "Scroll with mouse wheel"
+            hint_surf = text_cache.render(self.small_font, hint_text, True, (100, 100, 100))
+            hint_rect = hint_surf.get_rect(center=(layer.get_width() // 2, layer.get_height() - 30))
+            layer.blit(hint_surf, hint_rect)
+    
+    def render(self, screen):
+        # the background, the content box and the scroll hint are on the static layer
+        super().render(screen, tool_tips=False)
+        
+        box_rect = self._get_content_box(screen.get_size())
+        box_x, box_y = box_rect.topleft
+        box_h = box_rect.height
+        
+        # calculate max scroll based on actual content  
+        total_height = self._calculate_content_height()
+        view_rect = pygame.Rect(box_x + 10, box_y + 20, self.content_width - 20, box_h - 40)
+        self.max_scroll = max(0, total_height - view_rect.height)
+        self.scroll_y = max(0, min(self.scroll_y, self.max_scroll))
+        
+        # only blit the slices of the sections that are in view
+        view_bottom = self.scroll_y + view_rect.height
+        visible = []
+        for top, surface in self.section_surfaces:
+            bottom = top + surface.get_height()
+            if bottom <= self.scroll_y or top >= view_bottom:
+                continue
+            visible_top = max(top, self.scroll_y)
+            visible_bottom = min(bottom, view_bottom)
+            area = pygame.Rect(0, visible_top - top, surface.get_width(), visible_bottom - visible_top)
+            visible.append((surface, (view_rect.x, view_rect.y + visible_top - self.scroll_y), area))
+        screen.blits(visible, doreturn=False)
         
         # draw scroll indicator if needed
         if self.max_scroll > 0:
             scroll_bar_height = box_h - 40
             scroll_bar_y = box_y + 20
-            scroll_thumb_height = max(20, int(scroll_bar_height * (scroll_bar_height / (self._calculate_content_height() + 20))))
+            scroll_thumb_height = max(20, int(scroll_bar_height * (scroll_bar_height / total_height)))
             scroll_thumb_y = scroll_bar_y + int((self.scroll_y / self.max_scroll) * (scroll_bar_height - scroll_thumb_height))
             
             # scroll bar background
             bar_rect = pygame.Rect(box_x + self.content_width - 25, scroll_bar_y, 10, scroll_bar_height)
-            pygame.draw.rect(screen, (220, 220, 220), bar_rect, border_radius=5)
+            draw_rect(screen, (220, 220, 220), bar_rect, border_radius=5)
             
             # scroll thumb
             thumb_rect = pygame.Rect(box_x + self.content_width - 25, scroll_thumb_y, 10, scroll_thumb_height)
-            pygame.draw.rect(screen, (150, 150, 150), thumb_rect, border_radius=5)
+            # the thumb moves while scrolling, so dirty rect mode has to be told about it
+            mark_dirty(screen, draw_rect(screen, (150, 150, 150), thumb_rect, border_radius=5))
         
         # draw back button
         self.back_btn.draw(screen)
-        
-        # scroll hint
-        if self.max_scroll > 0:
-            hint_text = "Scroll with mouse wheel"
-            hint_surf = self.small_font.render(hint_text, True, (100, 100, 100))
-            hint_rect = hint_surf.get_rect(center=(screen_w // 2, screen_h - 30))
-            screen.blit(hint_surf, hint_rect)
 
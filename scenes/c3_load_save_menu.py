@@ -1,8 +1,11 @@
 import pygame
 import os
 from .scene_template import Scene
-from .ui_button import Button
+from .ui_button import Button, ButtonIndex
+from .font_registry import get_font
+from .text_cache import text_cache
 from save_manager import load_save, save_data, DEFAULT_DATA
+from window import LOGICAL_SIZE
 
 # this was pretty complicated so we used AI a good portion for this
 
@@ -11,14 +14,17 @@ SAVE_DIR = "saves/"
 class load_save_menu(Scene):
     def __init__(self):
         super().__init__(None, "title_screen", "title_bg.png") 
+        self.idle_capable = True # static menu, only redraws on input
 
-        self.title_font = pygame.font.Font(None, 80)
-        self.button_font = pygame.font.Font(None, 50)
-        self.small_font = pygame.font.Font(None, 30) # using small_font from base scene class
+        self.title_font = get_font(80)
+        self.button_font = get_font(50)
+        self.small_font = get_font(30) # using small_font from base scene class
 
         self.buttons = []
         self.save_files = self.get_save_files()
         self.make_buttons()
+        # finds the button under the mouse without checking every save file's button
+        self.button_index = ButtonIndex(self.buttons)
         
         self.destination_scene = "brother_a_transition" 
 
@@ -32,49 +38,49 @@ class load_save_menu(Scene):
                 return
 
             # button Clicks
-            for btn in self.buttons:
-                if btn.clicked(mouse_pos, e):
+            btn = self.button_index.clicked(mouse_pos, e)
+            if btn is None:
+                continue
                     
-                    if btn == self.back_btn:
-                        self.switch_to("title_screen")
-                        
-                    elif btn == self.new_game_btn:
-                        #sse load save to set the global save path in save_manager.py
-                        print(f"Creating/Resetting New Game: {btn.filename}")
-                        load_save(btn.filename)
-                        
-                        # save the default data to the file path
-                        save_data(DEFAULT_DATA.copy())
-                        
-                        #switch to the game start scene
-                        self.switch_to(self.destination_scene)
-
-                    elif hasattr(btn, 'filename'):
-                        #this is an existing save file button
-                        print(f"Loading save file: {btn.filename}")
-                        
-                        #load the selected save file
-                        load_save(btn.filename) 
-                        
-                        #switch to the game start scene
-                        self.switch_to(self.destination_scene)
+            if btn == self.back_btn:
+                self.switch_to("title_screen")
+                
+            elif btn == self.new_game_btn:
+                #sse load save to set the global save path in save_manager.py
+                print(f"Creating/Resetting New Game: {btn.filename}")
+                load_save(btn.filename)
+                
+                # save the default data to the file path
+                save_data(DEFAULT_DATA.copy())
+                
+                #switch to the game start scene
+                self.switch_to(self.destination_scene)
+
+            elif hasattr(btn, 'filename'):
+                #this is an existing save file button
+                print(f"Loading save file: {btn.filename}")
+                
+                #load the selected save file
+                load_save(btn.filename) 
+                
+                #switch to the game start scene
+                self.switch_to(self.destination_scene)
 
 
     def update(self, dt):
-        # only update the buttons for hover effects
+        # only update the buttons for hover effects, the index only touches the ones that change
         mouse_pos = pygame.mouse.get_pos()
-        for btn in self.buttons:
-            btn.update(mouse_pos)
+        self.button_index.update(mouse_pos)
 
     def render(self, screen):
         super().render(screen, tool_tips=False)
 
         # title text
-        title_surf = self.title_font.render("SUGAR RUSH - LOAD GAME", True, (255, 215, 0))
+        title_surf = text_cache.render(self.title_font, "SUGAR RUSH - LOAD GAME", True, (255, 215, 0))
         rect = title_surf.get_rect(center=(screen.get_width() // 2, 80))
         
         # simple drop shadow for visibility
-        screen.blit(self.title_font.render("SUGAR RUSH - LOAD GAME", True, (0, 0, 0)), (rect.x + 4, rect.y + 4))
+        screen.blit(text_cache.render(self.title_font, "SUGAR RUSH - LOAD GAME", True, (0, 0, 0)), (rect.x + 4, rect.y + 4))
         screen.blit(title_surf, rect)
 
         # draw buttons
@@ -107,7 +113,7 @@ class load_save_menu(Scene):
 
     def make_buttons(self):
         """Creates buttons for each existing save file, plus 'New Game' and 'Back'."""
-        screen_w, screen_h = 1280, 720 # reference screen size for positioning
+        screen_w, screen_h = LOGICAL_SIZE # reference screen size for positioning
         cx = screen_w // 2
         
         # start vertical position for the first button 
@@ -1,11 +1,16 @@
 import pygame
 from .scene_template import Scene
+from dirty_rects import untracked
+from .font_registry import get_font
+from .text_cache import text_cache
 
 class brother_a_transition(Scene):
     def __init__(self):
         ##### shows transition for about 3 seconds then goes to classroom
         super().__init__(3.0, "classroom")
-        self.large_font = pygame.font.Font(None, 72)
+        ##### static text, only needs to wake up for skipping or when the 3 seconds are up
+        self.idle_capable = True
+        self.large_font = get_font(72)
         
     def process_input(self, events):
         super().process_input(events)
@@ -20,16 +25,17 @@ class brother_a_transition(Scene):
         super().render(screen, tool_tips=False)
         
         ##### dark transition background ######
-        screen.fill((0, 0, 0))
+        with untracked(screen):
+            screen.fill((0, 0, 0))
         
         ##### transition message to Andrew ####
         message_text = "You are now playing as Brother Andrew"
-        message_surface = self.large_font.render(message_text, True, (255, 255, 255))
+        message_surface = text_cache.render(self.large_font, message_text, True, (255, 255, 255))
         message_rect = message_surface.get_rect(center=(screen.get_width() // 2, screen.get_height() // 2))
         screen.blit(message_surface, message_rect)
         
         ##### skips the hint ####
         skip_text = "Press SPACE to continue"
-        skip_surface = self.font.render(skip_text, True, (200, 200, 200))
+        skip_surface = text_cache.render(self.font, skip_text, True, (200, 200, 200))
         skip_rect = skip_surface.get_rect(center=(screen.get_width() // 2, screen.get_height() // 2 + 80))
         screen.blit(skip_surface, skip_rect)
@@ -1,11 +1,25 @@
 import pygame
+import json
+import math
 from .scene_template import Scene
+from .font_registry import get_font
+from .text_cache import text_cache
+
+#the credits, what each line says and in which style
+CREDITS_PATH = "assets/credits.json"
+#space above the first and below the last line of the credits strip
+CREDITS_PADDING = 50
 
 class ending(Scene):
     def __init__(self):
         super().__init__(None, "title_screen")  #no auto transition player should  read credits
+        self.idle_capable = True
         self.scroll_offset = 0
         self.scroll_speed = 30 
+        #credits are rendered once into a strip that is only scrolled afterwards
+        self.credits_strip = self._build_credits_strip()
+        #known once the screen size is, in render
+        self.credits_end = None
 
     def process_input(self, events):
         super().process_input(events)
@@ -19,69 +33,73 @@ class ending(Scene):
     def update(self, dt):
         super().update(dt)
         
-        #auto scroll credits
+        #auto scroll credits, they stop once they are past the end
         self.scroll_offset += self.scroll_speed * dt
+        if self.credits_end is not None:
+            self.scroll_offset = min(self.scroll_offset, self.credits_end)
+
+    def get_idle_timeout(self):
+        #credits scroll on their own until they are past the end, only the return hint stays after that
+        if self.credits_end is None or self.scroll_offset < self.credits_end:
+            return None
+        return super().get_idle_timeout()
+
+    def _build_credits_strip(self):
+        """Renders the credits from CREDITS_PATH once into one tall strip, which render() only has to blit.
+
+        Returns:
+            Surface: The credits strip, with line i centered CREDITS_PADDING + i * line_spacing from its top.
+        """
+        with open(CREDITS_PATH, "r") as f:
+            credits = json.load(f)
+        spacing = credits["line_spacing"]
+        styles = credits["styles"]
         
-        #if scrolled past end, allow transition
-        if self.scroll_offset > 2000:  
-            pass  
+        #renders every line in its style, empty lines just leave a gap
+        rendered = []
+        for line in credits["lines"]:
+            style = styles[line.get("style", "text")]
+            rendered.append(text_cache.render(get_font(style["size"]), line["text"], True, style["color"]))
+        
+        #even width so the strip is centered the same way each line was
+        width = max(surface.get_width() for surface in rendered)
+        width += width % 2
+        height = CREDITS_PADDING * 2 + (len(rendered) - 1) * spacing
+        strip = pygame.Surface((width, height))
+        strip.fill((0, 0, 0))
+        strip.blits([(surface, surface.get_rect(center=(width // 2, CREDITS_PADDING + i * spacing))) for i, surface in enumerate(rendered)], doreturn=False)
+        return strip
+
+    def _blit_strip(self, screen, y):
+        #blits only the rows of the strip that are on screen
+        strip = self.credits_strip
+        top = max(0, -y)
+        bottom = min(strip.get_height(), screen.get_height() - y)
+        if bottom > top:
+            x = (screen.get_width() - strip.get_width()) // 2
+            screen.blit(strip, (x, y + top), pygame.Rect(0, top, strip.get_width(), bottom - top))
 
     def render(self, screen):
         super().render(screen, tool_tips=False)
         
-        #dark background
-        screen.fill((0, 0, 0))
-        
-        #credits text; you can customize this part ##
-        credits = [
-            "GAME COMPLETED!",
-            "",
-            "You successfully bought the PS5!",
-            "",
-            "CREDITS",
-            "",
-            "Aires",
-            "Ateeb",
-            "Dnyanesh",
-            "Yashas",
-            "",
-            "Special Thanks:",
-            "Professor Spears",
-            "",
-            "",
-            "Press ESC or SPACE to return to title screen",
-        ]
+        #offset at which the whole strip has scrolled off the top
+        self.credits_end = screen.get_height() + self.credits_strip.get_height() - CREDITS_PADDING
         
-        #draw credits with scrolling
-        y_start = screen.get_height() - int(self.scroll_offset)
-        title_font = pygame.font.Font(None, 60)
-        large_font = pygame.font.Font(None, 48)
+        #draw credits with scrolling; the first line starts at the bottom of the screen
+        strip_y = screen.get_height() - self.scroll_offset - CREDITS_PADDING
         
-        for i, credit_line in enumerate(credits):
-            y_pos = y_start + (i * 50)
-            
-            #skkips if off screen
-            if y_pos < -50 or y_pos > screen.get_height() + 50:
-                continue
-            
-            #choosess font based on line
-            if i == 0:  # if game is completed
-                font = title_font
-                color = (255, 255, 0)
-            elif i == 4:  #credit scence
-                font = large_font
-                color = (255, 215, 0)
-            else:
-                font = self.font
-                color = (255, 255, 255)
-            
-            text_surface = font.render(credit_line, True, color)
-            text_rect = text_surface.get_rect(center=(screen.get_width() // 2, y_pos))
-            screen.blit(text_surface, text_rect)
+        #smooth sub-pixel scrolling: the strip at the pixel above, then blended into the pixel below by the fraction
+        y = math.floor(strip_y)
+        fraction = strip_y - y
+        self.credits_strip.set_alpha(None)
+        self._blit_strip(screen, y)
+        if fraction > 0:
+            self.credits_strip.set_alpha(round(fraction * 255))
+            self._blit_strip(screen, y + 1)
         
         #draws instruction at bottom
-        if self.scroll_offset > 1500:
+        if self.scroll_offset > self.credits_end - 20:
             inst_text = "Press ESC or SPACE to return to title screen"
-            inst_surface = self.font.render(inst_text, True, (200, 200, 200))
+            inst_surface = text_cache.render(self.font, inst_text, True, (200, 200, 200))
             inst_rect = inst_surface.get_rect(center=(screen.get_width() // 2, screen.get_height() - 50))
             screen.blit(inst_surface, inst_rect)
@@ -0,0 +1,29 @@
+import pygame
+
+# Every font the game uses, keyed by (face, size, bold, italic). Loading a font reads and parses the font file,
+# so each one is only loaded the first time a scene asks for it and shared from then on.
+_fonts = {}
+
+def get_font(size, face = None, bold = False, italic = False):
+    """Returns the shared font for a face, size and style, loading it the first time.
+
+    The returned font is shared by every scene, so don't change its style with set_bold() and similar; ask for
+    a font with that style instead.
+
+    Parameters:
+        size (int): The font size.
+        face (string): The path of a font file, None for pygame's default font. Defaults to None.
+        bold (bool): Whether the font is bold. Defaults to False.
+        italic (bool): Whether the font is italic. Defaults to False.
+
+    Returns:
+        Font: The font.
+    """
+    key = (face, size, bold, italic)
+    font = _fonts.get(key)
+    if font is None:
+        font = pygame.font.Font(face, size)
+        font.set_bold(bold)
+        font.set_italic(italic)
+        _fonts[key] = font
+    return font
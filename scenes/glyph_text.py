@@ -0,0 +1,116 @@
+import re
+import pygame
+from quality import quality
+
+# Digits are single glyphs, everything between them (labels, separators, units) is one piece
+PIECE_PATTERN = re.compile(r"\d|\D+")
+# How many recent strings keep their layout, enough for every readout on screen at once
+LAYOUT_CACHE_SIZE = 16
+
+class GlyphAtlas:
+    """The digits and labels of one font in one color, each rendered once. Text that changes every frame, like
+    timers and counters, is drawn by blitting the cached pieces side by side instead of rasterizing the whole
+    string, so "Time: 02:59" is the "Time: " label, four digit glyphs and the ":" between them.
+
+    Labels keep the font's own spacing because they are rendered in one piece. Digits are placed by their
+    advance width, which can put a long number a pixel or two off from where font.render() would.
+    """
+
+    def __init__(self, font, color, antialias = True):
+        """Default constructor.
+
+        Parameters:
+            font (Font): The font to render the glyphs with.
+            color ((int, int, int)): The text color.
+            antialias (bool): Whether the glyphs get smooth edges. Defaults to True.
+        """
+        self.font = font
+        self.color = color
+        self.antialias = antialias
+        # piece -> (surface, advance)
+        self.pieces = {}
+        # text -> ([(surface, x offset)], width, height) of the strings drawn most recently
+        self.layouts = {}
+
+    def get_piece(self, piece):
+        """Returns the cached (surface, advance) of a digit or label, rendering it the first time it is used.
+        """
+        cached = self.pieces.get(piece)
+        if cached is None:
+            surface = self.font.render(piece, self.antialias, self.color)
+            cached = (surface, self.font.size(piece)[0])
+            self.pieces[piece] = cached
+        return cached
+
+    def _layout(self, text, anchor):
+        # The pieces of text with their offsets, and the rect they cover once placed by anchor
+        layout = self.layouts.get(text)
+        if layout is None:
+            if len(self.layouts) >= LAYOUT_CACHE_SIZE:
+                self.layouts.clear()
+            placed = []
+            width = 0
+            height = 0
+            for piece in PIECE_PATTERN.findall(text):
+                surface, advance = self.get_piece(piece)
+                placed.append((surface, width))
+                width += advance
+                height = max(height, surface.get_height())
+            layout = (placed, width, height)
+            self.layouts[text] = layout
+
+        placed, width, height = layout
+        rect = pygame.Rect(0, 0, width, height)
+        for name, value in anchor.items():
+            setattr(rect, name, value)
+        return placed, rect
+
+    def get_rect(self, text, **anchor):
+        """Returns the rect text would take up without drawing it, placed like Surface.get_rect(), for example
+        get_rect(text, center=(x, y)).
+        """
+        return self._layout(text, anchor)[1]
+
+    def draw(self, target, text, **anchor):
+        """Draws text onto target with one blits() call.
+
+        Parameters:
+            target (Surface): The surface to draw onto, usually the screen.
+            text (string): The text to draw.
+            **anchor: Where to put the text, like for Surface.get_rect(). Defaults to the top left corner.
+
+        Returns:
+            Rect: The area the text was drawn to.
+        """
+        placed, rect = self._layout(text, anchor)
+        x, y = rect.topleft
+        target.blits([(surface, (x + offset, y)) for surface, offset in placed], doreturn = False)
+        return rect
+
+# Atlases shared by every scene, keyed by (font, color, antialias)
+_atlases = {}
+
+def get_atlas(font, color, antialias = True):
+    """Returns the shared glyph atlas for a font and color, creating it the first time.
+
+    Parameters:
+        font (Font): The font to render with.
+        color ((int, int, int)): The text color.
+        antialias (bool): Whether the glyphs get smooth edges, which the lowest quality tier turns off. Defaults
+            to True.
+
+    Returns:
+        GlyphAtlas: The atlas.
+    """
+    antialias = antialias and quality.antialias
+    key = (font, tuple(color), antialias)
+    atlas = _atlases.get(key)
+    if atlas is None:
+        atlas = GlyphAtlas(font, tuple(color), antialias)
+        _atlases[key] = atlas
+    return atlas
+
+def draw_text(target, font, text, color, antialias = True, **anchor):
+    """Shortcut for get_atlas(font, color, antialias).draw(target, text, **anchor).
+    """
+    return get_atlas(font, color, antialias).draw(target, text, **anchor)
@@ -0,0 +1,59 @@
+# Sprites used to be blitted one by one in whatever order the scene's loops happened to visit them, so a character
+# standing lower on the screen could be drawn behind one standing above it. Scenes now submit their sprites to a
+# queue, which draws them back to front with one Surface.blits() call per layer.
+
+# Layers, drawn in this order. Characters are sorted by depth within their layer, the other layers keep the order
+# things were submitted in unless a depth is given.
+LAYER_GROUND = 0
+LAYER_CHARACTERS = 1
+LAYER_OVERHEAD = 2
+
+class RenderQueue:
+    """Collects blits for one frame and draws them sorted by layer, then by depth.
+    """
+
+    def __init__(self):
+        """Default constructor.
+        """
+        # Lists of (depth, surface, rect) by layer
+        self.layers = {}
+
+    def submit(self, surface, rect, layer = LAYER_CHARACTERS, depth = None):
+        """Queues a blit.
+
+        Parameters:
+            surface (Surface): What to draw.
+            rect (Rect): Where to draw it.
+            layer (int): Which layer it goes on, like LAYER_CHARACTERS. Defaults to LAYER_CHARACTERS.
+            depth (float): What it is sorted by within the layer, bigger is nearer. Defaults to the bottom of rect,
+                where a character's feet are, on LAYER_CHARACTERS and to the order of submission on the other layers.
+        """
+        if depth is None:
+            # Equal depths keep the order they were submitted in, because the sort in flush() is stable
+            depth = rect.bottom if layer == LAYER_CHARACTERS else 0
+        entries = self.layers.get(layer)
+        if entries is None:
+            entries = self.layers[layer] = []
+        entries.append((depth, surface, rect))
+
+    def flush(self, target, camera = None):
+        """Draws everything queued onto target and empties the queue.
+
+        Parameters:
+            target (Surface): The surface to draw onto, usually the screen.
+            camera (Camera): For rects in world coordinates, the camera of the world. Blits it can't see are skipped
+                and the rest are moved to screen coordinates. Defaults to None for rects in screen coordinates.
+        """
+        for layer in sorted(self.layers):
+            entries = self.layers[layer]
+            # The sort is stable, so entries at the same depth keep the order they were submitted in
+            entries.sort(key = _depth)
+            if camera is None:
+                target.blits([(surface, rect) for depth, surface, rect in entries], doreturn = False)
+            else:
+                target.blits([(surface, camera.to_screen(rect)) for depth, surface, rect in entries
+                              if camera.is_visible(rect)], doreturn = False)
+        self.layers.clear()
+
+def _depth(entry):
+    return entry[0]
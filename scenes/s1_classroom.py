@@ -1,6 +1,14 @@
 import pygame
 import random
 from .scene_template import Scene
+from asset_manager import assets
+from dirty_rects import mark_dirty
+from quality import quality
+from texture_renderer import draw_circle, draw_rect
+from .font_registry import get_font
+from .text_cache import text_cache
+from .glyph_text import draw_text
+from .render_queue import LAYER_OVERHEAD
 
 class classroom(Scene):
     def __init__(self):
@@ -9,7 +17,7 @@ class classroom(Scene):
         super().__init__(120, "playground", "classroom.png", "Andrew", initial_pos)
         
         # Font for help text
-        self.small_font = pygame.font.Font(None, 28)
+        self.small_font = get_font(28)
         
         # Initialize collision boxes
         self.collision_boxes = [
@@ -47,29 +55,25 @@ class classroom(Scene):
         # Load sprites with proper aspect ratio scaling
         # Get original sprite dimensions to maintain aspect ratio
         
-        andrew_original = pygame.image.load("assets/andrew.png").convert_alpha()
-        andrew_width, andrew_height = andrew_original.get_size()
+        andrew_width, andrew_height = assets.get_size("assets/andrew.png")
         # Scale to 60 pixels tall, maintain aspect ratio
         andrew_scale = 60 / andrew_height
-        self.andrew_sprite = pygame.transform.scale(andrew_original, (int(andrew_width * andrew_scale) / 60 * 110 , 110))
+        self.andrew_sprite = assets.get_image("assets/andrew.png", (int(andrew_width * andrew_scale) / 60 * 110 , 110))
         
-        teacher_original = pygame.image.load("assets/teacher.png").convert_alpha()
-        teacher_width, teacher_height = teacher_original.get_size()
+        teacher_width, teacher_height = assets.get_size("assets/teacher.png")
         # Scale to 70 pixels tall, maintain aspect ratio
         teacher_scale = 70 / teacher_height
-        self.teacher_sprite = pygame.transform.scale(teacher_original, (int(teacher_width * teacher_scale) / 70 * 120, 120))
+        self.teacher_sprite = assets.get_image("assets/teacher.png", (int(teacher_width * teacher_scale) / 70 * 120, 120))
         
-        guy_npc_original = pygame.image.load("assets/guy_npc.png").convert_alpha()
-        guy_width, guy_height = guy_npc_original.get_size()
+        guy_width, guy_height = assets.get_size("assets/guy_npc.png")
         # Scale to 45 pixels tall, maintain aspect ratio
         guy_scale = 45 / guy_height
-        self.guy_npc_sprite = pygame.transform.scale(guy_npc_original, (int(guy_width * guy_scale) / 45 * 80, 80))
+        self.guy_npc_sprite = assets.get_image("assets/guy_npc.png", (int(guy_width * guy_scale) / 45 * 80, 80))
         
-        girl_npc_original = pygame.image.load("assets/girl_npc.png").convert_alpha()
-        girl_width, girl_height = girl_npc_original.get_size()
+        girl_width, girl_height = assets.get_size("assets/girl_npc.png")
         # Scale to 45 pixels tall, maintain aspect ratio
         girl_scale = 45 / girl_height
-        self.girl_npc_sprite = pygame.transform.scale(girl_npc_original, (int(girl_width * girl_scale)/45 * 80, 80))
+        self.girl_npc_sprite = assets.get_image("assets/girl_npc.png", (int(girl_width * girl_scale)/45 * 80, 80))
         
         
         # NPC positions next to desks (not on them) and interaction radius
@@ -91,6 +95,8 @@ class classroom(Scene):
         
         # Teacher's vision circle - smaller and zig-zag pattern
         self.vision_radius = 100  # Smaller radius
+        # The vision circle is drawn once for each way of drawing translucent overlays
+        self.vision_surfaces = {}
         self.vision_x = 300  # Starting position
         self.vision_y = 300  # Starting Y position
         self.vision_speed_x = 70  # Pixels per second (faster)
@@ -183,10 +189,12 @@ class classroom(Scene):
             super().move(dt)
 
     def render(self, screen):
-        super().render(screen, "Classroom")
-        
-        self.draw_characters(screen)
-        self.draw_teacher_vision(screen)
+        if not self.draw_frozen_world(screen):
+            super().render(screen, "Classroom")
+            
+            self.draw_characters(screen)
+            self.draw_teacher_vision(screen)
+            self.freeze_world(screen)
         self.draw_negotiation(screen)
         self.draw_naughty_corner(screen)
         self.draw_inventory(screen)
@@ -261,57 +269,80 @@ class classroom(Scene):
                 self.timer += 30
 
     def draw_characters(self, screen):
+        queue = self.render_queue
+
         # Draw player (Andrew)
         andrew_rect = self.andrew_sprite.get_rect(center=self.player_pos)
-        screen.blit(self.andrew_sprite, andrew_rect)
+        queue.submit(self.andrew_sprite, andrew_rect)
         
         # Draw NPCs next to desks
         for npc in self.npcs:
             npc_rect = npc["sprite"].get_rect(center=npc["pos"])
-            screen.blit(npc["sprite"], npc_rect)
+            queue.submit(npc["sprite"], npc_rect)
             
             # Draw interaction indicator if close enough and not talked to
             if not npc["talked"] and not self.in_negotiation:
                 distance = (self.player_pos - npc["pos"]).length()
                 if distance < self.interaction_radius:
                     # Draw "Press E" hint
-                    hint_text = self.font.render("Press E to talk", True, (255, 255, 0))
+                    hint_text = text_cache.render(self.font, "Press E to talk", True, (255, 255, 0))
                     hint_rect = hint_text.get_rect(center=(npc["pos"].x, npc["pos"].y - 30))
-                    screen.blit(hint_text, hint_rect)
-        
+                    queue.submit(hint_text, hint_rect, LAYER_OVERHEAD)
+
         # Draw teacher at main desk
         teacher_rect = self.teacher_sprite.get_rect(center=self.teacher_pos)
-        screen.blit(self.teacher_sprite, teacher_rect)
-        
+        queue.submit(self.teacher_sprite, teacher_rect)
+
+        queue.flush(screen)
+
     def draw_teacher_vision(self, screen):
         # Draw teacher's vision circle (semi-transparent red) in a zig-zag pattern
-        vision_surface = pygame.Surface((self.vision_radius * 2, self.vision_radius * 2), pygame.SRCALPHA)
-        pygame.draw.circle(vision_surface, (255, 0, 0, 100), (self.vision_radius, self.vision_radius), self.vision_radius)
+        vision_surface = self.get_vision_surface()
         vision_rect = vision_surface.get_rect(center=(self.vision_x, self.vision_y))
         screen.blit(vision_surface, vision_rect)
         
-        # Draw vision circle outline
-        pygame.draw.circle(screen, (255, 0, 0), (int(self.vision_x), int(self.vision_y)), self.vision_radius, 3)
+        # Draw vision circle outline, reported to dirty rect mode since it can reach a pixel past the blit above
+        mark_dirty(screen, draw_circle(screen, (255, 0, 0), (int(self.vision_x), int(self.vision_y)), self.vision_radius, 3))
+
+    def get_vision_surface(self):
+        # Returns the filled vision circle, drawn the first time it is needed at the current quality tier
+        alpha_overlays = quality.alpha_overlays
+        vision_surface = self.vision_surfaces.get(alpha_overlays)
+        if vision_surface is None:
+            vision_size = (self.vision_radius * 2, self.vision_radius * 2)
+            center = (self.vision_radius, self.vision_radius)
+            if alpha_overlays:
+                vision_surface = pygame.Surface(vision_size, pygame.SRCALPHA)
+                pygame.draw.circle(vision_surface, (255, 0, 0, 100), center, self.vision_radius)
+            else:
+                # Same look with a colorkey and one surface alpha, run-length encoded so the blit skips the corners
+                # instead of testing every pixel against the colorkey
+                vision_surface = pygame.Surface(vision_size)
+                pygame.draw.circle(vision_surface, (255, 0, 0), center, self.vision_radius)
+                vision_surface.set_colorkey((0, 0, 0), pygame.RLEACCEL)
+                vision_surface.set_alpha(100, pygame.RLEACCEL)
+            self.vision_surfaces[alpha_overlays] = vision_surface
+        return vision_surface
+
+    def get_modal_dim(self):
+        # The negotiation is drawn over the dimmed classroom
+        if self.in_negotiation:
+            return 150
+        return super().get_modal_dim()
 
     def draw_negotiation(self, screen):
         # Draw negotiation mini-game UI
         if self.in_negotiation:
-            # Dim background
-            overlay = pygame.Surface(screen.get_size())
-            overlay.set_alpha(150)
-            overlay.fill((0, 0, 0))
-            screen.blit(overlay, (0, 0))
-            
             # Negotiation box
             box_w, box_h = 500, 300
             box_x = (screen.get_width() - box_w) // 2
             box_y = (screen.get_height() - box_h) // 2
             box_rect = pygame.Rect(box_x, box_y, box_w, box_h)
-            pygame.draw.rect(screen, (50, 50, 50), box_rect)
-            pygame.draw.rect(screen, (255, 255, 255), box_rect, 3)
+            draw_rect(screen, (50, 50, 50), box_rect)
+            draw_rect(screen, (255, 255, 255), box_rect, 3)
             
             # Instructions
-            inst_text = self.font.render("Press the arrow keys in sequence!", True, (255, 255, 255))
+            inst_text = text_cache.render(self.font, "Press the arrow keys in sequence!", True, (255, 255, 255))
             inst_rect = inst_text.get_rect(center=(box_x + box_w // 2, box_y + 50))
             screen.blit(inst_text, inst_rect)
             
@@ -329,29 +360,25 @@ class classroom(Scene):
                     }
                     seq_text += "[" + key_name.get(key, "?") + "] "
             
-            seq_surface = self.font.render(seq_text, True, (255, 255, 0))
+            seq_surface = text_cache.render(self.font, seq_text, True, (255, 255, 0))
             seq_rect = seq_surface.get_rect(center=(box_x + box_w // 2, box_y + 120))
             screen.blit(seq_surface, seq_rect)
             
             # Additional instruction text
             help_text = "Press the arrow keys in the order shown above"
-            help_surface = self.small_font.render(help_text, True, (200, 200, 200))
+            help_surface = text_cache.render(self.small_font, help_text, True, (200, 200, 200))
             help_rect = help_surface.get_rect(center=(box_x + box_w // 2, box_y + 150))
             screen.blit(help_surface, help_rect)
             
             # Timer
             time_left = self.negotiation_duration - self.negotiation_timer
-            timer_text = self.font.render(f"Time: {time_left:.1f}s", True, (255, 255, 255))
-            timer_rect = timer_text.get_rect(center=(box_x + box_w // 2, box_y + 180))
-            screen.blit(timer_text, timer_rect)
+            draw_text(screen, self.font, f"Time: {time_left:.1f}s", (255, 255, 255), center=(box_x + box_w // 2, box_y + 180))
             
     def draw_naughty_corner(self, screen):
         if self.in_naughty_corner:
-            warning_text = self.font.render("NAUGHTY CORNER! Wait...", True, (255, 0, 0))
+            warning_text = text_cache.render(self.font, "NAUGHTY CORNER! Wait...", True, (255, 0, 0))
             warning_rect = warning_text.get_rect(center=(screen.get_width() // 2, 100))
             screen.blit(warning_text, warning_rect)
             
             time_left = self.naughty_corner_duration - self.naughty_corner_timer
-            timer_text = self.font.render(f"Time remaining: {time_left:.1f}s", True, (255, 255, 0))
-            timer_rect = timer_text.get_rect(center=(screen.get_width() // 2, 140))
-            screen.blit(timer_text, timer_rect)
\ No newline at end of file
+            draw_text(screen, self.font, f"Time remaining: {time_left:.1f}s", (255, 255, 0), center=(screen.get_width() // 2, 140))
\ No newline at end of file
@@ -1,6 +1,14 @@
 import pygame
 import random
 from .scene_template import Scene
+from asset_manager import assets
+from dirty_rects import mark_dirty
+from quality import quality
+from texture_renderer import draw_circle, draw_rect
+from .font_registry import get_font
+from .text_cache import text_cache
+from .surface_pool import surface_pool
+from .render_queue import LAYER_OVERHEAD
 
 class playground(Scene):
     def __init__(self):
@@ -9,66 +17,39 @@ class playground(Scene):
         super().__init__(120, "hallway", "playground.png", "Andrew", initial_pos)  # 11am-1pm = 120 seconds
         
         # Fonts
-        self.small_font = pygame.font.Font(None, 28)
-        self.tiny_font = pygame.font.Font(None, 24)
+        self.small_font = get_font(28)
+        self.tiny_font = get_font(24)
         
-        # Collision boxes (playground boundaries - fence at top, blue bar at bottom)
-        self.collision_boxes = [
-            # Left fence/wall
-            pygame.Rect(0, 0, 10, 720),
-            # Right fence/wall
-            pygame.Rect(1270, 0, 10, 720),
-            # Top fence (keep players below fence)
-            pygame.Rect(0, 0, 1280, 260),
-            
-            
-            # Bottom blue bar (keep players above blue bar)
-            pygame.Rect(0, 630, 1280, 70),
-            
-            ####playground toys######
-            
-            #jungle
-            #swing
-            #trunk
-            #playplace
-            pygame.Rect(40,250, 180, 80), 
-            pygame.Rect(270, 250, 220, 80), 
-            pygame.Rect(570, 250, 120, 70), 
-            pygame.Rect(800, 250, 380, 75)
-            
-        
-        ]
+        # The playground, the lawn to the right of it and their collision boxes (fences, blue bar at the bottom,
+        # playground toys) come from assets/worlds/playground.json. The world is wider than the screen, so the camera
+        # follows Andrew
+        self.set_world("playground")
         
         # Load Sprites
         
         # Load Brother A
-        andrew_original = pygame.image.load("assets/andrew.png").convert_alpha()
-        andrew_width, andrew_height = andrew_original.get_size()
+        andrew_width, andrew_height = assets.get_size("assets/andrew.png")
         andrew_scale = 60 / andrew_height
-        self.andrew_sprite = pygame.transform.scale(andrew_original, (int(andrew_width * andrew_scale)/60 * 110, 110))
+        self.andrew_sprite = assets.get_image("assets/andrew.png", (int(andrew_width * andrew_scale)/60 * 110, 110))
         
         # Load big bully sprite
-        big_bully_original = pygame.image.load("assets/big_bully.png").convert_alpha()
-        bully_width, bully_height = big_bully_original.get_size()
+        bully_width, bully_height = assets.get_size("assets/big_bully.png")
         bully_scale = 50 / bully_height
-        self.big_bully_sprite = pygame.transform.scale(big_bully_original, (int(bully_width * bully_scale)/50 * 130, 130))
+        self.big_bully_sprite = assets.get_image("assets/big_bully.png", (int(bully_width * bully_scale)/50 * 130, 130))
         
         # Load small bully sprite
-        small_bully_original = pygame.image.load("assets/snall_bully.png").convert_alpha()
-        small_bully_width, small_bully_height = small_bully_original.get_size()
+        small_bully_width, small_bully_height = assets.get_size("assets/snall_bully.png")
         small_bully_scale = 40 / small_bully_height
-        self.small_bully_sprite = pygame.transform.scale(small_bully_original, (int(small_bully_width * small_bully_scale)/40 * 85, 85))
+        self.small_bully_sprite = assets.get_image("assets/snall_bully.png", (int(small_bully_width * small_bully_scale)/40 * 85, 85))
         
         # Load other student npcs
-        guy_npc_original = pygame.image.load("assets/guy_npc.png").convert_alpha()
-        guy_width, guy_height = guy_npc_original.get_size()
+        guy_width, guy_height = assets.get_size("assets/guy_npc.png")
         guy_scale = 45 / guy_height
-        self.guy_npc_sprite = pygame.transform.scale(guy_npc_original, (int(guy_width * guy_scale)/45 * 85, 85))
+        self.guy_npc_sprite = assets.get_image("assets/guy_npc.png", (int(guy_width * guy_scale)/45 * 85, 85))
         
-        girl_npc_original = pygame.image.load("assets/girl_npc.png").convert_alpha()
-        girl_width, girl_height = girl_npc_original.get_size()
+        girl_width, girl_height = assets.get_size("assets/girl_npc.png")
         girl_scale = 45 / girl_height
-        self.girl_npc_sprite = pygame.transform.scale(girl_npc_original, (int(girl_width * girl_scale)/45 * 85, 85))
+        self.girl_npc_sprite = assets.get_image("assets/girl_npc.png", (int(girl_width * girl_scale)/45 * 85, 85))
         
 
         # Get number of buyers from classroom negotiations (ensure it persists)
@@ -159,13 +140,16 @@ class playground(Scene):
         
         # Move player
         super().move(dt)
+        self.update_camera()
         
     def render(self, screen):
-        super().render(screen, "Lunch Break - Playground")
-        
-        self.draw_characters(screen)
-        self.draw_ui(screen)
-        self.draw_buyer_hints(screen)
+        if not self.draw_frozen_world(screen):
+            super().render(screen, "Lunch Break - Playground")
+            
+            self.draw_characters(screen)
+            self.draw_ui(screen)
+            self.draw_buyer_hints(screen)
+            self.freeze_world(screen)
         self.draw_clock(screen)
         self.draw_inventory(screen)
     
@@ -242,36 +226,44 @@ class playground(Scene):
                 bully["frozen_timer"] += dt
     
     def draw_characters(self, screen):
+        # Characters are queued and drawn back to front at the end, so whoever stands lower overlaps the others.
+        # Their rects are in world coordinates, the queue leaves out the ones off screen
+        queue = self.render_queue
+        camera = self.camera
+
         # Draw player (Andrew)
         andrew_rect = self.andrew_sprite.get_rect(center=self.player_pos)
-        screen.blit(self.andrew_sprite, andrew_rect)
+        queue.submit(self.andrew_sprite, andrew_rect)
 
-        # Draw random NPCs (non-buyers, just atmosphere)
-        for npc in self.random_npcs:
-            npc_sprite = self.girl_npc_sprite if npc["is_girl"] else self.guy_npc_sprite
-            npc_rect = npc_sprite.get_rect(center=npc["pos"])
-            screen.blit(npc_sprite, npc_rect)
+        # Draw random NPCs (non-buyers, just atmosphere), left out at lower quality tiers
+        if quality.decorations:
+            for npc in self.random_npcs:
+                npc_sprite = self.girl_npc_sprite if npc["is_girl"] else self.guy_npc_sprite
+                npc_rect = npc_sprite.get_rect(center=npc["pos"])
+                queue.submit(npc_sprite, npc_rect)
         
         # Draw buyers (highlighted if not sold) - mix of boy/girl
         for buyer in self.buyers:
             if not buyer["sold"]:
-                # Draw highlight circle
-                pygame.draw.circle(screen, (255, 255, 0), (int(buyer["pos"].x), int(buyer["pos"].y)), 30, 3)
+                # Draw highlight circle, reported to dirty rect mode since it goes away once the buyer is sold to
+                mark_dirty(screen, draw_circle(screen, (255, 255, 0), camera.to_screen_pos(buyer["pos"]), 30, 3))
                 # Draw buyer sprite (boy or girl)
                 buyer_sprite = self.girl_npc_sprite if buyer["is_girl"] else self.guy_npc_sprite
                 buyer_rect = buyer_sprite.get_rect(center=buyer["pos"])
-                screen.blit(buyer_sprite, buyer_rect)
+                queue.submit(buyer_sprite, buyer_rect)
         
         # Draw bullies (big and small)
         for bully in self.bullies:
             bully_sprite = self.big_bully_sprite if bully["is_big"] else self.small_bully_sprite
             bully_rect = bully_sprite.get_rect(center=bully["pos"])
-            screen.blit(bully_sprite, bully_rect)
+            queue.submit(bully_sprite, bully_rect)
             if bully["frozen"]:
                 # Draw frozen indicator
-                frozen_text = self.small_font.render("FROZEN", True, (0, 0, 255))
+                frozen_text = text_cache.render(self.small_font, "FROZEN", True, (0, 0, 255))
                 frozen_rect = frozen_text.get_rect(center=(bully["pos"].x, bully["pos"].y - 30))
-                screen.blit(frozen_text, frozen_rect)
+                queue.submit(frozen_text, frozen_rect, LAYER_OVERHEAD)
+
+        queue.flush(screen, camera)
     
     def draw_buyer_hints(self, screen):
         # Show nearby buyer hint
@@ -280,7 +272,7 @@ class playground(Scene):
                 distance = (self.player_pos - buyer["pos"]).length()
                 if distance < self.interaction_radius:
                     hint_text = "Press 1/2/3 to sell candy"
-                    hint_surface = self.font.render(hint_text, True, (255, 255, 0))
+                    hint_surface = text_cache.render(self.font, hint_text, True, (255, 255, 0))
                     hint_rect = hint_surface.get_rect(center=(screen.get_width() // 2, 100))
                     screen.blit(hint_surface, hint_rect)
                     break
@@ -291,26 +283,24 @@ class playground(Scene):
         """Draw the selling controls UI in a cleaner format"""
         # Create a semi-transparent background box
         ui_box = pygame.Rect(10, 50, 400, 120)
-        ui_surface = pygame.Surface((ui_box.width, ui_box.height), pygame.SRCALPHA)
-        ui_surface.fill((0, 0, 0, 150))
-        screen.blit(ui_surface, ui_box)
-        pygame.draw.rect(screen, (255, 255, 255), ui_box, 2)
+        screen.blit(surface_pool.get_translucent(ui_box.size, (0, 0, 0, 150)), ui_box)
+        draw_rect(screen, (255, 255, 255), ui_box, 2)
         
         y_offset = 60
         # Selling controls
         sell_text = "Sell: [1] Twizzles  [2] Skizzles  [3] Woozers"
-        sell_surface = self.tiny_font.render(sell_text, True, (255, 255, 255))
+        sell_surface = text_cache.render(self.tiny_font, sell_text, True, (255, 255, 255))
         screen.blit(sell_surface, (20, y_offset))
         
         y_offset += 25
         # Quantity controls
         qty_text = f"Quantity: {self.sell_quantity}  [+/-] to change"
-        qty_surface = self.tiny_font.render(qty_text, True, (255, 255, 255))
+        qty_surface = text_cache.render(self.tiny_font, qty_text, True, (255, 255, 255))
         screen.blit(qty_surface, (20, y_offset))
         
         y_offset += 25
         # Prices
         price_text = "Prices: $2  |  $9  |  $40"
-        price_surface = self.tiny_font.render(price_text, True, (200, 200, 200))
+        price_surface = text_cache.render(self.tiny_font, price_text, True, (200, 200, 200))
         screen.blit(price_surface, (20, y_offset))
     
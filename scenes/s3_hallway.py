@@ -1,5 +1,10 @@
 import pygame
 from .scene_template import Scene
+from asset_manager import assets
+from .font_registry import get_font
+from .text_cache import text_cache
+from .surface_pool import surface_pool
+from .ui_widgets import Label, Panel
 
 class hallway(Scene):
     def __init__(self):
@@ -8,8 +13,8 @@ class hallway(Scene):
         super().__init__(120, "brother_b_transition", "hallway.png", "Andrew", initial_pos)  # 1pm-3pm = 120 seconds
         
         # Fonts
-        self.small_font = pygame.font.Font(None, 28)
-        self.title_font = pygame.font.Font(None, 40)
+        self.small_font = get_font(28)
+        self.title_font = get_font(40)
 
         # Collision boxes (hallway boundaries and doors)
         self.collision_boxes = [
@@ -29,20 +34,17 @@ class hallway(Scene):
         ]
         
         # Load sprites
-        andrew_original = pygame.image.load("assets/andrew.png").convert_alpha()
-        andrew_width, andrew_height = andrew_original.get_size()
+        andrew_width, andrew_height = assets.get_size("assets/andrew.png")
         andrew_scale = 60 / andrew_height
-        self.andrew_sprite = pygame.transform.scale(andrew_original, (int(andrew_width * andrew_scale)/60 * 100, 100))
+        self.andrew_sprite = assets.get_image("assets/andrew.png", (int(andrew_width * andrew_scale)/60 * 100, 100))
         
-        hall_monitor_original = pygame.image.load("assets/hall_monitor.png").convert_alpha()
-        monitor_width, monitor_height = hall_monitor_original.get_size()
+        monitor_width, monitor_height = assets.get_size("assets/hall_monitor.png")
         monitor_scale = 60 / monitor_height
-        self.hall_monitor_sprite = pygame.transform.scale(hall_monitor_original, (int(monitor_width * monitor_scale)/60 * 100, 100))
+        self.hall_monitor_sprite = assets.get_image("assets/hall_monitor.png", (int(monitor_width * monitor_scale)/60 * 100, 100))
         
-        principal_son_original = pygame.image.load("assets/principals_son.png").convert_alpha()
-        son_width, son_height = principal_son_original.get_size()
+        son_width, son_height = assets.get_size("assets/principals_son.png")
         son_scale = 60 / son_height
-        self.principal_son_sprite = pygame.transform.scale(principal_son_original, (int(son_width * son_scale)/60 * 100, 100))
+        self.principal_son_sprite = assets.get_image("assets/principals_son.png", (int(son_width * son_scale)/60 * 100, 100))
         
         # Hall monitor position (blocks the way)
         self.hall_monitor_pos = pygame.math.Vector2(500, 360)
@@ -61,6 +63,8 @@ class hallway(Scene):
             "Candy Machine": {"price": 200, "purchased": False},
             "Bigger Backpack": {"price": 75, "purchased": False}
         }
+        # Store menu, built the first time it is opened
+        self.store_panel = None
     
     def process_input(self, events):
         super().process_input(events)
@@ -103,34 +107,46 @@ class hallway(Scene):
         if self.hall_monitor_paid and not self.barrier_removed:
             self.collision_boxes.pop()
             self.barrier_removed = True
+            # The barrier is part of the static layer
+            self.invalidate_static_layer()
         
         # Move player
         super().move(dt)
     
     def render(self, screen):
-        super().render(screen, "Hallway")
+        if not self.draw_frozen_world(screen):
+            super().render(screen, "Hallway")
 
-        self.draw_characters(screen)
-        self.draw_hall_monitor_interaction_hint(screen)
-        self.draw_store_interaction_hint(screen)
-        self.draw_barrier(screen)
+            self.draw_characters(screen)
+            self.draw_hall_monitor_interaction_hint(screen)
+            self.draw_store_interaction_hint(screen)
+            self.freeze_world(screen)
         self.draw_store_UI(screen)
         
         self.draw_clock(screen)
         self.draw_inventory(screen)
 
     def draw_characters(self, screen):
+        # Characters are queued and drawn back to front, so whoever stands lower overlaps the others
+        queue = self.render_queue
+
         # Draw player (Andrew)
         andrew_rect = self.andrew_sprite.get_rect(center=self.player_pos)
-        screen.blit(self.andrew_sprite, andrew_rect)
+        queue.submit(self.andrew_sprite, andrew_rect)
 
         # Draw hall monitor
         monitor_rect = self.hall_monitor_sprite.get_rect(center=self.hall_monitor_pos)
-        screen.blit(self.hall_monitor_sprite, monitor_rect)
+        queue.submit(self.hall_monitor_sprite, monitor_rect)
 
         # Draw principal's son (store)
         son_rect = self.principal_son_sprite.get_rect(center=self.store_pos)
-        screen.blit(self.principal_son_sprite, son_rect)
+        queue.submit(self.principal_son_sprite, son_rect)
+
+        queue.flush(screen)
+
+    def draw_static(self, layer):
+        # The barrier only changes when it is taken down, which composes the layer again
+        self.draw_barrier(layer)
 
     def draw_hall_monitor_interaction_hint(self, screen):
         # Draw interaction hint for hall monitor
@@ -138,18 +154,18 @@ class hallway(Scene):
             distance = (self.player_pos - self.hall_monitor_pos).length()
             if distance < self.interaction_radius:
                 hint_text = "Press E - Pay 1 candy to pass"
-                hint_surface = self.font.render(hint_text, True, (255, 255, 0))
+                hint_surface = text_cache.render(self.font, hint_text, True, (255, 255, 0))
                 hint_rect = hint_surface.get_rect(center=(self.hall_monitor_pos.x, self.hall_monitor_pos.y - 50))
                 screen.blit(hint_surface, hint_rect)
                 
                 # Show dialogue
                 dialogue = '"You gotta pay the candy toll, buddy."'
-                dialogue_surface = self.small_font.render(dialogue, True, (255, 255, 255))
+                dialogue_surface = text_cache.render(self.small_font, dialogue, True, (255, 255, 255))
                 dialogue_rect = dialogue_surface.get_rect(center=(self.hall_monitor_pos.x, self.hall_monitor_pos.y - 80))
                 screen.blit(dialogue_surface, dialogue_rect)
         else:
             # Hall monitor looks away
-            away_text = self.small_font.render("(Looking away)", True, (150, 150, 150))
+            away_text = text_cache.render(self.small_font, "(Looking away)", True, (150, 150, 150))
             away_rect = away_text.get_rect(center=(self.hall_monitor_pos.x, self.hall_monitor_pos.y - 50))
             screen.blit(away_text, away_rect)
 
@@ -159,7 +175,7 @@ class hallway(Scene):
             distance = (self.player_pos - self.store_pos).length()
             if distance < self.interaction_radius and not self.in_store:
                 hint_text = "Press E - Visit Store"
-                hint_surface = self.font.render(hint_text, True, (255, 255, 0))
+                hint_surface = text_cache.render(self.font, hint_text, True, (255, 255, 0))
                 hint_rect = hint_surface.get_rect(center=(self.store_pos.x, self.store_pos.y - 50))
                 screen.blit(hint_surface, hint_rect)
 
@@ -176,68 +192,75 @@ class hallway(Scene):
                 barrier_height
             )
             # Draw barrier with red color to indicate it's blocking
-            barrier_surface = pygame.Surface((barrier_width, barrier_height), pygame.SRCALPHA)
-            barrier_surface.fill((255, 0, 0, 150))  # Semi-transparent red
+            barrier_surface = surface_pool.get_translucent((barrier_width, barrier_height), (255, 0, 0, 150))  # Semi-transparent red
             screen.blit(barrier_surface, barrier_rect)
             pygame.draw.rect(screen, (255, 0, 0), barrier_rect, 3)
             
             # Draw "BLOCKED" text on barrier
-            blocked_text = self.font.render("BLOCKED - Pay toll to pass", True, (255, 255, 255))
+            blocked_text = text_cache.render(self.font, "BLOCKED - Pay toll to pass", True, (255, 255, 255))
             blocked_rect = blocked_text.get_rect(center=barrier_rect.center)
             screen.blit(blocked_text, blocked_rect)
 
+    def get_modal_dim(self):
+        # The store is drawn over the dimmed hallway
+        if self.in_store:
+            return 180
+        return super().get_modal_dim()
+
     def draw_store_UI(self, screen):
         # Draw store UI
         if self.in_store:
-            # Dim background
-            overlay = pygame.Surface(screen.get_size())
-            overlay.set_alpha(180)
-            overlay.fill((0, 0, 0))
-            screen.blit(overlay, (0, 0))
-            
-            # Store box
-            box_w, box_h = 600, 500
-            box_x = (screen.get_width() - box_w) // 2
-            box_y = (screen.get_height() - box_h) // 2
-            box_rect = pygame.Rect(box_x, box_y, box_w, box_h)
-            pygame.draw.rect(screen, (50, 50, 50), box_rect)
-            pygame.draw.rect(screen, (255, 255, 255), box_rect, 3)
-            
-            # Store title
-            title_text = self.title_font.render("Principal's Son's Store", True, (255, 215, 0))
-            title_rect = title_text.get_rect(center=(box_x + box_w // 2, box_y + 30))
-            screen.blit(title_text, title_rect)
-            
-            # Store items
-            y_offset = box_y + 80
-            item_num = 1
-            for item_name, item_data in self.store_items.items():
-                # Item name and price
+            # Store box, composed again only when an item is bought
+            if self.store_panel is None:
+                self.store_panel = self.build_store_panel(screen)
+            self.store_panel.draw(screen)
+
+    def build_store_panel(self, screen):
+        """Builds the store box as a retained panel bound to the store items.
+
+        Parameters:
+            screen (Surface): The screen, for centering the box.
+
+        Returns:
+            Panel: The store panel.
+        """
+        box_w, box_h = 600, 500
+        box_x = (screen.get_width() - box_w) // 2
+        box_y = (screen.get_height() - box_h) // 2
+
+        # Item descriptions
+        descriptions = {
+            "Bicycle": "Helps your brother use less time traveling",
+            "Costco Membership": "Bulk candy deals (PS5 can be bought here)",
+            "Candy Machine": "Generates 10 free candy/day",
+            "Bigger Backpack": "Carry more items"
+        }
+
+        # Store title
+        children = [Label(self.title_font, "Principal's Son's Store", (255, 215, 0), center=(box_w // 2, 30))]
+
+        # Store items
+        y_offset = 80
+        item_num = 1
+        for item_name, item_data in self.store_items.items():
+            # Item name and price, greyed out once purchased
+            def item_text(item_num = item_num, item_name = item_name, item_data = item_data):
                 purchased_text = " [PURCHASED]" if item_data["purchased"] else ""
-                item_text = f"{item_num}. {item_name} - ${item_data['price']}{purchased_text}"
-                item_color = (150, 150, 150) if item_data["purchased"] else (255, 255, 255)
-                item_surface = self.font.render(item_text, True, item_color)
-                screen.blit(item_surface, (box_x + 30, y_offset))
-                
-                # Item description
-                descriptions = {
-                    "Bicycle": "Helps your brother use less time traveling",
-                    "Costco Membership": "Bulk candy deals (PS5 can be bought here)",
-                    "Candy Machine": "Generates 10 free candy/day",
-                    "Bigger Backpack": "Carry more items"
-                }
-                desc_text = descriptions.get(item_name, "")
-                desc_surface = self.small_font.render(desc_text, True, (200, 200, 200))
-                screen.blit(desc_surface, (box_x + 50, y_offset + 30))
-                
-                y_offset += 80
-                item_num += 1
-            
-            # Instructions
-            inst_text = "Press 1-4 to buy, ESC to close"
-            inst_surface = self.small_font.render(inst_text, True, (255, 255, 0))
-            inst_rect = inst_surface.get_rect(center=(box_x + box_w // 2, box_y + box_h - 30))
-            screen.blit(inst_surface, inst_rect)
+                return f"{item_num}. {item_name} - ${item_data['price']}{purchased_text}"
+            def item_color(item_data = item_data):
+                return (150, 150, 150) if item_data["purchased"] else (255, 255, 255)
+            children.append(Label(self.font, item_text, item_color, topleft=(30, y_offset)))
+
+            # Item description
+            children.append(Label(self.small_font, descriptions.get(item_name, ""), (200, 200, 200), topleft=(50, y_offset + 30)))
+
+            y_offset += 80
+            item_num += 1
+
+        # Instructions
+        children.append(Label(self.small_font, "Press 1-4 to buy, ESC to close", (255, 255, 0), center=(box_w // 2, box_h - 30)))
+
+        return Panel(pygame.Rect(box_x, box_y, box_w, box_h), (50, 50, 50), (255, 255, 255), 3, children)
 
     def _pay_hall_monitor(self):
         """Pay the hall monitor with 1 piece of any candy"""
@@ -1,5 +1,10 @@
 import pygame
 from .scene_template import Scene
+from asset_manager import assets
+from texture_renderer import draw_rect
+from .font_registry import get_font
+from .text_cache import text_cache
+from .glyph_text import draw_text
 
 class street(Scene):
     def __init__(self):
@@ -12,8 +17,8 @@ class street(Scene):
             self.default_next_scene = "costco"
 
         # Fonts
-        self.small_font = pygame.font.Font(None, 28)
-        self.large_font = pygame.font.Font(None, 48)
+        self.small_font = get_font(28)
+        self.large_font = get_font(48)
 
         # Collision boxes
         self.collision_boxes = [
@@ -24,10 +29,9 @@ class street(Scene):
         ]
         
         # Load Mark's sprite
-        mark_original = pygame.image.load("assets/mark.png").convert_alpha()
-        mark_width, mark_height = mark_original.get_size()
+        mark_width, mark_height = assets.get_size("assets/mark.png")
         mark_scale = 60 / mark_height
-        self.mark_sprite = pygame.transform.scale(mark_original, (int(mark_width * mark_scale), 60))
+        self.mark_sprite = assets.get_image("assets/mark.png", (int(mark_width * mark_scale), 60))
         
         # Rhythm walking mini-game state
         self.in_rhythm_game = True  # Start in rhythm game
@@ -119,7 +123,9 @@ class street(Scene):
                     self.timer += 30
     
     def render(self, screen):
-        super().render(screen, "Road")
+        if not self.draw_frozen_world(screen):
+            super().render(screen, "Road")
+            self.freeze_world(screen)
 
         self.draw_rhythm_game_UI(screen)
         self.draw_clock(screen)
@@ -191,8 +197,6 @@ class street(Scene):
 
     def draw_rhythm_game_UI(self, screen):
         if self.in_rhythm_game:
-            self.dim_background(screen)
-            
             # Dimesions of the game box
             boxw, boxh = 600, 400
             boxx = (screen.get_width() - boxw) // 2
@@ -209,39 +213,42 @@ class street(Scene):
             self.draw_mark_moving(screen)            
             self.draw_completion_message(screen)
         
-    def dim_background(self, screen):
-        # Dim background
-            overlay = pygame.Surface(screen.get_size())
-            overlay.set_alpha(150)
-            overlay.fill((0, 0, 0))
-            screen.blit(overlay, (0, 0))
+    def get_modal_dim(self):
+        # The rhythm game is drawn over the dimmed road
+        if self.in_rhythm_game:
+            return 150
+        return super().get_modal_dim()
+
+    def is_world_paused(self):
+        # Andrew can't walk during the rhythm game, so the road behind it stays the same
+        return self.in_rhythm_game
 
     def draw_game_box(self, screen, box_x, box_y, box_w, box_h):
         # Rhythm game box
             box_rect = pygame.Rect(box_x, box_y, box_w, box_h)
-            pygame.draw.rect(screen, (30, 30, 30), box_rect)
-            pygame.draw.rect(screen, (255, 255, 255), box_rect, 4)
+            draw_rect(screen, (30, 30, 30), box_rect)
+            draw_rect(screen, (255, 255, 255), box_rect, 4)
 
     def draw_game_title(self, screen, box_x, box_y, box_w, box_h):
         # Title
             title_text = "RHYTHM WALKING"
             if self.save.get("has_bicycle", False):
                 title_text = "RHYTHM BIKING"
-            title_surface = self.large_font.render(title_text, True, (255, 255, 0))
+            title_surface = text_cache.render(self.large_font, title_text, True, (255, 255, 0))
             title_rect = title_surface.get_rect(center=(box_x + box_w // 2, box_y + 50))
             screen.blit(title_surface, title_rect)
     
     def draw_game_instructions(self, screen, box_x, box_y, box_w, box_h):
         # Instructions
             inst_text = "Alternate LEFT and RIGHT arrow keys"
-            inst_surface = self.font.render(inst_text, True, (255, 255, 255))
+            inst_surface = text_cache.render(self.font, inst_text, True, (255, 255, 255))
             inst_rect = inst_surface.get_rect(center=(box_x + box_w // 2, box_y + 120))
             screen.blit(inst_surface, inst_rect)
 
     def draw_game_progress(self, screen, box_x, box_y, box_w, box_h):
         # Progress
             progress_text = f"Steps: {self.rhythm_steps_completed} / {self.rhythm_target_steps}"
-            progress_surface = self.large_font.render(progress_text, True, (0, 255, 0))
+            progress_surface = text_cache.render(self.large_font, progress_text, True, (0, 255, 0))
             progress_rect = progress_surface.get_rect(center=(box_x + box_w // 2, box_y + 200))
             screen.blit(progress_surface, progress_rect)
 
@@ -250,9 +257,7 @@ class street(Scene):
             if self.rhythm_countdown_active and not self.rhythm_can_press:
                 # Show countdown
                 countdown_text = f"Wait... {self.rhythm_countdown_duration - self.rhythm_countdown_timer:.1f}s"
-                countdown_surface = self.font.render(countdown_text, True, (200, 200, 200))
-                countdown_rect = countdown_surface.get_rect(center=(box_x + box_w // 2, box_y + 260))
-                screen.blit(countdown_surface, countdown_rect)
+                draw_text(screen, self.font, countdown_text, (200, 200, 200), center=(box_x + box_w // 2, box_y + 260))
             elif self.rhythm_can_press:
                 # Show press window
                 if not self.rhythm_waiting_for_key:
@@ -261,19 +266,17 @@ class street(Scene):
                 else:
                     hint_text = "NOW! Press LEFT or RIGHT!"
                     
-                hint_surface = self.large_font.render(hint_text, True, (0, 255, 0))
+                hint_surface = text_cache.render(self.large_font, hint_text, True, (0, 255, 0))
                 hint_rect = hint_surface.get_rect(center=(box_x + box_w // 2, box_y + 260))
                 screen.blit(hint_surface, hint_rect)
                 
                 # Show window timer
                 window_left = self.rhythm_press_window - self.rhythm_press_window_timer
                 window_text = f"Window: {window_left:.2f}s"
-                window_surface = self.small_font.render(window_text, True, (255, 255, 0))
-                window_rect = window_surface.get_rect(center=(box_x + box_w // 2, box_y + 300))
-                screen.blit(window_surface, window_rect)
+                draw_text(screen, self.small_font, window_text, (255, 255, 0), center=(box_x + box_w // 2, box_y + 300))
             else:
                 start_text = "Wait for the signal..."
-                start_surface = self.font.render(start_text, True, (200, 200, 255))
+                start_surface = text_cache.render(self.font, start_text, True, (200, 200, 255))
                 start_rect = start_surface.get_rect(center=(box_x + box_w // 2, box_y + 260))
                 screen.blit(start_surface, start_rect)
 
@@ -281,12 +284,12 @@ class street(Scene):
          # Failure message
             if self.rhythm_failed:
                 fail_text = "FAILED! Mark fell down. Restarting..."
-                fail_surface = self.large_font.render(fail_text, True, (255, 0, 0))
+                fail_surface = text_cache.render(self.large_font, fail_text, True, (255, 0, 0))
                 fail_rect = fail_surface.get_rect(center=(box_x + box_w // 2, box_y + 320))
                 screen.blit(fail_surface, fail_rect)
                 
                 penalty_text = "-30 seconds penalty"
-                penalty_surface = self.small_font.render(penalty_text, True, (255, 100, 100))
+                penalty_surface = text_cache.render(self.small_font, penalty_text, True, (255, 100, 100))
                 penalty_rect = penalty_surface.get_rect(center=(box_x + box_w // 2, box_y + 360))
                 screen.blit(penalty_surface, penalty_rect)
 
@@ -299,6 +302,6 @@ class street(Scene):
          # Show completion message briefly
             if self.timer < 2.0:  # Show for first 2 seconds after completion
                 complete_text = "Walking to store..."
-                complete_surface = self.font.render(complete_text, True, (0, 255, 0))
+                complete_surface = text_cache.render(self.font, complete_text, True, (0, 255, 0))
                 complete_rect = complete_surface.get_rect(center=(screen.get_width() // 2, 100))
                 screen.blit(complete_surface, complete_rect)
@@ -1,5 +1,9 @@
 import pygame
 from .scene_template import Scene
+from asset_manager import assets
+from texture_renderer import draw_rect
+from .font_registry import get_font
+from .text_cache import text_cache
 
 class store(Scene):
     def __init__(self):
@@ -13,8 +17,8 @@ class store(Scene):
         self.save_game()
 
         # Fonts
-        self.small_font = pygame.font.Font(None, 28)
-        self.tiny_font = pygame.font.Font(None, 24)
+        self.small_font = get_font(28)
+        self.tiny_font = get_font(24)
 
         # Collision boxes - store boundaries and obstacles
         self.collision_boxes = [
@@ -30,10 +34,14 @@ class store(Scene):
         ]
         
         # Load Mark's sprite
-        mark_original = pygame.image.load("assets/mark.png").convert_alpha()
-        mark_width, mark_height = mark_original.get_size()
+        mark_width, mark_height = assets.get_size("assets/mark.png")
         mark_scale = 60 / mark_height
-        self.mark_sprite = pygame.transform.scale(mark_original, (int(mark_width * mark_scale), 60))
+        self.mark_sprite = assets.get_image("assets/mark.png", (int(mark_width * mark_scale), 60))
+        
+        # Load candy machine sprite once instead of every frame
+        machine_width, machine_height = assets.get_size("assets/candy_machine.png")
+        machine_scale = 60 / machine_height
+        self.machine_sprite = assets.get_image("assets/candy_machine.png", (int(machine_width * machine_scale), 60))
         
         # Shop keeper position
         self.shopkeeper_pos = pygame.math.Vector2(800, 300)  # Behind left side of checkout
@@ -111,14 +119,15 @@ class store(Scene):
             super().move(dt)
     
     def render(self, screen):
-        super().render(screen, "Store")
+        if not self.draw_frozen_world(screen):
+            super().render(screen, "Store")
 
-        self.draw_characters(screen)
-        self.draw_candy_machine(screen)
+            self.draw_characters(screen)
 
-        if not self.in_buy_menu:
-            self.draw_checkout_hint(screen)
-            self.draw_candy_machine_hint(screen)
+            if not self.in_buy_menu:
+                self.draw_checkout_hint(screen)
+                self.draw_candy_machine_hint(screen)
+            self.freeze_world(screen)
 
         self.draw_buy_menu(screen)
         self.draw_clock(screen)
@@ -165,13 +174,11 @@ class store(Scene):
         mark_rect = self.mark_sprite.get_rect(center=self.player_pos)
         screen.blit(self.mark_sprite, mark_rect)
 
+    def draw_static(self, layer):
+        self.draw_candy_machine(layer)
+
     def draw_candy_machine(self, screen):
         # Draw candy machine
-        machine_original = pygame.image.load("assets/candy_machine.png").convert_alpha()
-        machine_width, machine_height = machine_original.get_size()
-        machine_scale = 60 / machine_height
-        self.machine_sprite = pygame.transform.scale(machine_original, (int(machine_width * machine_scale), 60))
-
         machine_rect = self.machine_sprite.get_rect(center=pygame.math.Vector2(self.candy_machine_pos.x - 40, self.candy_machine_pos.y - 20))
         screen.blit(self.machine_sprite, machine_rect)
     
@@ -180,7 +187,7 @@ class store(Scene):
             dist = (self.player_pos - self.shopkeeper_pos).length()
             if dist < self.interaction_radius:
                 hint_text = "Press E - Buy Candy"
-                hint_surface = self.font.render(hint_text, True, (255, 255, 0))
+                hint_surface = text_cache.render(self.font, hint_text, True, (255, 255, 0))
                 hint_rect = hint_surface.get_rect(center=(self.shopkeeper_pos.x, self.shopkeeper_pos.y - 60))
                 screen.blit(hint_surface, hint_rect)
 
@@ -190,20 +197,18 @@ class store(Scene):
             if dist_machine < self.interaction_radius:
                 if not self.save.get("has_candy_machine", False):
                     machine_hint = f"Press E - Buy Candy Machine (${self.candy_machine_cost})"
-                    machine_hint_surface = self.small_font.render(machine_hint, True, (255, 255, 0))
+                    machine_hint_surface = text_cache.render(self.small_font, machine_hint, True, (255, 255, 0))
                     machine_hint_rect = machine_hint_surface.get_rect(center=(self.candy_machine_pos.x, self.candy_machine_pos.y - 60))
                     screen.blit(machine_hint_surface, machine_hint_rect)
                 else:
                     machine_hint = "Candy Machine (Owned)"
-                    machine_hint_surface = self.small_font.render(machine_hint, True, (0, 255, 0))
+                    machine_hint_surface = text_cache.render(self.small_font, machine_hint, True, (0, 255, 0))
                     machine_hint_rect = machine_hint_surface.get_rect(center=(self.candy_machine_pos.x, self.candy_machine_pos.y - 60))
                     screen.blit(machine_hint_surface, machine_hint_rect)
     
     def draw_buy_menu(self, screen):
         # Draw buy menu
         if self.in_buy_menu:
-            self.dim_background(screen)
-            
             # Dimensions of buy menu
             boxw, boxh = 700, 500
             boxx = (screen.get_width() - boxw) // 2
@@ -215,23 +220,26 @@ class store(Scene):
             self.draw_curr_inventory(screen, boxx, boxy, boxw, boxh)
             self.draw_menu_instructions(screen, boxx, boxy, boxw, boxh)
 
-    def dim_background(self, screen):
-        # Dim background
-            overlay = pygame.Surface(screen.get_size())
-            overlay.set_alpha(180)
-            overlay.fill((0, 0, 0))
-            screen.blit(overlay, (0, 0))
+    def get_modal_dim(self):
+        # The buy menu is drawn over the dimmed store
+        if self.in_buy_menu:
+            return 180
+        return super().get_modal_dim()
+
+    def is_world_paused(self):
+        # Mark can't walk while the buy menu is open
+        return self.in_buy_menu
 
     def draw_menu_box(self, screen, box_x, box_y, box_w, box_h):
         # Buy menu box
             box_rect = pygame.Rect(box_x, box_y, box_w, box_h)
-            pygame.draw.rect(screen, (50, 50, 50), box_rect)
-            pygame.draw.rect(screen, (255, 255, 255), box_rect, 4)
+            draw_rect(screen, (50, 50, 50), box_rect)
+            draw_rect(screen, (255, 255, 255), box_rect, 4)
 
     def draw_menu_title(self, screen, box_x, box_y, box_w, box_h):
         # Title
             title_text = "CANDY STORE - BUY CANDY"
-            title_surface = self.font.render(title_text, True, (255, 215, 0))
+            title_surface = text_cache.render(self.font, title_text, True, (255, 215, 0))
             title_rect = title_surface.get_rect(center=(box_x + box_w // 2, box_y + 40))
             screen.blit(title_surface, title_rect)
 
@@ -239,7 +247,7 @@ class store(Scene):
         # Current inventory
             current_total = sum(self.save["candy"].values())
             capacity_text = f"Inventory: {current_total} / {self.max_candy_capacity}"
-            capacity_surface = self.small_font.render(capacity_text, True, (255, 255, 255))
+            capacity_surface = text_cache.render(self.small_font, capacity_text, True, (255, 255, 255))
             capacity_rect = capacity_surface.get_rect(center=(box_x + box_w // 2, box_y + 80))
             screen.blit(capacity_surface, capacity_rect)
             
@@ -253,13 +261,13 @@ class store(Scene):
             
             for key, name, candy_key, buy_price, sell_price in candies:
                 candy_text = f"[{key}] {name} - Buy: ${buy_price} | Sell: {sell_price}"
-                candy_surface = self.font.render(candy_text, True, (255, 255, 255))
+                candy_surface = text_cache.render(self.font, candy_text, True, (255, 255, 255))
                 screen.blit(candy_surface, (box_x + 50, y_offset))
                 
                 # Current amount
                 current = self.save["candy"].get(candy_key, 0)
                 current_text = f"  You have: {current}"
-                current_surface = self.small_font.render(current_text, True, (200, 200, 200))
+                current_surface = text_cache.render(self.small_font, current_text, True, (200, 200, 200))
                 screen.blit(current_surface, (box_x + 50, y_offset + 30))
                 
                 y_offset += 70
@@ -267,13 +275,13 @@ class store(Scene):
         # Quantity selector
             y_offset += 20
             qty_text = f"Quantity: {self.buy_quantity}  [+/-] to change"
-            qty_surface = self.font.render(qty_text, True, (255, 255, 0))
+            qty_surface = text_cache.render(self.font, qty_text, True, (255, 255, 0))
             qty_rect = qty_surface.get_rect(center=(box_x + box_w // 2, y_offset))
             screen.blit(qty_surface, qty_rect)
 
     def draw_menu_instructions(self, screen, box_x, box_y, box_w, box_h):
         # Instructions
         inst_text = "Press 1-3 to buy, ESC to close"
-        inst_surface = self.small_font.render(inst_text, True, (200, 200, 200))
+        inst_surface = text_cache.render(self.small_font, inst_text, True, (200, 200, 200))
         inst_rect = inst_surface.get_rect(center=(box_x + box_w // 2, box_y + box_h - 30))
         screen.blit(inst_surface, inst_rect)
\ No newline at end of file
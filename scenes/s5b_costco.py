@@ -1,5 +1,10 @@
 import pygame
 from .scene_template import Scene
+from asset_manager import assets
+from texture_renderer import draw_rect
+from .font_registry import get_font
+from .text_cache import text_cache
+from .ui_widgets import Label, Panel
 
 class costco(Scene):
     def __init__(self):
@@ -13,9 +18,9 @@ class costco(Scene):
         self.save_game()
         
         # Fonts
-        self.small_font = pygame.font.Font(None, 28)
-        self.tiny_font = pygame.font.Font(None, 24)
-        self.large_font = pygame.font.Font(None, 48)
+        self.small_font = get_font(28)
+        self.tiny_font = get_font(24)
+        self.large_font = get_font(48)
         
         # Collision boxes - Costco boundaries and obstacles
         self.collision_boxes = [
@@ -56,23 +61,20 @@ class costco(Scene):
         ]
         
         # Load Mark's sprite
-        mark_original = pygame.image.load("assets/mark.png").convert_alpha()
-        mark_width, mark_height = mark_original.get_size()
+        mark_width, mark_height = assets.get_size("assets/mark.png")
         mark_scale = 60 / mark_height
-        self.mark_sprite = pygame.transform.scale(mark_original, (int(mark_width * mark_scale)/60*100, 110))
+        self.mark_sprite = assets.get_image("assets/mark.png", (int(mark_width * mark_scale)/60*100, 110))
     
         # Load shop keeper sprites (using guy_npc and girl_npc)
-        guy_npc_original = pygame.image.load("assets/guy_npc.png").convert_alpha()
-        guy_width, guy_height = guy_npc_original.get_size()
+        guy_width, guy_height = assets.get_size("assets/guy_npc.png")
         guy_scale = 70 / guy_height
-        self.shopkeeper1_sprite = pygame.transform.scale(guy_npc_original, (int(guy_width * guy_scale) / 70 * 100, 110))
+        self.shopkeeper1_sprite = assets.get_image("assets/guy_npc.png", (int(guy_width * guy_scale) / 70 * 100, 110))
         
         
         #gettign rid of girl 
-        girl_npc_original = pygame.image.load("assets/girl_npc.png").convert_alpha()
-        girl_width, girl_height = girl_npc_original.get_size()
+        girl_width, girl_height = assets.get_size("assets/girl_npc.png")
         girl_scale = 70 / girl_height
-        self.shopkeeper2_sprite = pygame.transform.scale(girl_npc_original, (int(girl_width * girl_scale), 70))
+        self.shopkeeper2_sprite = assets.get_image("assets/girl_npc.png", (int(girl_width * girl_scale), 70))
         
         # Shop keeper positions (behind checkout counter, not on it)
         self.shopkeeper1_pos = pygame.math.Vector2(700, 600)  # Behind left side of checkout
@@ -84,6 +86,8 @@ class costco(Scene):
         self.in_buy_menu = False
         self.in_ps5_menu = False
         self.buy_quantity = 1
+        # Buy menu, built the first time it is opened
+        self.buy_menu_panel = None
         
         # Candy prices (bulk buy prices - cheaper!)
         self.candy_prices = {
@@ -167,16 +171,16 @@ class costco(Scene):
             super().move(dt)
     
     def render(self, screen):
-        super().render(screen)
-        
-        self.draw_characters(screen)
-        self.draw_checkout_area(screen)
-        self.draw_ps5_display(screen)
-        
-        # Draw interaction hints
-        if not self.in_buy_menu and not self.in_ps5_menu:
-            self.draw_checkout_hint(screen)
-            self.draw_ps5_hint(screen)
+        if not self.draw_frozen_world(screen):
+            super().render(screen)
+            
+            self.draw_characters(screen)
+            
+            # Draw interaction hints
+            if not self.in_buy_menu and not self.in_ps5_menu:
+                self.draw_checkout_hint(screen)
+                self.draw_ps5_hint(screen)
+            self.freeze_world(screen)
         
         self.draw_buy_menu(screen)
         self.draw_ps5_purchase_menu(screen)
@@ -219,25 +223,35 @@ class costco(Scene):
             self.switch_to("ending")
             
     def draw_characters(self, screen):
+        # Characters are queued and drawn back to front, so whoever stands lower overlaps the others
+        queue = self.render_queue
+
         # Draw Mark
         mark_rect = self.mark_sprite.get_rect(center=self.player_pos)
-        screen.blit(self.mark_sprite, mark_rect)
+        queue.submit(self.mark_sprite, mark_rect)
         
         # Draw shop keepers at checkout
         shopkeeper1_rect = self.shopkeeper1_sprite.get_rect(center=self.shopkeeper1_pos)
-        screen.blit(self.shopkeeper1_sprite, shopkeeper1_rect)
+        queue.submit(self.shopkeeper1_sprite, shopkeeper1_rect)
         
         shopkeeper2_rect = self.shopkeeper2_sprite.get_rect(center=self.shopkeeper2_pos)
-        screen.blit(self.shopkeeper2_sprite, shopkeeper2_rect)
+        queue.submit(self.shopkeeper2_sprite, shopkeeper2_rect)
+
+        queue.flush(screen)
+
+    def draw_static(self, layer):
+        # The checkout and the PS5 display never move
+        self.draw_checkout_area(layer)
+        self.draw_ps5_display(layer)
         
     def draw_checkout_area(self, screen):
         # Draw checkout area (register)
         checkout_rect = pygame.Rect(780, 576, 300, 50)
-        pygame.draw.rect(screen, (100, 100, 100), checkout_rect)
-        pygame.draw.rect(screen, (255, 255, 255), checkout_rect, 3)
+        draw_rect(screen, (100, 100, 100), checkout_rect)
+        draw_rect(screen, (255, 255, 255), checkout_rect, 3)
         
         # Draw "COSTCO CHECKOUT" text
-        checkout_text = self.small_font.render("COSTCO CHECKOUT", True, (255, 255, 255))
+        checkout_text = text_cache.render(self.small_font, "COSTCO CHECKOUT", True, (255, 255, 255))
         checkout_text_rect = checkout_text.get_rect(center=checkout_rect.center)
         screen.blit(checkout_text, checkout_text_rect)
         
@@ -245,9 +259,9 @@ class costco(Scene):
         # Draw PS5 display
         #ps5_rect = pygame.Rect(self.ps5_pos.x - 50, self.ps5_pos.y - 50, 100, 100)
         ps5_rect = pygame.Rect(930, 100, 100, 100)
-        pygame.draw.rect(screen, (0, 0, 0), ps5_rect)
-        pygame.draw.rect(screen, (255, 255, 0), ps5_rect, 4)
-        ps5_text = self.small_font.render("PS5", True, (255, 255, 255))
+        draw_rect(screen, (0, 0, 0), ps5_rect)
+        draw_rect(screen, (255, 255, 0), ps5_rect, 4)
+        ps5_text = text_cache.render(self.small_font, "PS5", True, (255, 255, 255))
         ps5_text_rect = ps5_text.get_rect(center=ps5_rect.center)
         screen.blit(ps5_text, ps5_text_rect)
     
@@ -257,7 +271,7 @@ class costco(Scene):
             dist2 = (self.player_pos - self.shopkeeper2_pos).length()
             if dist1 < self.interaction_radius or dist2 < self.interaction_radius: ##CHECK
                 hint_text = "Press E - Buy Candy (Bulk Deals!)"
-                hint_surface = self.font.render(hint_text, True, (255, 255, 0))
+                hint_surface = text_cache.render(self.font, hint_text, True, (255, 255, 0))
                 hint_rect = hint_surface.get_rect(center=(screen.get_width() // 2, 100))
                 screen.blit(hint_surface, hint_rect)
             elif dist2 < self.interaction_radius:
@@ -267,7 +281,7 @@ class costco(Scene):
             elif not self.in_buy_menu and not self.in_ps5_menu:
                 dist_ps5 = (self.player_pos - self.ps5_pos).length()
                 hint_text = "Press E - Buy PS5!!" #checking if near ps5
-                hint_surface = self.font.render(hint_text, True, (255, 255, 0))
+                hint_surface = text_cache.render(self.font, hint_text, True, (255, 255, 0))
                 hint_rect = hint_surface.get_rect(center=(screen.get_width() // 2, 100))
                 
                 
@@ -278,82 +292,76 @@ class costco(Scene):
             if dist_ps5 < self.interaction_radius:
                 if not self.save.get("has_ps5", False):
                     ps5_hint = f"Press E - Buy PS5 (${self.ps5_cost})"
-                    ps5_hint_surface = self.small_font.render(ps5_hint, True, (255, 255, 0))
+                    ps5_hint_surface = text_cache.render(self.small_font, ps5_hint, True, (255, 255, 0))
                     ps5_hint_rect = ps5_hint_surface.get_rect(center=(self.ps5_pos.x, self.ps5_pos.y - 80))
                     screen.blit(ps5_hint_surface, ps5_hint_rect)
                 else:
                     ps5_hint = "PS5 (Owned)"
-                    ps5_hint_surface = self.small_font.render(ps5_hint, True, (0, 255, 0))
+                    ps5_hint_surface = text_cache.render(self.small_font, ps5_hint, True, (0, 255, 0))
                     ps5_hint_rect = ps5_hint_surface.get_rect(center=(self.ps5_pos.x, self.ps5_pos.y - 80))
                     screen.blit(ps5_hint_surface, ps5_hint_rect)
         
     def draw_buy_menu(self, screen):
         # Draw buy menu
         if self.in_buy_menu:
-            self.dim_background(screen)
-            
-            # Dimensions of buy menu
-            box_w, box_h = 700, 500
-            box_x = (screen.get_width() - box_w) // 2
-            box_y = (screen.get_height() - box_h) // 2
-            
-            # Buy menu box
-            box_rect = pygame.Rect(box_x, box_y, box_w, box_h)
-            pygame.draw.rect(screen, (50, 50, 50), box_rect)
-            pygame.draw.rect(screen, (255, 0, 0), box_rect, 4)  # Red border for Costco
-            
+            # Buy menu box, composed again only when the candy or the quantity changes
+            if self.buy_menu_panel is None:
+                self.buy_menu_panel = self.build_buy_menu_panel(screen)
+            self.buy_menu_panel.draw(screen)
+
+    def build_buy_menu_panel(self, screen):
+        """Builds the buy menu box as a retained panel bound to the candy in the save and the buy quantity.
+
+        Parameters:
+            screen (Surface): The screen, for centering the box.
+
+        Returns:
+            Panel: The buy menu panel.
+        """
+        # Dimensions of buy menu
+        box_w, box_h = 700, 500
+        box_x = (screen.get_width() - box_w) // 2
+        box_y = (screen.get_height() - box_h) // 2
+
+        children = [
             # Title
-            title_text = "COSTCO - BULK CANDY DEALS"
-            title_surface = self.font.render(title_text, True, (255, 215, 0))
-            title_rect = title_surface.get_rect(center=(box_x + box_w // 2, box_y + 40))
-            screen.blit(title_surface, title_rect)
-            
+            Label(self.font, "COSTCO - BULK CANDY DEALS", (255, 215, 0), center=(box_w // 2, 40)),
+
             # Current inventory
-            current_total = sum(self.save["candy"].values())
-            capacity_text = f"Inventory: {current_total} / {self.max_candy_capacity}"
-            capacity_surface = self.small_font.render(capacity_text, True, (255, 255, 255))
-            capacity_rect = capacity_surface.get_rect(center=(box_x + box_w // 2, box_y + 80))
-            screen.blit(capacity_surface, capacity_rect)
-            
-            y_offset = box_y + 130
-            # Candy options (bulk prices)
-            candies = [
-                ("1", "Twizzles", "twizzlers", self.candy_prices["twizzlers"], "$2"),
-                ("2", "Skizzles", "Skizzles", self.candy_prices["Skizzles"], "$9"),
-                ("3", "Woozers", "woozers", self.candy_prices["woozers"], "$40"),
-            ]
-            
-            for key, name, candy_key, buy_price, sell_price in candies:
-                candy_text = f"[{key}] {name} - Buy: ${buy_price:.2f} | Sell: {sell_price}"
-                candy_surface = self.font.render(candy_text, True, (255, 255, 255))
-                screen.blit(candy_surface, (box_x + 50, y_offset))
-                
-                # Current amount
-                current = self.save["candy"].get(candy_key, 0)
-                current_text = f"  You have: {current}"
-                current_surface = self.small_font.render(current_text, True, (200, 200, 200))
-                screen.blit(current_surface, (box_x + 50, y_offset + 30))
-                
-                y_offset += 70
-            
-            # Quantity selector
-            y_offset += 20
-            qty_text = f"Quantity: {self.buy_quantity}  [+/-] to change"
-            qty_surface = self.font.render(qty_text, True, (255, 255, 0))
-            qty_rect = qty_surface.get_rect(center=(box_x + box_w // 2, y_offset))
-            screen.blit(qty_surface, qty_rect)
-            
-            # Instructions
-            inst_text = "Press 1-3 to buy, ESC to close"
-            inst_surface = self.small_font.render(inst_text, True, (200, 200, 200))
-            inst_rect = inst_surface.get_rect(center=(box_x + box_w // 2, box_y + box_h - 30))
-            screen.blit(inst_surface, inst_rect)
+            Label(self.small_font, lambda: f"Inventory: {sum(self.save["candy"].values())} / {self.max_candy_capacity}", (255, 255, 255),
+                  center=(box_w // 2, 80)).watch(self.save, "candy"),
+        ]
+
+        y_offset = 130
+        # Candy options (bulk prices)
+        candies = [
+            ("1", "Twizzles", "twizzlers", self.candy_prices["twizzlers"], "$2"),
+            ("2", "Skizzles", "Skizzles", self.candy_prices["Skizzles"], "$9"),
+            ("3", "Woozers", "woozers", self.candy_prices["woozers"], "$40"),
+        ]
+
+        for key, name, candy_key, buy_price, sell_price in candies:
+            candy_text = f"[{key}] {name} - Buy: ${buy_price:.2f} | Sell: {sell_price}"
+            children.append(Label(self.font, candy_text, (255, 255, 255), topleft=(50, y_offset)))
+
+            # Current amount
+            current_text = lambda candy_key = candy_key: f"  You have: {self.save["candy"].get(candy_key, 0)}"
+            children.append(Label(self.small_font, current_text, (200, 200, 200), topleft=(50, y_offset + 30)).watch(self.save, f"candy.{candy_key}"))
+
+            y_offset += 70
+
+        # Quantity selector
+        y_offset += 20
+        children.append(Label(self.font, lambda: f"Quantity: {self.buy_quantity}  [+/-] to change", (255, 255, 0), center=(box_w // 2, y_offset)))
+
+        # Instructions
+        children.append(Label(self.small_font, "Press 1-3 to buy, ESC to close", (200, 200, 200), center=(box_w // 2, box_h - 30)))
+
+        return Panel(pygame.Rect(box_x, box_y, box_w, box_h), (50, 50, 50), (255, 0, 0), 4, children)  # Red border for Costco
     
     def draw_ps5_purchase_menu(self, screen):
         # Draw PS5 purchase menu
         if self.in_ps5_menu:
-            self.dim_background(screen)
-            
             # PS5 menu box
             box_x, box_y = 930, 100
             box_w, box_h = 100, 100
@@ -362,18 +370,18 @@ class costco(Scene):
             box_rect = pygame.Rect(box_x, box_y, box_w, box_h)
             
             #drawimg box in corner
-            pygame.draw.rect(screen, (30, 30, 30), box_rect)
-            pygame.draw.rect(screen, (255, 255, 0), box_rect, 2) 
+            draw_rect(screen, (30, 30, 30), box_rect)
+            draw_rect(screen, (255, 255, 0), box_rect, 2) 
            # pygame.Rect(930, 100, 100, 100),
             # Title
             title_text = "PLAYSTATION 5"
-            title_surface = self.large_font.render(title_text, True, (255, 255, 0))
+            title_surface = text_cache.render(self.large_font, title_text, True, (255, 255, 0))
             title_rect = title_surface.get_rect(center=(box_x + box_w // 2, box_y + 60))
             screen.blit(title_surface, title_rect)
             
             # Price
             price_text = f"Price: ${self.ps5_cost}"
-            price_surface = micro_font.render(price_text, True, (255, 255, 255))
+            price_surface = text_cache.render(micro_font, price_text, True, (255, 255, 255))
             price_rect = price_surface.get_rect(center=(box_x + box_w // 2, box_y + 35))
             screen.blit(price_surface, price_rect)
             
@@ -383,26 +391,29 @@ class costco(Scene):
             
             # Current money
             money_text = f"Your Money: ${self.save['money']}"
-            money_surface = self.font.render(money_text, True, (200, 200, 200))
+            money_surface = text_cache.render(self.font, money_text, True, (200, 200, 200))
             money_rect = money_surface.get_rect(center=(box_x + box_w // 2, box_y + 200))
             screen.blit(money_surface, money_rect)
             
             # Warning
             if self.save["money"] >= self.ps5_cost:
                 warning_text = "Buying this will END THE GAME!"
-                warning_surface = self.font.render(warning_text, True, (255, 0, 0))
+                warning_surface = text_cache.render(self.font, warning_text, True, (255, 0, 0))
                 warning_rect = warning_surface.get_rect(center=(box_x + box_w // 2, box_y + 260))
                 screen.blit(warning_surface, warning_rect)
             
             # Buy prompt
             buy_text = "Buy PS5? [Y] Yes  [N] No"
-            buy_surface = self.font.render(buy_text, True, (255, 255, 0))
+            buy_surface = text_cache.render(self.font, buy_text, True, (255, 255, 0))
             buy_rect = buy_surface.get_rect(center=(box_x + box_w // 2, box_y + 320))
             screen.blit(buy_surface, buy_rect)
             
-    def dim_background(self, screen):
-        # Dim background
-            overlay = pygame.Surface(screen.get_size())
-            overlay.set_alpha(180)
-            overlay.fill((0, 0, 0))
-            screen.blit(overlay, (0, 0))
\ No newline at end of file
+    def get_modal_dim(self):
+        # The buy and PS5 menus are drawn over the dimmed store
+        if self.in_buy_menu or self.in_ps5_menu:
+            return 180
+        return super().get_modal_dim()
+
+    def is_world_paused(self):
+        # Mark can't walk while a menu is open
+        return self.in_buy_menu or self.in_ps5_menu
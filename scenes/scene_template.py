@@ -1,5 +1,24 @@
 import pygame
 from save_manager import load_save, save_data
+from asset_manager import assets
+from dirty_rects import mark_dirty, untracked
+from quality import quality
+from texture_renderer import capture
+from window import LOGICAL_SIZE
+from .font_registry import get_font
+from .text_cache import text_cache
+from .surface_pool import surface_pool
+from .ui_widgets import Label, Panel, TextList
+from .render_queue import RenderQueue
+from .tile_world import Camera, load_world
+
+# Save flags of the purchasable items and how the inventory lists them
+INVENTORY_ITEM_KEYS = {
+    "has_costco_membership": "Costco Membership",
+    "has_bicycle": "Bicycle",
+    "has_candy_machine": "Candy Machine",
+    "has_bigger_backpack": "Bigger Backpack",
+}
 
 class Scene:
     """This is the parent class for all scenes, it is like a template.
@@ -20,9 +39,33 @@ class Scene:
         self.duration = duration
         self.default_next_scene = next_scene_key
         self.background_name = back_name
-        self.font = pygame.font.Font(None, 36)
+        self.font = get_font(36)
         self.save = load_save()
         self.show_inventory = False
+        # Whether nothing in the scene moves on its own, so the main loop can sleep until input arrives
+        self.idle_capable = False
+
+        # Retained HUD widgets, built the first time they are drawn
+        self.counter_labels = None
+        self.inventory_panel = None
+        self.clock_label = None
+        # Background and other unchanging parts of the frame, composed the first time the scene is drawn, and the
+        # quality tier it was composed at
+        self.static_layer = None
+        self.static_layer_quality = None
+        # Sprites submitted during render() and drawn sorted by depth
+        self.render_queue = RenderQueue()
+        # Scenes bigger than the screen have a world and a camera that follows the player, see set_world(), and the
+        # camera position and quality tier the world was last drawn at
+        self.world = None
+        self.camera = None
+        self.world_drawn = None
+        # (dim, surface) of the dimmed world behind an open modal, captured again after the save changed
+        self.frozen_world = None
+        self.frozen_world_stale = False
+        # (boxes, surface) of the collision debug overlay
+        self.collision_overlay = None
+        self.save.subscribe(None, self._on_save_change)
         
         self.player_pos = initial_pos
         
@@ -37,8 +80,9 @@ class Scene:
             self.player_collision_box = pygame.Rect(self.player_pos.x - self.x_offset, self.player_pos.y - self.y_offset, 30, 20)
             self.player_speed = self.save["bB_speed"]
         
-        self.small_font = pygame.font.Font(None, 28)
-        self.tiny_font = pygame.font.Font(None, 24)
+        self.small_font = get_font(28)
+        self.tiny_font = get_font(24)
+        self.inventory_title_font = get_font(50)
         self.collision_boxes = None
 
     def process_input(self, events):
@@ -69,18 +113,191 @@ class Scene:
             screen (Surface): The window that displays the game.
         """
         
-        # Clear the screen
-        screen.fill((0,0,0))
+        # Draw the background and everything else that looks the same every frame in one blit, which dirty rect mode skips
+        if self.world is not None:
+            self.display_world(screen, tool_tips)
+        else:
+            if self.static_layer is None:
+                # A static layer composed again can differ anywhere, like where the hallway barrier was
+                mark_dirty(screen, screen.get_rect())
+            with untracked(screen):
+                screen.blit(self.get_static_layer(screen, tool_tips), (0, 0))
         
         # Display main stuff
-        self.display_background(screen)
         
         if(tool_tips):    
-            self.display_screen_hints(screen)
             self.display_counters(screen)
             
         self.display_scene_name(screen, name_of_scene)
+
+    def get_static_layer(self, screen, tool_tips = True):
+        """Returns the scene's static layer, a screen sized surface with the background, the control hints and whatever
+        draw_static() adds. It is composed the first time it is needed and again only after invalidate_static_layer()
+        or a change of the quality tier.
+
+        Parameters:
+            screen (Surface): The window that displays the game, for the size of the layer.
+            tool_tips (bool): Whether the control hints are part of the layer. Defaults to True.
+
+        Returns:
+            Surface: The static layer.
+        """
+        if self.static_layer_quality != quality.level:
+            self.invalidate_static_layer()
+        if self.static_layer is None or self.static_layer.get_size() != screen.get_size():
+            layer = pygame.Surface(screen.get_size())
+            layer.fill((0,0,0))
+            self.display_background(layer)
+            if(tool_tips):
+                self.display_screen_hints(layer)
+            self.draw_static(layer)
+            self.static_layer = layer
+            self.static_layer_quality = quality.level
+        return self.static_layer
+
+    def draw_static(self, layer):
+        """Draws the props of the scene that never move onto the static layer, like a counter or a barrier.
+        Characters are drawn every frame instead, so they overlap each other in the right order. Scenes override
+        this, and call invalidate_static_layer() when one of those props changes.
+
+        Parameters:
+            layer (Surface): The static layer, already holding the background.
+        """
+        pass
+
+    def get_idle_timeout(self):
+        """Returns how long the main loop may sleep waiting for input before the scene has to update again, in
+        milliseconds with 0 for until input arrives, or None when the scene has to update every frame.
+        """
+        if not self.idle_capable:
+            return None
+        if self.duration is None:
+            return 0
+        # Wake up in time to switch scenes when the timer runs out
+        return max(1, int((self.duration - self.timer) * 1000))
+
+    def get_modal_dim(self):
+        """Returns how much the world is dimmed behind the modal that is open, as the alpha of a black overlay with
+        0 for not at all, or None when no modal is open. Scenes with their own modals override this.
+        """
+        return 0 if self.show_inventory else None
+
+    def is_world_paused(self):
+        """Returns whether the world stands still because a modal is open. The world is drawn once when the modal
+        opens and that frame is kept, so update() must not move anything in it while this is True. The world keeps
+        going behind the inventory and is drawn again every frame, so only scenes whose own modals stop the player
+        override this.
+        """
+        return False
+
+    def draw_frozen_world(self, screen):
+        """Draws the world captured by freeze_world() if the same modal is still open. Scenes call this before
+        drawing the world and skip the world when it returns True, so an open modal only costs its own contents.
+
+        Parameters:
+            screen (Surface): The window that displays the game.
+
+        Returns:
+            bool: Whether the frozen world was drawn.
+        """
+        if self.frozen_world is not None:
+            dim, surface = self.frozen_world
+            if dim == self.get_modal_dim() and not self.frozen_world_stale:
+                # The same every frame, so dirty rect mode skips it
+                with untracked(screen):
+                    screen.blit(surface, (0, 0))
+                return True
+            self.thaw_world()
+            # Dirty rect mode only knows about the modal's contents since the world was frozen
+            mark_dirty(screen, screen.get_rect())
+        return False
+
+    def freeze_world(self, screen):
+        """Dims the world that was just drawn, if a modal is open, and keeps a copy of it for the following frames
+        if the world is paused behind it.
+
+        Parameters:
+            screen (Surface): The window that displays the game, holding this frame's world.
+        """
+        dim = self.get_modal_dim()
+        if dim is None:
+            return
+        if dim:
+            screen.blit(surface_pool.get(screen.get_size(), alpha=dim, fill=(0, 0, 0)), (0, 0))
+        if not self.is_world_paused():
+            return
+        self.frozen_world = (dim, capture(screen))
+        self.frozen_world_stale = False
+
+    def thaw_world(self):
+        """Drops the frozen world, so the next frame draws the world again.
+        """
+        self.frozen_world = None
+
+    def _on_save_change(self, key, old, new):
+        # The counters and anything else showing save data may have changed behind the modal
+        self.frozen_world_stale = True
+
+    def invalidate_static_layer(self):
+        """Makes the next frame compose the static layer again, for example after something in it went away.
+        """
+        self.static_layer = None
+        self.world_drawn = None
     
+    def set_world(self, name):
+        """Makes the scene a world from assets/worlds/ with a camera, instead of one screen sized background. The
+        world's colliders replace collision_boxes, and everything the scene draws at world positions has to go through
+        the camera, or through the render queue, which culls and moves it. A world has no static layer, so props that
+        never move belong in the world file and draw_static() is not called.
+
+        Parameters:
+            name (string): The name of the world file, like "playground".
+        """
+        self.world = load_world(name)
+        self.camera = Camera(LOGICAL_SIZE, self.world.size)
+        self.collision_boxes = self.world.colliders
+        if self.player_pos is not None:
+            self.camera.follow(self.player_pos)
+
+    def update_camera(self):
+        """Moves the camera to the player.
+        """
+        if self.camera is not None:
+            self.camera.follow(self.player_pos)
+
+    def display_world(self, screen, tool_tips = True):
+        """Draws the chunks of the world the camera sees straight onto the screen, and the control hints over them.
+        The chunks are composed once, so a frame after the camera moved costs the same blits as any other, and dirty
+        rect mode skips all of it while the camera stands still.
+
+        Parameters:
+            screen (Surface): The window that displays the game.
+            tool_tips (bool): Whether to draw the control hints. Defaults to True.
+        """
+        drawn = (self.camera.rect.topleft, quality.level)
+        if drawn != self.world_drawn:
+            # Everything on screen moved
+            mark_dirty(screen, screen.get_rect())
+            self.world_drawn = drawn
+        with untracked(screen):
+            self.world.draw(screen, self.camera)
+            if(tool_tips):
+                self.display_screen_hints(screen)
+
+    def get_colliders(self, rect):
+        """Returns the colliders that rect may touch.
+
+        Parameters:
+            rect (Rect): The area to test, like the player's collision box after a move.
+
+        Returns:
+            List[Rect]: The colliders.
+        """
+        # A world only hands out the colliders in the chunks around rect
+        if self.world is not None:
+            return self.world.colliders_near(rect)
+        return self.collision_boxes
+
     def switch_to(self, next_scene_key):
         """This function is used to change what the next scene should be. It is simple enough that it is not overloaded in the individual
         scenes and is defined in the parent class SceneTemplate.
@@ -91,7 +308,8 @@ class Scene:
         self.next_scene = next_scene_key
         
     def save_game(self):
-        """When called, saves the game data to the file "save.json".
+        """When called, saves the game data to the file "save.json". Nothing is written if the save has not changed
+        since it was loaded or last saved.
         """
         save_data(self.save)
     
@@ -125,6 +343,10 @@ class Scene:
                 self.switch_to(self.default_next_scene)
             
     def move(self, dt):
+        # The player stands still behind a modal that pauses the world
+        if self.is_world_paused():
+            return
+
         # Normalize movement speed
         if self.movement.length_squared() > 0:
             self.movement = self.movement.normalize()
@@ -134,152 +356,117 @@ class Scene:
             new_rect = self.player_collision_box.copy()
             new_rect.x += self.movement.x * self.player_speed * dt
 
-            if not any(new_rect.colliderect(box) for box in self.collision_boxes):
+            if not any(new_rect.colliderect(box) for box in self.get_colliders(new_rect)):
                 self.player_collision_box.x = new_rect.x
 
         if self.movement.y != 0:
             new_rect = self.player_collision_box.copy()
             new_rect.y += self.movement.y * self.player_speed * dt
 
-            if not any(new_rect.colliderect(box) for box in self.collision_boxes):
+            if not any(new_rect.colliderect(box) for box in self.get_colliders(new_rect)):
                 self.player_collision_box.y = new_rect.y
 
         # Update position
         self.player_pos.update(self.player_collision_box.x + self.x_offset, self.player_collision_box.y + self.y_offset)
         
     def display_background(self, screen):
-        # Load background if necessary
-        if(self.background_name != None):
-            background_image = pygame.image.load("assets/backgrounds/" + self.background_name).convert_alpha()
-            background_image = pygame.transform.scale(background_image, screen.get_size())
+        # A world draws the chunks the camera sees instead of a background
+        if self.world is not None:
+            self.world.draw(screen, self.camera)
+        # Background comes from the shared asset cache, so it is only decoded and scaled once
+        elif(self.background_name != None):
+            background_image = assets.get_background(self.background_name, screen.get_size())
             screen.blit(background_image, (0, 0))
         
     def display_screen_hints(self, screen):
         # Draw persistent control hints (shown everywhere)
         hints_y = 670
         hint_bg = pygame.Rect(10, hints_y - 5, 350, 40)
-        hint_surface = pygame.Surface((hint_bg.width, hint_bg.height), pygame.SRCALPHA)
-        hint_surface.fill((0, 0, 0, 150))
-        screen.blit(hint_surface, hint_bg)
+        screen.blit(surface_pool.get_translucent(hint_bg.size, (0, 0, 0, 150)), hint_bg)
         
         controls_text = "[.] Fast Forward 15s  |  [I] Inventory"
-        controls_surface = self.small_font.render(controls_text, True, (200, 200, 255))
+        controls_surface = text_cache.render(self.small_font, controls_text, True, (200, 200, 255))
         screen.blit(controls_surface, (20, hints_y))
 
     def display_counters(self, screen):
         COLOR = (0, 0, 0)
         SCREEN_WIDTH, SCREEN_HEIGHT = screen.get_size()
         padding = 10
-        line1_surface = self.font.render(f"Buyers: {self.save["buyers"]}", True, COLOR)
-        line1_rect = line1_surface.get_rect()
-        line1_rect.topright = (SCREEN_WIDTH - padding, padding)
-        screen.blit(line1_surface, line1_rect)
-
-        line2_surface = self.font.render(f"Cash: {self.save["money"]}", True, COLOR)
-        line2_rect = line2_surface.get_rect()
-        line2_rect.topright = line1_rect.bottomright
-        line2_rect.top += padding
-        screen.blit(line2_surface, line2_rect)
+        # counters are retained labels, so they are only rendered again when the save says the value changed
+        if self.counter_labels is None:
+            buyers_label = Label(self.font, lambda: f"Buyers: {self.save["buyers"]}", COLOR, topright=(SCREEN_WIDTH - padding, padding)).watch(self.save, "buyers")
+            buyers_label.refresh()
+            cash_label = Label(self.font, lambda: f"Cash: {self.save["money"]}", COLOR, topright=(buyers_label.rect.right, buyers_label.rect.bottom + padding)).watch(self.save, "money")
+            self.counter_labels = [buyers_label, cash_label]
+        for label in self.counter_labels:
+            label.draw(screen)
     
     def display_scene_name(self, screen, scene_name):
         if(scene_name != None):
-            text = self.font.render(scene_name, True, (0,0,0))
+            text = text_cache.render(self.font, scene_name, True, (0,0,0))
             screen.blit(text, (20, 20))
         
     def draw_inventory(self, screen):
         """Draw persistent inventory that shows candies and items"""
         if not self.show_inventory:
             return
-        
-        # Create inventory box (centered on screen)
+
+        # The panel is composed once and only again when the candy or items change
+        if self.inventory_panel is None:
+            self.inventory_panel = self.build_inventory_panel()
+        self.inventory_panel.draw(screen)
+
+    def build_inventory_panel(self):
+        """Builds the inventory box (centered on screen) as a retained panel bound to the save data.
+
+        Returns:
+            Panel: The inventory panel.
+        """
         inv_box = pygame.Rect(200, 100, 880, 520)
-        inv_surface = pygame.Surface((inv_box.width, inv_box.height), pygame.SRCALPHA)
-        inv_surface.fill((0, 0, 0, 220))
-        screen.blit(inv_surface, inv_box)
-        pygame.draw.rect(screen, (255, 215, 0), inv_box, 4)
-        
-        # Title
-        title_text = pygame.font.Font(None, 50).render("INVENTORY", True, (255, 215, 0))
-        title_rect = title_text.get_rect(center=(inv_box.centerx, inv_box.y + 30))
-        screen.blit(title_text, title_rect)
-        
-        # Close hint
-        close_text = self.tiny_font.render("Press [I] to close", True, (200, 200, 200))
-        close_rect = close_text.get_rect(center=(inv_box.centerx, inv_box.bottom - 20))
-        screen.blit(close_text, close_rect)
-        
-        y_offset = inv_box.y + 80
-        
-        # Candy section
-        candy_title = self.font.render("CANDY:", True, (255, 255, 255))
-        screen.blit(candy_title, (inv_box.x + 30, y_offset))
-        y_offset += 40
-        
-        candy = self.save.get("candy", {})
-        twizzles = candy.get("twizzlers", 0)
-        skizzles = candy.get("Skizzles", 0)
-        woozers = candy.get("woozers", 0)
-        
-        twizzles_text = f"  Twizzles: {twizzles}"
-        twizzles_surface = self.small_font.render(twizzles_text, True, (255, 255, 255))
-        screen.blit(twizzles_surface, (inv_box.x + 50, y_offset))
-        y_offset += 35
-        
-        skizzles_text = f"  Skizzles: {skizzles}"
-        skizzles_surface = self.small_font.render(skizzles_text, True, (255, 255, 255))
-        screen.blit(skizzles_surface, (inv_box.x + 50, y_offset))
-        y_offset += 35
-        
-        woozers_text = f"  Woozers: {woozers}"
-        woozers_surface = self.small_font.render(woozers_text, True, (255, 255, 255))
-        screen.blit(woozers_surface, (inv_box.x + 50, y_offset))
-        y_offset += 60
-        
-        # Items section
-        items_title = self.font.render("ITEMS:", True, (255, 255, 255))
-        screen.blit(items_title, (inv_box.x + 30, y_offset))
-        y_offset += 40
-        
-        # Check for purchased items
-        items = []
-        if self.save.get("has_costco_membership", False):
-            items.append("Costco Membership")
-        if self.save.get("has_bicycle", False):
-            items.append("Bicycle")
-        if self.save.get("has_candy_machine", False):
-            items.append("Candy Machine")
-        if self.save.get("has_bigger_backpack", False):
-            items.append("Bigger Backpack")
-        
-        if items:
-            for item in items:
-                item_text = f"  {item}"
-                item_surface = self.small_font.render(item_text, True, (150, 255, 150))
-                screen.blit(item_surface, (inv_box.x + 50, y_offset))
-                y_offset += 35
-        else:
-            no_items_text = "  No items purchased yet"
-            no_items_surface = self.small_font.render(no_items_text, True, (150, 150, 150))
-            screen.blit(no_items_surface, (inv_box.x + 50, y_offset))
+        candy_color = (255, 255, 255)
+        return Panel(inv_box, (0, 0, 0, 220), (255, 215, 0), 4, [
+            # Title and close hint
+            Label(self.inventory_title_font, "INVENTORY", (255, 215, 0), center=(inv_box.width // 2, 30)),
+            Label(self.tiny_font, "Press [I] to close", (200, 200, 200), center=(inv_box.width // 2, inv_box.height - 20)),
+
+            # Candy section
+            Label(self.font, "CANDY:", (255, 255, 255), topleft=(30, 80)),
+            Label(self.small_font, lambda: f"  Twizzles: {self.save.get("candy", {}).get("twizzlers", 0)}", candy_color, topleft=(50, 120)).watch(self.save, "candy"),
+            Label(self.small_font, lambda: f"  Skizzles: {self.save.get("candy", {}).get("Skizzles", 0)}", candy_color, topleft=(50, 155)).watch(self.save, "candy"),
+            Label(self.small_font, lambda: f"  Woozers: {self.save.get("candy", {}).get("woozers", 0)}", candy_color, topleft=(50, 190)).watch(self.save, "candy"),
+
+            # Items section
+            Label(self.font, "ITEMS:", (255, 255, 255), topleft=(30, 250)),
+            TextList(self.small_font, self.inventory_items, (150, 255, 150), 35, "  No items purchased yet", (150, 150, 150), topleft=(50, 290)).watch(self.save, *INVENTORY_ITEM_KEYS),
+        ])
+
+    def inventory_items(self):
+        """Returns the inventory lines of the purchased items.
+        """
+        return [f"  {item}" for key, item in INVENTORY_ITEM_KEYS.items() if self.save.get(key, False)]
     
     def draw_clock(self, screen):
-        # Draw countdown clock (bottom right)
+        # Draw countdown clock (bottom right), on a box that is composed again only when the second changes
+        if self.clock_label is None:
+            self.clock_label = Label(self.font, self.clock_text, (255, 255, 255), background=(0, 0, 0), border_color=(255, 255, 255),
+                                     border_width=2, padding=(10, 5), bottomright=(screen.get_width() - 10, screen.get_height() - 15))
+        self.clock_label.draw(screen)
+
+    def clock_text(self):
+        """Returns the text of the countdown clock.
+        """
         time_remaining = self.duration - self.timer
         minutes = int(time_remaining // 60)
         seconds = int(time_remaining % 60)
-        clock_text = f"Time: {minutes:02d}:{seconds:02d}"
-        clock_surface = self.font.render(clock_text, True, (255, 255, 255))
-        clock_rect = clock_surface.get_rect(bottomright=(screen.get_width() - 20, screen.get_height() - 20))
-        
-        # Draw background for clock
-        clock_bg = pygame.Rect(clock_rect.x - 10, clock_rect.y - 5, clock_rect.width + 20, clock_rect.height + 10)
-        pygame.draw.rect(screen, (0, 0, 0, 180), clock_bg)
-        pygame.draw.rect(screen, (255, 255, 255), clock_bg, 2)
-        screen.blit(clock_surface, clock_rect)
+        return f"Time: {minutes:02d}:{seconds:02d}"
 
     def display_collision_boxes(self, screen):
         """Draws all collision boxes and the player's collision box for debugging."""
         
+        # Debug drawing is the first thing to go when frames run late
+        if not quality.decorations:
+            return
+        
         # Color for the collision boxes (e.g., translucent red)
         COLLISION_COLOR = (255, 0, 0, 100) # (R, G, B, Alpha)
         PLAYER_COLLISION_COLOR = (0, 255, 0, 150) # (R, G, B, Alpha)
@@ -287,19 +474,29 @@ class Scene:
         # Since pygame.draw.rect doesn't support drawing semi-transparent rectangles directly,
         # we'll use a Surface with SRCALPHA for transparency.
         
-        # Create a surface to draw collision boxes on
-        overlay = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
-        
-        # Draw all static collision boxes
-        if self.collision_boxes:
-            for box in self.collision_boxes:
-                # Use a transparent color for the static boxes
-                pygame.draw.rect(overlay, COLLISION_COLOR, box)
+        if self.world is not None:
+            # In a world the boxes are in world coordinates. Only the ones in the chunks on screen are drawn, one
+            # pooled box each, so scrolling does not compose a new overlay every frame
+            to_screen = self.camera.to_screen
+            nearby = {id(box): box for box in self.world.colliders_near(self.camera.rect)}
+            screen.blits([(surface_pool.get(box.size, pygame.SRCALPHA, fill=COLLISION_COLOR), to_screen(box))
+                          for box in nearby.values() if self.camera.is_visible(box)], doreturn=False)
+        else:
+            to_screen = lambda box: box
+
+            # Draw all static collision boxes. They never move, so the overlay they are drawn on is kept until they
+            # change instead of being drawn again every frame
+            boxes = tuple(tuple(box) for box in self.collision_boxes or ())
+            if self.collision_overlay is None or self.collision_overlay[0] != boxes:
+                overlay = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
+                for box in boxes:
+                    # Use a transparent color for the static boxes
+                    pygame.draw.rect(overlay, COLLISION_COLOR, box)
+                self.collision_overlay = (boxes, overlay)
+            screen.blit(self.collision_overlay[1], (0, 0))
                 
         # Draw the player's collision box
         if self.player_collision_box:
             # Use a slightly more opaque/different color for the player
-            pygame.draw.rect(overlay, PLAYER_COLLISION_COLOR, self.player_collision_box)
-            
-        # Blit the overlay onto the main screen
-        screen.blit(overlay, (0, 0))
\ No newline at end of file
+            player_box = to_screen(self.player_collision_box)
+            screen.blit(surface_pool.get(player_box.size, pygame.SRCALPHA, fill=PLAYER_COLLISION_COLOR), player_box)
\ No newline at end of file
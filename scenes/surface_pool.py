@@ -0,0 +1,128 @@
+import pygame
+from quality import quality
+from texture_renderer import mark_volatile
+
+# Overlays like the dimmed background behind a menu are full-screen surfaces that used to be created and thrown
+# away every frame, which is several megabytes a second for the allocator and garbage collector. The pool keeps
+# them instead, keyed by everything that decides what they look like.
+
+class SurfacePool:
+    """Shared pool of pre-filled surfaces, keyed by (size, flags, alpha, fill).
+
+    get() hands out one shared surface per key, which callers must not draw onto, for plain boxes and overlays.
+    acquire() hands out a scratch surface that the caller may draw onto and gives back with release(), and it is
+    filled again the next time it is acquired.
+    """
+
+    def __init__(self):
+        """Default constructor.
+        """
+        self.shared = {}
+        # Released scratch surfaces by key, and the key of every scratch surface that is handed out
+        self.free = {}
+        self.keys = {}
+        self.allocations = 0
+        self.reuses = 0
+
+    def _make_key(self, size, flags, alpha, fill):
+        # Colors can be pygame.Color objects, which can't be dict keys
+        return (tuple(size), flags, alpha, tuple(fill) if fill is not None else None)
+
+    def _create(self, key):
+        size, flags, alpha, fill = key
+        self.allocations += 1
+        surface = pygame.Surface(size, flags)
+        if alpha is not None:
+            surface.set_alpha(alpha)
+        if fill is not None:
+            surface.fill(fill)
+        return surface
+
+    def get(self, size, flags = 0, alpha = None, fill = None):
+        """Returns the shared surface for the key, creating it the first time.
+
+        Parameters:
+            size ((int, int)): The size of the surface.
+            flags (int): Surface flags, like pygame.SRCALPHA. Defaults to 0.
+            alpha (int): The surface alpha set with set_alpha(), None for none. Defaults to None.
+            fill ((int, int, int) or (int, int, int, int)): The color the surface is filled with. Defaults to None.
+
+        Returns:
+            Surface: The shared surface.
+        """
+        key = self._make_key(size, flags, alpha, fill)
+        surface = self.shared.get(key)
+        if surface is None:
+            surface = self._create(key)
+            self.shared[key] = surface
+        else:
+            self.reuses += 1
+        return surface
+
+    def get_translucent(self, size, color):
+        """Returns the shared surface for a see-through box of one color. It uses per-pixel alpha when the quality
+        tier draws alpha overlays, and otherwise an opaque surface with one surface alpha, which looks the same for
+        a single color and blits faster.
+
+        Parameters:
+            size ((int, int)): The size of the box.
+            color ((int, int, int, int)): The color of the box, with alpha.
+
+        Returns:
+            Surface: The shared surface.
+        """
+        if quality.alpha_overlays:
+            return self.get(size, pygame.SRCALPHA, fill = color)
+        return self.get(size, alpha = color[3], fill = color[:3])
+
+    def acquire(self, size, flags = 0, alpha = None, fill = None):
+        """Returns a scratch surface for the key that nobody else is using. It has to be given back with release().
+
+        Parameters:
+            size ((int, int)): The size of the surface.
+            flags (int): Surface flags, like pygame.SRCALPHA. Defaults to 0.
+            alpha (int): The surface alpha set with set_alpha(), None for none. Defaults to None.
+            fill ((int, int, int) or (int, int, int, int)): The color the surface is filled with, None to leave
+                whatever was drawn on it last time. Defaults to None.
+
+        Returns:
+            Surface: The scratch surface.
+        """
+        key = self._make_key(size, flags, alpha, fill)
+        free = self.free.get(key)
+        if free:
+            surface = free.pop()
+            self.reuses += 1
+            if fill is not None:
+                surface.fill(fill)
+        else:
+            surface = self._create(key)
+            # Scratch surfaces are drawn onto every time, the texture backend must not keep them
+            mark_volatile(surface)
+        self.keys[surface] = key
+        return surface
+
+    def release(self, surface):
+        """Gives a surface from acquire() back to the pool.
+
+        Parameters:
+            surface (Surface): The scratch surface.
+        """
+        key = self.keys.pop(surface)
+        self.free.setdefault(key, []).append(surface)
+
+    def clear(self):
+        """Drops every pooled surface, for example after the window size changed.
+        """
+        self.shared.clear()
+        self.free.clear()
+
+    def format_report(self):
+        """Returns the pool counters as text for the debug dump.
+        """
+        pooled = len(self.shared) + sum(len(free) for free in self.free.values())
+        return (f"Surface pool: {pooled} surfaces, {len(self.keys)} in use, "
+                f"{self.allocations} allocations, {self.reuses} reuses")
+
+# One pool shared by every scene
+surface_pool = SurfacePool()
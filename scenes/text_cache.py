@@ -0,0 +1,75 @@
+from collections import OrderedDict
+from quality import quality
+
+# How many rendered strings are kept. Every scene together shows a few hundred different strings at most,
+# so this keeps all the static text and lets old counter values fall out.
+DEFAULT_MAX_ENTRIES = 512
+
+class TextCache:
+    """Shared cache of rendered text, so a string that is drawn every frame is only rasterized once.
+
+    Entries are keyed by (font, text, antialias, color, background) and the least recently used entry is
+    dropped when the cache is full. The returned surfaces are shared, so callers must not draw onto them.
+    """
+
+    def __init__(self, max_entries = DEFAULT_MAX_ENTRIES):
+        """Default constructor.
+
+        Parameters:
+            max_entries (int): How many rendered strings to keep. Defaults to DEFAULT_MAX_ENTRIES.
+        """
+        self.max_entries = max_entries
+        self.surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def render(self, font, text, antialias, color, background = None):
+        """Drop-in replacement for font.render(text, antialias, color, background) that reuses earlier results.
+
+        Parameters:
+            font (Font): The font to render with.
+            text (string): The text to render.
+            antialias (bool): Whether the text gets smooth edges, which the lowest quality tier turns off.
+            color ((int, int, int)): The text color.
+            background ((int, int, int)): The background color, None for a transparent background. Defaults to None.
+
+        Returns:
+            Surface: The rendered text.
+        """
+        antialias = antialias and quality.antialias
+        # Colors can be pygame.Color objects, which can't be dict keys
+        color = tuple(color)
+        if background is not None:
+            background = tuple(background)
+        key = (font, text, antialias, color, background)
+
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color, background)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_entries:
+            self.surfaces.popitem(last = False)
+            self.evictions += 1
+        return surface
+
+    def clear(self):
+        """Drops every cached string, for example after the fonts changed.
+        """
+        self.surfaces.clear()
+
+    def format_report(self):
+        """Returns the hit/miss counters as text for the debug dump.
+        """
+        lookups = self.hits + self.misses
+        hit_rate = self.hits / lookups * 100 if lookups else 0
+        return (f"Text cache: {len(self.surfaces)}/{self.max_entries} strings, {self.hits} hits, "
+                f"{self.misses} misses ({hit_rate:.1f}% hit rate), {self.evictions} evictions")
+
+# One cache shared by every scene
+text_cache = TextCache()
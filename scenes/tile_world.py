@@ -0,0 +1,212 @@
+import json
+from collections import OrderedDict
+import pygame
+from asset_manager import assets
+
+# Levels bigger than the screen. A world is a grid of tiles plus large images, like a background painting, laid on
+# top of the tiles, and the colliders the player can't walk through. It is read from a JSON file in assets/worlds/:
+#
+#     {
+#         "tile_size": 40,                  size of one tile in pixels
+#         "chunk_tiles": 8,                 width and height of a chunk in tiles
+#         "size": [32, 18],                 width and height of the world in tiles
+#         "fill": [0, 0, 0],                color under everything
+#         "tiles": {"g": {"color": [...]}, "s": {"image": "assets/sand.png"}},
+#         "rows": ["gggs...", ...],         one letter per tile, a letter missing from "tiles" is left empty
+#         "images": [{"path": "...", "pos": [x, y], "size": [w, h]}],
+#         "colliders": [{"name": "left fence", "rect": [x, y, w, h]}]
+#     }
+#
+# The world is drawn in chunks. Each chunk is composed onto its own surface the first time it comes into view, and
+# only the chunks the camera sees are blitted, so drawing a frame costs the same however big the world is. Colliders
+# are indexed by chunk too, so moving the player only tests the ones nearby.
+
+WORLDS_DIR = "assets/worlds/"
+
+# How many composed chunks are kept. A 1280x720 view touches at most 20 chunks of 320 pixels, the rest is a margin
+# so walking back and forth does not compose the same chunks again.
+MAX_CACHED_CHUNKS = 48
+
+def load_world(name):
+    """Reads a world file from WORLDS_DIR.
+
+    Parameters:
+        name (string): The name of the world, like "playground" for assets/worlds/playground.json.
+
+    Returns:
+        TileWorld: The world.
+    """
+    with open(f"{WORLDS_DIR}{name}.json", "r") as f:
+        data = json.load(f)
+    return TileWorld(data)
+
+class TileWorld:
+    """A world read from a world file, drawn in chunks that are composed when they first come into view.
+    """
+
+    def __init__(self, data):
+        """Default constructor.
+
+        Parameters:
+            data (dict): The contents of a world file.
+        """
+        self.tile_size = data["tile_size"]
+        self.chunk_size = self.tile_size * data.get("chunk_tiles", 8)
+        columns, rows = data["size"]
+        self.size = (columns * self.tile_size, rows * self.tile_size)
+        self.rect = pygame.Rect((0, 0), self.size)
+        self.fill = tuple(data.get("fill", (0, 0, 0)))
+        self.tiles = data.get("tiles", {})
+        self.rows = data.get("rows", [])
+        self.images = [(entry["path"], pygame.Rect(entry["pos"], entry["size"])) for entry in data.get("images", [])]
+
+        # Colliders, and the colliders by (column, row) of every chunk they touch
+        self.colliders = [pygame.Rect(entry["rect"]) for entry in data.get("colliders", [])]
+        self.collider_cells = {}
+        for collider in self.colliders:
+            for cell in self._cells(collider):
+                self.collider_cells.setdefault(cell, []).append(collider)
+
+        # Composed chunk surfaces by (column, row), least recently drawn first
+        self.chunks = OrderedDict()
+        self.composed = 0
+
+    def _cells(self, rect):
+        # The (column, row) of every chunk rect touches
+        size = self.chunk_size
+        for column in range(rect.left // size, (rect.right - 1) // size + 1):
+            for row in range(rect.top // size, (rect.bottom - 1) // size + 1):
+                yield column, row
+
+    def _tile_surface(self, tile):
+        # Returns the image of a tile, or None for a tile that is a plain color
+        if "image" in tile:
+            return assets.get_image(tile["image"], (self.tile_size, self.tile_size))
+        return None
+
+    def _compose_chunk(self, column, row):
+        chunk_rect = pygame.Rect(column * self.chunk_size, row * self.chunk_size, self.chunk_size, self.chunk_size)
+        chunk_rect = chunk_rect.clip(self.rect)
+        surface = pygame.Surface(chunk_rect.size)
+        surface.fill(self.fill)
+
+        # Tiles inside the chunk
+        size = self.tile_size
+        for tile_row in range(chunk_rect.top // size, chunk_rect.bottom // size):
+            if tile_row >= len(self.rows):
+                break
+            letters = self.rows[tile_row]
+            for tile_column in range(chunk_rect.left // size, chunk_rect.right // size):
+                tile = self.tiles.get(letters[tile_column]) if tile_column < len(letters) else None
+                if tile is None:
+                    continue
+                tile_rect = pygame.Rect(tile_column * size - chunk_rect.x, tile_row * size - chunk_rect.y, size, size)
+                image = self._tile_surface(tile)
+                if image is None:
+                    surface.fill(tile["color"], tile_rect)
+                else:
+                    surface.blit(image, tile_rect)
+
+        # The parts of the large images that fall inside the chunk
+        for path, image_rect in self.images:
+            if image_rect.colliderect(chunk_rect):
+                image = assets.get_image(path, image_rect.size)
+                surface.blit(image, (image_rect.x - chunk_rect.x, image_rect.y - chunk_rect.y))
+
+        self.composed += 1
+        return surface
+
+    def get_chunk(self, column, row):
+        """Returns the surface of a chunk, composing it the first time.
+
+        Parameters:
+            column (int): The column of the chunk, counted in chunks from the left edge of the world.
+            row (int): The row of the chunk, counted in chunks from the top edge of the world.
+
+        Returns:
+            Surface: The chunk, which callers must not draw onto.
+        """
+        key = (column, row)
+        surface = self.chunks.get(key)
+        if surface is None:
+            surface = self._compose_chunk(column, row)
+            self.chunks[key] = surface
+            if len(self.chunks) > MAX_CACHED_CHUNKS:
+                self.chunks.popitem(last = False)
+        else:
+            self.chunks.move_to_end(key)
+        return surface
+
+    def draw(self, target, camera):
+        """Draws the chunks the camera sees onto target.
+
+        Parameters:
+            target (Surface): The surface to draw onto, usually the screen or a static layer.
+            camera (Camera): The camera, whose view is drawn at the top left of target.
+        """
+        view = camera.rect.clip(self.rect)
+        blits = []
+        for column, row in self._cells(view):
+            position = (column * self.chunk_size - camera.rect.x, row * self.chunk_size - camera.rect.y)
+            blits.append((self.get_chunk(column, row), position))
+        target.blits(blits, doreturn = False)
+
+    def colliders_near(self, rect):
+        """Returns the colliders in the chunks rect touches, which is every collider rect can touch.
+
+        Parameters:
+            rect (Rect): The area to test, like the player's collision box after a move.
+
+        Returns:
+            List[Rect]: The colliders, a collider touching several of those chunks is listed once for each.
+        """
+        colliders = []
+        for cell in self._cells(rect):
+            colliders.extend(self.collider_cells.get(cell, ()))
+        return colliders
+
+class Camera:
+    """The part of a world that is on screen. Scenes keep positions in world coordinates and the camera turns them
+    into screen coordinates when they are drawn.
+    """
+
+    def __init__(self, view_size, world_size):
+        """Default constructor.
+
+        Parameters:
+            view_size ((int, int)): The size of the screen.
+            world_size ((int, int)): The size of the world, which the view never leaves.
+        """
+        self.rect = pygame.Rect((0, 0), view_size)
+        self.world_rect = pygame.Rect((0, 0), world_size)
+
+    def follow(self, pos):
+        """Centers the view on pos, as far as the edges of the world allow.
+
+        Parameters:
+            pos (Vector2): The position to follow, usually the player's.
+
+        Returns:
+            bool: Whether the view moved.
+        """
+        rect = self.rect.copy()
+        rect.center = (round(pos.x), round(pos.y))
+        rect.clamp_ip(self.world_rect)
+        moved = rect.topleft != self.rect.topleft
+        self.rect = rect
+        return moved
+
+    def is_visible(self, rect):
+        """Returns whether any of rect, in world coordinates, is on screen.
+        """
+        return self.rect.colliderect(rect)
+
+    def to_screen(self, rect):
+        """Returns rect moved from world to screen coordinates.
+        """
+        return rect.move(-self.rect.x, -self.rect.y)
+
+    def to_screen_pos(self, pos):
+        """Returns pos moved from world to screen coordinates, as a tuple of ints.
+        """
+        return (int(pos[0]) - self.rect.x, int(pos[1]) - self.rect.y)
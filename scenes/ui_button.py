@@ -1,25 +1,112 @@
 import pygame
+from .font_registry import get_font
+from .text_cache import text_cache
+
+# Size of the square cells of a ButtonIndex, about the height of one row of menu buttons
+DEFAULT_CELL_SIZE = 64
 
 class Button:
     def __init__(self, text, pos, font, base_color, hover_color):
         self.text = text
+        # font can also be a size, which is looked up in the shared font registry
+        if isinstance(font, int):
+            font = get_font(font)
         self.font = font
         self.base_color = base_color
         self.hover_color = hover_color
 
-        self.surface = self.font.render(text, True, base_color)
+        # both looks are rendered once, hovering only switches between them
+        self.base_surface = text_cache.render(self.font, text, True, base_color)
+        self.hover_surface = text_cache.render(self.font, text, True, hover_color)
+        self.hovered = False
+        self.surface = self.base_surface
         self.rect = self.surface.get_rect(center=pos)
 
     def draw(self, screen):
         screen.blit(self.surface, self.rect)
 
-    def update(self, mouse_pos):
-        if self.rect.collidepoint(mouse_pos):
-            self.surface = self.font.render(self.text, True, self.hover_color)
-            return True
-        else:
-            self.surface = self.font.render(self.text, True, self.base_color)
+    def set_hovered(self, hovered):
+        # returns whether the look changed
+        if hovered == self.hovered:
             return False
-        
+        self.hovered = hovered
+        self.surface = self.hover_surface if hovered else self.base_surface
+        return True
+
+    def update(self, mouse_pos):
+        self.set_hovered(self.rect.collidepoint(mouse_pos))
+        return self.hovered
+
     def clicked(self, mouse_pos, event):
-        return event.type == pygame.MOUSEBUTTONDOWN and self.rect.collidepoint(mouse_pos)
\ No newline at end of file
+        return event.type == pygame.MOUSEBUTTONDOWN and self.rect.collidepoint(mouse_pos)
+
+class ButtonIndex:
+    """Spatial hash over a menu's buttons, so finding the button under the mouse only checks the buttons in one
+    cell instead of every button in the menu.
+    """
+
+    def __init__(self, buttons = None, cell_size = DEFAULT_CELL_SIZE):
+        """Default constructor.
+
+        Parameters:
+            buttons (List[Button]): The buttons to index. Defaults to None.
+            cell_size (int): The width and height of a cell in pixels. Defaults to DEFAULT_CELL_SIZE.
+        """
+        self.cell_size = cell_size
+        # Buttons by (column, row) of every cell they touch, in the order they were added
+        self.cells = {}
+        self.hovered = None
+        for button in buttons or []:
+            self.add(button)
+
+    def add(self, button):
+        """Adds a button to the index. Buttons must not move after they were added.
+
+        Parameters:
+            button (Button): The button to add.
+        """
+        rect = button.rect
+        for column in range(rect.left // self.cell_size, (rect.right - 1) // self.cell_size + 1):
+            for row in range(rect.top // self.cell_size, (rect.bottom - 1) // self.cell_size + 1):
+                self.cells.setdefault((column, row), []).append(button)
+
+    def hit(self, pos):
+        """Returns the button at pos, the first one added if several overlap, or None.
+
+        Parameters:
+            pos ((int, int)): The point to test, usually the mouse position.
+        """
+        x, y = pos
+        for button in self.cells.get((x // self.cell_size, y // self.cell_size), ()):
+            if button.rect.collidepoint(pos):
+                return button
+        return None
+
+    def update(self, mouse_pos):
+        """Moves the hover look to the button under the mouse, touching only the buttons whose look changes.
+
+        Parameters:
+            mouse_pos ((int, int)): The mouse position.
+
+        Returns:
+            Button: The hovered button, or None.
+        """
+        button = self.hit(mouse_pos)
+        if button is not self.hovered:
+            if self.hovered is not None:
+                self.hovered.set_hovered(False)
+            if button is not None:
+                button.set_hovered(True)
+            self.hovered = button
+        return button
+
+    def clicked(self, mouse_pos, event):
+        """Returns the button clicked by event, or None.
+
+        Parameters:
+            mouse_pos ((int, int)): The mouse position.
+            event (Event): The event to check.
+        """
+        if event.type != pygame.MOUSEBUTTONDOWN:
+            return None
+        return self.hit(mouse_pos)
@@ -0,0 +1,274 @@
+import pygame
+from quality import quality
+from texture_renderer import draw_rect
+from .text_cache import text_cache
+
+# A retained UI layer for HUD boxes and menus. Each widget keeps the surface it last composed and only composes
+# again when the values it is bound to change, so an unchanged panel costs one blit per frame.
+#
+# Values are bound by passing a function instead of a plain value, for example
+#     Label(font, lambda: f"Cash: {self.save["money"]}", (0, 0, 0), topright=(1270, 10))
+# The functions are called every frame to check for changes, so they should only read values, not compute much.
+# Widgets showing save data can watch() the save model instead, and are then only checked after it changed.
+
+def _resolve(value):
+    # Bound values are functions, everything else is used as is
+    return value() if callable(value) else value
+
+class Widget:
+    """Base class of every widget. A widget has a cached surface and the rect it is drawn to, and rebuilds the
+    surface whenever get_state() returns something different from the last time.
+    """
+
+    def __init__(self):
+        """Default constructor.
+        """
+        self.surface = None
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.state = None
+        self.dirty = True
+        # Whether the widget only checks its state after a watched save value changed
+        self.watching = False
+        # The quality tier the surface was composed at, text looks different at the lowest one
+        self.quality_level = None
+
+    def get_state(self):
+        """Returns everything the widget's look depends on. The cached surface is rebuilt when this changes.
+        """
+        return None
+
+    def compose(self, state):
+        """Draws the widget into a new self.surface and sets self.rect. Subclasses override this, the base widget
+        composes an empty surface.
+
+        Parameters:
+            state: What get_state() returned.
+        """
+        self.surface = pygame.Surface((0, 0))
+        self.rect = pygame.Rect(0, 0, 0, 0)
+
+    def invalidate(self):
+        """Forces the widget to compose again the next time it is drawn.
+        """
+        self.dirty = True
+
+    def watch(self, model, *keys):
+        """Stops checking the widget's state every frame and checks it only after one of the keys changed.
+
+        Parameters:
+            model (SaveModel): The save model the widget's values come from.
+            *keys (string): The dotted keys the widget shows, like "money" or "candy".
+
+        Returns:
+            Widget: The widget itself, so it can be watched where it is created.
+        """
+        for key in keys:
+            model.subscribe(key, self._on_change)
+        self.watching = True
+        return self
+
+    def _on_change(self, key, old, new):
+        self.dirty = True
+
+    def refresh(self):
+        """Composes the widget again if its state changed.
+
+        Returns:
+            bool: Whether the surface was rebuilt.
+        """
+        if self.quality_level != quality.level:
+            self.quality_level = quality.level
+            self.dirty = True
+        if self.watching and not self.dirty:
+            return False
+        state = self.get_state()
+        if not self.dirty and state == self.state:
+            return False
+        self.state = state
+        self.dirty = False
+        self.compose(state)
+        return True
+
+    def draw(self, target, offset = (0, 0)):
+        """Refreshes the widget if needed and blits its cached surface.
+
+        Parameters:
+            target (Surface): The surface to draw onto, usually the screen.
+            offset ((int, int)): Added to the widget's rect, for widgets inside a panel. Defaults to (0, 0).
+
+        Returns:
+            Rect: The area the widget covers on target.
+        """
+        self.refresh()
+        rect = self.rect.move(offset)
+        target.blit(self.surface, rect)
+        return rect
+
+class Label(Widget):
+    """One line of text, optionally on a box with a border, placed like Surface.get_rect().
+    """
+
+    def __init__(self, font, text, color, background = None, border_color = None, border_width = 0, padding = (0, 0), **anchor):
+        """Default constructor.
+
+        Parameters:
+            font (Font): The font to render with.
+            text (string or function): The text, or a function returning it.
+            color ((int, int, int) or function): The text color, or a function returning it.
+            background ((int, int, int)): The color of the box behind the text, None for no box. Defaults to None.
+            border_color ((int, int, int)): The color of the box's border, None for no border. Defaults to None.
+            border_width (int): The width of the border. Defaults to 0.
+            padding ((int, int)): Space between the text and the box edges, left/right and top/bottom. Defaults to (0, 0).
+            **anchor: Where the label goes, like for Surface.get_rect(), relative to the parent panel if there is one.
+        """
+        super().__init__()
+        self.font = font
+        self.text = text
+        self.color = color
+        self.background = background
+        self.border_color = border_color
+        self.border_width = border_width
+        self.padding = padding
+        self.anchor = anchor
+
+    def get_state(self):
+        return (_resolve(self.text), _resolve(self.color))
+
+    def compose(self, state):
+        text, color = state
+        text_surface = text_cache.render(self.font, text, True, color)
+        if self.background is None and self.border_color is None:
+            self.surface = text_surface
+        else:
+            pad_x, pad_y = self.padding
+            width, height = text_surface.get_size()
+            self.surface = pygame.Surface((width + pad_x * 2, height + pad_y * 2))
+            self.surface.fill(self.background if self.background is not None else (0, 0, 0))
+            if self.border_color is not None:
+                pygame.draw.rect(self.surface, self.border_color, self.surface.get_rect(), self.border_width)
+            self.surface.blit(text_surface, (pad_x, pad_y))
+        self.rect = self.surface.get_rect(**self.anchor)
+
+class TextList(Widget):
+    """Lines of text stacked top to bottom, for lists whose length changes, like the inventory's items.
+    """
+
+    def __init__(self, font, lines, color, line_height, empty_text = None, empty_color = None, **anchor):
+        """Default constructor.
+
+        Parameters:
+            font (Font): The font to render with.
+            lines (list or function): The lines, or a function returning them.
+            color ((int, int, int)): The text color.
+            line_height (int): How far apart the lines are.
+            empty_text (string): What to show when there are no lines. Defaults to None.
+            empty_color ((int, int, int)): The color of empty_text. Defaults to the text color.
+            **anchor: Where the list goes, like for Surface.get_rect(), relative to the parent panel if there is one.
+        """
+        super().__init__()
+        self.font = font
+        self.lines = lines
+        self.color = color
+        self.line_height = line_height
+        self.empty_text = empty_text
+        self.empty_color = empty_color if empty_color is not None else color
+        self.anchor = anchor
+
+    def get_state(self):
+        return tuple(_resolve(self.lines))
+
+    def compose(self, lines):
+        color = self.color
+        if not lines and self.empty_text is not None:
+            lines = (self.empty_text,)
+            color = self.empty_color
+
+        rendered = [text_cache.render(self.font, line, True, color) for line in lines]
+        width = max((surface.get_width() for surface in rendered), default = 0)
+        height = self.line_height * (len(rendered) - 1) + rendered[-1].get_height() if rendered else 0
+        self.surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        for i, surface in enumerate(rendered):
+            self.surface.blit(surface, (0, i * self.line_height))
+        self.rect = self.surface.get_rect(**self.anchor)
+
+class Panel(Widget):
+    """A box with a fill, an optional border and child widgets. An opaque panel is composed into one surface,
+    which is composed again when any child changes.
+
+    A fill with alpha below 255 gives a see-through panel. Text composed onto a see-through surface would not blend
+    with the scene behind it the way it does when drawn straight onto the screen, so a see-through panel only
+    caches its box and draws each child's cached surface on top of it. Below the quality tier with alpha overlays,
+    the box is an opaque surface with one surface alpha and its border is drawn on top of it.
+    """
+
+    def __init__(self, rect, fill, border_color = None, border_width = 0, children = None):
+        """Default constructor.
+
+        Parameters:
+            rect (Rect): Where the panel goes on the screen, or inside its parent panel.
+            fill ((int, int, int) or (int, int, int, int)): The background color, with optional alpha.
+            border_color ((int, int, int)): The border color, None for no border. Defaults to None.
+            border_width (int): The width of the border. Defaults to 0.
+            children (list): The widgets inside the panel, placed relative to its top left corner. Defaults to None.
+        """
+        super().__init__()
+        self.rect = pygame.Rect(rect)
+        self.fill = fill
+        self.border_color = border_color
+        self.border_width = border_width
+        self.children = list(children) if children else []
+        self.see_through = len(fill) == 4 and fill[3] < 255
+        # Whether the border is drawn onto the target instead of into the box, so surface alpha leaves it opaque
+        self.border_on_top = False
+
+    def refresh(self):
+        # The box of a see-through panel only changes with the quality tier, its children refresh themselves when
+        # drawn
+        if self.quality_level != quality.level:
+            self.quality_level = quality.level
+            self.dirty = True
+        children_changed = False
+        if not self.see_through:
+            for child in self.children:
+                if child.refresh():
+                    children_changed = True
+        if not self.dirty and not children_changed:
+            return False
+        self.dirty = False
+        self.compose(None)
+        return True
+
+    def invalidate(self):
+        super().invalidate()
+        for child in self.children:
+            child.invalidate()
+
+    def compose(self, state):
+        self.border_on_top = False
+        if self.see_through and quality.alpha_overlays:
+            self.surface = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+            self.surface.fill(self.fill)
+        elif self.see_through:
+            self.surface = pygame.Surface(self.rect.size)
+            self.surface.fill(self.fill[:3])
+            self.surface.set_alpha(self.fill[3])
+            self.border_on_top = True
+        else:
+            self.surface = pygame.Surface(self.rect.size)
+            self.surface.fill(self.fill)
+
+        if self.border_color is not None and not self.border_on_top:
+            pygame.draw.rect(self.surface, self.border_color, self.surface.get_rect(), self.border_width)
+
+        if not self.see_through:
+            for child in self.children:
+                child.draw(self.surface)
+
+    def draw(self, target, offset = (0, 0)):
+        rect = super().draw(target, offset)
+        if self.border_on_top and self.border_color is not None:
+            draw_rect(target, self.border_color, rect, self.border_width)
+        if self.see_through:
+            for child in self.children:
+                child.draw(target, rect.topleft)
+        return rect
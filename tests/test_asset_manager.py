@@ -0,0 +1,117 @@
+import os
+import tempfile
+import unittest
+
+# Run "python -m unittest discover -s tests" from the game folder
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import pygame
+from asset_manager import AssetManager, surface_bytes
+
+class AssetManagerEvictionTest(unittest.TestCase):
+    """Fills a manager with small opaque images from a temporary folder and checks what gets evicted.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        pygame.display.init()
+        # Images are converted to the display format
+        pygame.display.set_mode((1, 1))
+
+    @classmethod
+    def tearDownClass(cls):
+        pygame.display.quit()
+
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.paths = []
+        for name in ("a", "b", "c", "d"):
+            path = os.path.join(self.folder.name, f"{name}.png")
+            image = pygame.Surface((10, 10))
+            image.fill((20, 40, 60))
+            pygame.image.save(image, path)
+            self.paths.append(path)
+
+        # An empty baked folder and no pack, so every image is decoded from its file
+        self.manager = AssetManager(os.path.join(self.folder.name, "baked"))
+        self.manager.pack_opened = True
+        self.manager.owner = "scene one"
+
+        # The size of one image in the display format
+        self.original_bytes = surface_bytes(pygame.Surface((10, 10)).convert())
+
+    def tearDown(self):
+        self.folder.cleanup()
+
+    def load(self, index, owner = None):
+        return self.manager.get_image(self.paths[index], None, "opaque", owner)
+
+    def keys(self):
+        return [key[0] for key in self.manager.surfaces]
+
+    def test_accounts_every_surface(self):
+        self.load(0)
+        self.load(1)
+        self.assertEqual(self.manager.total_bytes, self.original_bytes * 2)
+        self.assertEqual(self.manager.evictions, 0)
+        self.assertEqual(self.manager.surface_owners[(self.paths[0], None, "opaque")], {"scene one"})
+
+    def test_evicts_least_recently_used_of_other_scenes(self):
+        self.manager.memory_budget = self.original_bytes * 3
+        self.load(0, "scene zero")
+        self.load(1, "scene zero")
+        self.load(2, "scene zero")
+        # Using the first image again makes the second the least recently used
+        self.load(0, "scene zero")
+
+        self.load(3)
+        self.assertEqual(self.keys(), [self.paths[2], self.paths[0], self.paths[3]])
+        self.assertEqual(self.manager.evictions, 1)
+        self.assertEqual(self.manager.total_bytes, self.original_bytes * 3)
+        evicted = (self.paths[1], None, "opaque")
+        self.assertNotIn(evicted, self.manager.surface_sizes)
+        self.assertNotIn(evicted, self.manager.surface_owners)
+        self.assertNotIn(evicted, self.manager.surface_formats)
+
+    def test_keeps_surfaces_of_the_current_scene(self):
+        self.manager.memory_budget = self.original_bytes * 2
+        self.load(0)
+        self.load(1, "scene zero")
+        self.load(2)
+
+        # The current scene's first image is older, but only the other scene's image can go
+        self.assertEqual(self.keys(), [self.paths[0], self.paths[2]])
+        self.assertEqual(self.manager.evictions, 1)
+
+        # With only the current scene's surfaces left, the cache goes over budget instead
+        self.load(3)
+        self.assertEqual(self.keys(), [self.paths[0], self.paths[2], self.paths[3]])
+        self.assertEqual(self.manager.total_bytes, self.original_bytes * 3)
+
+    def test_shared_surface_is_kept_for_its_current_owner(self):
+        self.manager.memory_budget = self.original_bytes * 2
+        self.load(0, "scene zero")
+        # The current scene asks for the same image, which tags it without loading it again
+        self.assertIs(self.load(0), self.load(0, "scene zero"))
+        self.load(1, "scene zero")
+        self.load(2, "scene zero")
+        self.assertEqual(self.keys(), [self.paths[0], self.paths[2]])
+
+    def test_originals_of_scaled_copies_can_be_evicted(self):
+        original = (self.paths[0], None, "alpha")
+        self.assertEqual(self.manager.get_size(self.paths[0]), (10, 10))
+        self.manager.get_image(self.paths[0], (5, 5), "opaque")
+        # The original is cached for more copies, but no scene holds it
+        self.assertEqual(self.manager.surface_owners[original], set())
+
+        self.manager.memory_budget = self.manager.total_bytes
+        self.manager.get_image(self.paths[1], (5, 5), "opaque")
+        self.assertNotIn(original, self.manager.surfaces)
+        self.assertIn((self.paths[0], (5, 5), "opaque"), self.manager.surfaces)
+
+    def test_asked_for_original_belongs_to_the_scene(self):
+        self.manager.get_image(self.paths[0], (5, 5), "opaque")
+        self.manager.get_image(self.paths[0], None, "alpha")
+        self.assertEqual(self.manager.surface_owners[(self.paths[0], None, "alpha")], {"scene one"})
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+import json
+import os
+import tempfile
+import unittest
+
+# Run "python -m unittest discover -s tests" from the game folder
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import pygame
+from asset_pack import AssetPack, build_pack, open_pack
+
+class AssetPackTest(unittest.TestCase):
+    """Builds a pack from a small manifest in a temporary folder and reads it back.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        pygame.display.init()
+        # get_image compares against the display's pixel layout
+        pygame.display.set_mode((1, 1))
+
+    @classmethod
+    def tearDownClass(cls):
+        pygame.display.quit()
+
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.image_path = os.path.join(self.folder.name, "sprite.png")
+        self.pack_path = os.path.join(self.folder.name, "assets.pack")
+        self.manifest_path = os.path.join(self.folder.name, "manifest.json")
+
+        # Opaque left half, half transparent right half
+        image = pygame.Surface((8, 4), pygame.SRCALPHA)
+        image.fill((200, 30, 40, 255), (0, 0, 4, 4))
+        image.fill((10, 220, 90, 128), (4, 0, 4, 4))
+        pygame.image.save(image, self.image_path)
+
+        manifest = {"assets": [
+            {"path": self.image_path, "size": [8, 4], "format": "auto"},
+            {"path": self.image_path, "size": [16, 8], "format": "alpha"},
+        ]}
+        with open(self.manifest_path, "w") as f:
+            json.dump(manifest, f)
+
+    def tearDown(self):
+        self.folder.cleanup()
+
+    def test_round_trip_keeps_the_pixels(self):
+        self.assertEqual(build_pack(self.manifest_path, self.pack_path), 2)
+        pack = AssetPack(self.pack_path)
+        original = pygame.image.load(self.image_path)
+
+        for size, fmt in (((8, 4), "auto"), ((16, 8), "alpha")):
+            surface = pack.get_image(self.image_path, size, fmt)
+            self.assertIsNotNone(surface)
+            self.assertEqual(surface.get_size(), size)
+            expected = pygame.transform.scale(original, size)
+            self.assertEqual(pygame.image.tobytes(surface, "RGBA"), pygame.image.tobytes(expected, "RGBA"))
+
+        self.assertEqual(pack.get_size(self.image_path), (8, 4))
+
+    def test_missing_entries_are_not_found(self):
+        build_pack(self.manifest_path, self.pack_path)
+        pack = AssetPack(self.pack_path)
+        self.assertIsNone(pack.get_image(self.image_path, (8, 4), "alpha"))
+        self.assertIsNone(pack.get_image("assets/not_packed.png", (8, 4), "auto"))
+
+    def test_edited_source_is_stale(self):
+        build_pack(self.manifest_path, self.pack_path)
+        # A different file size changes the stamp even within the file system's time resolution
+        pygame.image.save(pygame.Surface((9, 4)), self.image_path)
+        pack = AssetPack(self.pack_path)
+        self.assertFalse(pack.is_fresh(self.image_path))
+        self.assertIsNone(pack.get_image(self.image_path, (8, 4), "auto"))
+        self.assertIsNone(pack.get_size(self.image_path))
+
+    def test_invalid_pack_is_ignored(self):
+        with open(self.pack_path, "wb") as f:
+            f.write(b"not a pack at all")
+        self.assertIsNone(open_pack(self.pack_path))
+        self.assertIsNone(open_pack(os.path.join(self.folder.name, "missing.pack")))
+
+    def test_short_pack_is_ignored(self):
+        # Empty, and shorter than the header
+        for contents in (b"", b"SRPK"):
+            with open(self.pack_path, "wb") as f:
+                f.write(contents)
+            self.assertIsNone(open_pack(self.pack_path))
+
+    def test_truncated_pack_is_ignored(self):
+        build_pack(self.manifest_path, self.pack_path)
+        with open(self.pack_path, "r+b") as f:
+            f.truncate(os.path.getsize(self.pack_path) - 1)
+        self.assertIsNone(open_pack(self.pack_path))
+
+if __name__ == "__main__":
+    unittest.main()
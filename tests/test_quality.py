@@ -0,0 +1,82 @@
+import unittest
+
+# Run "python -m unittest discover -s tests" from the game folder
+from quality import (FRAME_BUDGET_MS, QUALITY_HIGH, QUALITY_LOW, QUALITY_MEDIUM, RAISE_FRAMES, SAMPLE_FRAMES,
+                     QualityController)
+
+# Frame times well over and well under the thresholds
+SLOW_MS = FRAME_BUDGET_MS * 1.5
+FAST_MS = FRAME_BUDGET_MS * 0.2
+
+class QualityControllerTest(unittest.TestCase):
+
+    def feed(self, controller, work_ms, frames):
+        # Returns the frames, counted from 1, at which the tier changed
+        return [frame for frame in range(1, frames + 1) if controller.record(work_ms)]
+
+    def test_slow_frames_lower_once_the_window_is_full(self):
+        controller = QualityController(QUALITY_HIGH)
+        self.assertEqual(self.feed(controller, SLOW_MS, SAMPLE_FRAMES), [SAMPLE_FRAMES])
+        self.assertEqual(controller.level, QUALITY_MEDIUM)
+        self.assertEqual(controller.changes, 1)
+
+        # The new tier gets a whole window of its own frames before it is judged
+        self.assertEqual(self.feed(controller, SLOW_MS, SAMPLE_FRAMES * 2), [SAMPLE_FRAMES])
+        self.assertEqual(controller.level, QUALITY_LOW)
+
+    def test_low_is_the_floor(self):
+        controller = QualityController(QUALITY_LOW)
+        self.assertEqual(self.feed(controller, SLOW_MS, SAMPLE_FRAMES * 3), [])
+        self.assertEqual(controller.level, QUALITY_LOW)
+
+    def test_frames_near_the_budget_keep_the_tier(self):
+        controller = QualityController(QUALITY_MEDIUM)
+        self.assertEqual(self.feed(controller, FRAME_BUDGET_MS * 0.7, SAMPLE_FRAMES + RAISE_FRAMES * 2), [])
+
+    def test_fast_frames_raise_after_a_long_stretch(self):
+        controller = QualityController(QUALITY_LOW)
+        # The first full window is the first frame with headroom
+        changes = self.feed(controller, FAST_MS, SAMPLE_FRAMES + RAISE_FRAMES)
+        self.assertEqual(changes, [SAMPLE_FRAMES - 1 + RAISE_FRAMES])
+        self.assertEqual(controller.level, QUALITY_MEDIUM)
+
+    def test_one_slow_stretch_restarts_the_count(self):
+        controller = QualityController(QUALITY_MEDIUM)
+        self.feed(controller, FAST_MS, SAMPLE_FRAMES + RAISE_FRAMES // 2)
+        # Enough slow frames to lift the average over the raise threshold, not over the lower one
+        self.feed(controller, FRAME_BUDGET_MS * 0.8, SAMPLE_FRAMES)
+        self.assertEqual(controller.headroom_frames, 0)
+        self.assertEqual(controller.level, QUALITY_MEDIUM)
+
+    def test_high_is_the_ceiling(self):
+        controller = QualityController(QUALITY_HIGH)
+        self.assertEqual(self.feed(controller, FAST_MS, SAMPLE_FRAMES + RAISE_FRAMES * 2), [])
+
+    def test_fixed_controller_ignores_frame_times(self):
+        controller = QualityController(QUALITY_HIGH, adaptive = False)
+        self.assertEqual(self.feed(controller, SLOW_MS, SAMPLE_FRAMES * 2), [])
+        self.assertEqual(controller.level, QUALITY_HIGH)
+
+    def test_set_level_starts_over(self):
+        controller = QualityController(QUALITY_HIGH)
+        self.feed(controller, SLOW_MS, SAMPLE_FRAMES - 1)
+        controller.set_level(QUALITY_HIGH)
+        self.assertEqual(controller.changes, 0)
+        self.assertEqual(self.feed(controller, SLOW_MS, SAMPLE_FRAMES - 1), [])
+
+    def test_tiers_switch_drawing(self):
+        expected = {
+            QUALITY_LOW: (False, False, False),
+            QUALITY_MEDIUM: (True, False, False),
+            QUALITY_HIGH: (True, True, True),
+        }
+        for level, flags in expected.items():
+            controller = QualityController(level)
+            self.assertEqual((controller.antialias, controller.alpha_overlays, controller.decorations), flags)
+
+    def test_format_report(self):
+        controller = QualityController(QUALITY_MEDIUM, adaptive = False)
+        self.assertEqual(controller.format_report(), "Quality: medium (fixed), 0.0 ms average frame, 0 tier changes")
+
+if __name__ == "__main__":
+    unittest.main()
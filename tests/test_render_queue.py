@@ -0,0 +1,88 @@
+import os
+import unittest
+
+# Run "python -m unittest discover -s tests" from the game folder
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import pygame
+from scenes.render_queue import LAYER_CHARACTERS, LAYER_GROUND, LAYER_OVERHEAD, RenderQueue
+from scenes.tile_world import Camera
+
+class Recorder:
+    """Stands in for the screen and remembers the blits() calls it gets.
+    """
+
+    def __init__(self):
+        self.calls = []
+
+    def blits(self, blit_sequence, doreturn = True):
+        self.calls.append(list(blit_sequence))
+
+class RenderQueueTest(unittest.TestCase):
+
+    def setUp(self):
+        self.queue = RenderQueue()
+        self.target = Recorder()
+        # Surfaces are only passed through, names make the order readable
+        self.names = {}
+
+    def submit(self, name, rect, layer = LAYER_CHARACTERS, depth = None):
+        surface = pygame.Surface((1, 1))
+        self.names[id(surface)] = name
+        self.queue.submit(surface, pygame.Rect(rect), layer, depth)
+
+    def drawn(self):
+        return [[self.names[id(surface)] for surface, rect in call] for call in self.target.calls]
+
+    def test_characters_are_sorted_by_their_feet(self):
+        self.submit("front", (0, 100, 10, 50))
+        self.submit("back", (0, 0, 10, 50))
+        # Taller but standing in between
+        self.submit("middle", (0, 0, 10, 120))
+        self.queue.flush(self.target)
+        self.assertEqual(self.drawn(), [["back", "middle", "front"]])
+
+    def test_layers_are_drawn_in_order(self):
+        self.submit("overhead", (0, 0, 10, 10), LAYER_OVERHEAD)
+        self.submit("character", (0, 0, 10, 10))
+        self.submit("ground", (0, 500, 10, 10), LAYER_GROUND)
+        self.queue.flush(self.target)
+        self.assertEqual(self.drawn(), [["ground"], ["character"], ["overhead"]])
+
+    def test_other_layers_keep_submission_order(self):
+        self.submit("first", (0, 300, 10, 10), LAYER_OVERHEAD)
+        self.submit("second", (0, 0, 10, 10), LAYER_OVERHEAD)
+        self.submit("third", (0, 100, 10, 10), LAYER_OVERHEAD)
+        self.queue.flush(self.target)
+        self.assertEqual(self.drawn(), [["first", "second", "third"]])
+
+    def test_equal_depths_keep_submission_order(self):
+        self.submit("first", (50, 0, 10, 40))
+        self.submit("second", (0, 20, 10, 20))
+        self.queue.flush(self.target)
+        self.assertEqual(self.drawn(), [["first", "second"]])
+
+    def test_explicit_depth_wins(self):
+        self.submit("low", (0, 100, 10, 10), depth = 0)
+        self.submit("high", (0, 0, 10, 10))
+        self.submit("shadow", (0, 0, 10, 10), LAYER_OVERHEAD, depth = 1)
+        self.submit("bubble", (0, 0, 10, 10), LAYER_OVERHEAD)
+        self.queue.flush(self.target)
+        self.assertEqual(self.drawn(), [["low", "high"], ["bubble", "shadow"]])
+
+    def test_flush_empties_the_queue(self):
+        self.submit("once", (0, 0, 10, 10))
+        self.queue.flush(self.target)
+        self.queue.flush(self.target)
+        self.assertEqual(self.drawn(), [["once"]])
+
+    def test_camera_culls_and_moves_to_screen(self):
+        camera = Camera((100, 100), (400, 400))
+        camera.follow(pygame.Vector2(200, 200))
+        self.submit("outside", (0, 0, 20, 20))
+        self.submit("edge", (140, 145, 20, 20))
+        self.queue.flush(self.target, camera)
+        self.assertEqual(self.drawn(), [["edge"]])
+        self.assertEqual(self.target.calls[0][0][1], pygame.Rect(-10, -5, 20, 20))
+
+if __name__ == "__main__":
+    unittest.main()
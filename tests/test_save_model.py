@@ -0,0 +1,119 @@
+import json
+import os
+import tempfile
+import unittest
+
+# Run "python -m unittest discover -s tests" from the game folder
+import save_manager
+from save_manager import DEFAULT_DATA, SaveModel, load_save, save_data
+
+class SaveModelEventTest(unittest.TestCase):
+    """Checks which changes reach which subscribers.
+    """
+
+    def setUp(self):
+        self.model = SaveModel({"money": 5, "candy": {"woozers": 1, "twizzlers": 2}})
+        self.events = []
+
+    def record(self, name):
+        return lambda key, old, new: self.events.append((name, key, old, new))
+
+    def test_top_level_change(self):
+        self.model.subscribe("money", self.record("money"))
+        self.model["money"] = 7
+        self.assertEqual(self.events, [("money", "money", 5, 7)])
+        self.assertTrue(self.model.changed)
+
+    def test_nested_change_reaches_prefix_and_everything_subscribers(self):
+        self.model.subscribe("candy", self.record("candy"))
+        self.model.subscribe("candy.woozers", self.record("woozers"))
+        self.model.subscribe("candy.twizzlers", self.record("twizzlers"))
+        self.model.subscribe(None, self.record("all"))
+        self.model["candy"]["woozers"] += 1
+        self.assertEqual(sorted(self.events), [
+            ("all", "candy.woozers", 1, 2),
+            ("candy", "candy.woozers", 1, 2),
+            ("woozers", "candy.woozers", 1, 2),
+        ])
+
+    def test_prefix_needs_a_whole_key(self):
+        self.model.subscribe("cand", self.record("cand"))
+        self.model["candy"]["woozers"] = 3
+        self.assertEqual(self.events, [])
+
+    def test_equal_value_publishes_nothing(self):
+        self.model.subscribe(None, self.record("all"))
+        self.model["money"] = 5
+        self.model["candy"]["woozers"] = 1
+        self.assertEqual(self.events, [])
+        self.assertFalse(self.model.changed)
+
+    def test_unsubscribe(self):
+        callback = self.model.subscribe("money", self.record("money"))
+        self.model.unsubscribe("money", callback)
+        self.model["money"] = 9
+        self.assertEqual(self.events, [])
+        # Unsubscribing twice is harmless
+        self.model.unsubscribe("money", callback)
+
+    def test_stored_dictionaries_are_wrapped(self):
+        self.model.subscribe(None, self.record("all"))
+        self.model["settings"] = {"audio": 100}
+        self.assertIsInstance(self.model["settings"], SaveModel)
+        self.model["settings"]["audio"] = 50
+        self.assertEqual(self.events[-1], ("all", "settings.audio", 100, 50))
+
+    def test_removals_publish_none(self):
+        self.model.subscribe(None, self.record("all"))
+        self.assertEqual(self.model.pop("money"), 5)
+        self.model["candy"].setdefault("Skizzles", 0)
+        self.assertEqual(self.events, [("all", "money", 5, None), ("all", "candy.Skizzles", None, 0)])
+
+class SaveDataTest(unittest.TestCase):
+    """Loads and writes a save file in a temporary folder instead of the game's saves.
+    """
+
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.old_save_path = save_manager.SAVE_PATH
+        save_manager.SAVE_PATH = os.path.join(self.folder.name, "save.json")
+
+    def tearDown(self):
+        save_manager.SAVE_PATH = self.old_save_path
+        self.folder.cleanup()
+
+    def read(self):
+        with open(save_manager.SAVE_PATH, "r") as f:
+            return json.load(f)
+
+    def test_missing_file_gets_the_defaults(self):
+        model = load_save()
+        self.assertEqual(model, DEFAULT_DATA)
+        self.assertEqual(self.read(), DEFAULT_DATA)
+        # Changing the model leaves the defaults alone
+        model["candy"]["woozers"] = 10
+        self.assertEqual(DEFAULT_DATA["candy"]["woozers"], 0)
+
+    def test_unchanged_model_is_not_written(self):
+        model = load_save()
+        os.remove(save_manager.SAVE_PATH)
+        save_data(model)
+        self.assertFalse(os.path.exists(save_manager.SAVE_PATH))
+
+    def test_changed_model_is_written_once(self):
+        model = load_save()
+        model["money"] = 25
+        save_data(model)
+        self.assertEqual(self.read()["money"], 25)
+        self.assertFalse(model.changed)
+
+        os.remove(save_manager.SAVE_PATH)
+        save_data(model)
+        self.assertFalse(os.path.exists(save_manager.SAVE_PATH))
+
+    def test_plain_dictionaries_are_always_written(self):
+        save_data({"money": 3})
+        self.assertEqual(self.read(), {"money": 3})
+
+if __name__ == "__main__":
+    unittest.main()
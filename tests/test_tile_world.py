@@ -0,0 +1,146 @@
+import os
+import unittest
+
+# Run "python -m unittest discover -s tests" from the game folder, world files are read relative to it
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import pygame
+from scenes.tile_world import MAX_CACHED_CHUNKS, Camera, TileWorld, load_world
+
+RED = (200, 0, 0)
+GREEN = (0, 200, 0)
+FILL = (10, 10, 10)
+
+def color_world(columns = 8, rows = 4, chunk_tiles = 2):
+    """Returns a world of 10 pixel tiles in a red and green checkerboard, with no images to load.
+    """
+    pattern = "rg" * columns
+    data = {
+        "tile_size": 10,
+        "chunk_tiles": chunk_tiles,
+        "size": [columns, rows],
+        "fill": list(FILL),
+        "tiles": {"r": {"color": list(RED)}, "g": {"color": list(GREEN)}},
+        "rows": [pattern[row % 2:row % 2 + columns] for row in range(rows)],
+        "colliders": [{"name": "wall", "rect": [15, 0, 10, 40]}],
+    }
+    return TileWorld(data)
+
+class LoadWorldTest(unittest.TestCase):
+
+    def test_playground(self):
+        world = load_world("playground")
+        # The painting and a lawn to the right of it, wider than the screen so the camera scrolls
+        self.assertEqual(world.size, (1600, 720))
+        self.assertEqual(world.chunk_size, 320)
+        self.assertEqual(len(world.colliders), 8)
+        self.assertEqual(world.images, [("assets/backgrounds/playground.png", pygame.Rect(0, 0, 1280, 720))])
+
+    def test_colliders_near(self):
+        world = load_world("playground")
+        left_fence = pygame.Rect(0, 0, 10, 720)
+        right_fence = pygame.Rect(1590, 0, 10, 720)
+        near_left = world.colliders_near(pygame.Rect(20, 400, 40, 40))
+        self.assertIn(left_fence, near_left)
+        self.assertNotIn(right_fence, near_left)
+        self.assertIn(right_fence, world.colliders_near(pygame.Rect(1540, 400, 40, 40)))
+        # A box over two chunks gets the colliders of both
+        self.assertGreaterEqual(len(world.colliders_near(pygame.Rect(300, 400, 40, 40))), 2)
+
+    def test_missing_world(self):
+        with self.assertRaises(FileNotFoundError):
+            load_world("no such world")
+
+class TileWorldTest(unittest.TestCase):
+
+    def test_chunks_are_composed_once(self):
+        world = color_world()
+        chunk = world.get_chunk(0, 0)
+        self.assertIs(world.get_chunk(0, 0), chunk)
+        world.get_chunk(1, 0)
+        self.assertEqual(world.composed, 2)
+
+    def test_chunks_have_their_tiles(self):
+        world = color_world()
+        chunk = world.get_chunk(1, 1)
+        self.assertEqual(chunk.get_size(), (20, 20))
+        # Tile (2, 2) is red like tile (0, 0), tile (3, 2) is green
+        self.assertEqual(chunk.get_at((5, 5))[:3], RED)
+        self.assertEqual(chunk.get_at((15, 5))[:3], GREEN)
+
+    def test_edge_chunks_are_clipped_to_the_world(self):
+        world = color_world(columns = 5, rows = 3)
+        self.assertEqual(world.get_chunk(2, 1).get_size(), (10, 10))
+
+    def test_least_recently_drawn_chunk_is_dropped(self):
+        world = color_world(columns = 10, rows = 10, chunk_tiles = 1)
+        for index in range(MAX_CACHED_CHUNKS):
+            world.get_chunk(index % 10, index // 10)
+        # Using the first chunk again leaves the second as the oldest
+        world.get_chunk(0, 0)
+        world.get_chunk(9, 9)
+        self.assertEqual(len(world.chunks), MAX_CACHED_CHUNKS)
+        self.assertIn((0, 0), world.chunks)
+        self.assertNotIn((1, 0), world.chunks)
+        self.assertEqual(world.composed, MAX_CACHED_CHUNKS + 1)
+
+    def test_draw_shows_the_camera_view(self):
+        world = color_world()
+        camera = Camera((30, 20), world.size)
+        camera.follow(pygame.Vector2(40, 20))
+        target = pygame.Surface((30, 20))
+        target.fill((255, 255, 255))
+        world.draw(target, camera)
+
+        # The view starts at (25, 10), in the middle of tile (2, 1), which is green
+        self.assertEqual(camera.rect.topleft, (25, 10))
+        self.assertEqual(target.get_at((0, 0))[:3], GREEN)
+        self.assertEqual(target.get_at((5, 0))[:3], RED)
+        self.assertEqual(target.get_at((5, 10))[:3], GREEN)
+        self.assertEqual(target.get_at((29, 19))[:3], GREEN)
+        # Only the chunks in view are composed
+        self.assertEqual(sorted(world.chunks), [(1, 0), (1, 1), (2, 0), (2, 1)])
+
+    def test_colliders_are_indexed_by_chunk(self):
+        world = color_world()
+        wall = pygame.Rect(15, 0, 10, 40)
+        self.assertEqual(world.colliders_near(pygame.Rect(0, 0, 5, 5)), [wall])
+        self.assertEqual(world.colliders_near(pygame.Rect(50, 0, 5, 5)), [])
+
+class CameraTest(unittest.TestCase):
+
+    def setUp(self):
+        self.camera = Camera((100, 50), (400, 200))
+
+    def test_follow_centers_the_view(self):
+        self.assertTrue(self.camera.follow(pygame.Vector2(200, 100)))
+        self.assertEqual(self.camera.rect, pygame.Rect(150, 75, 100, 50))
+        self.assertFalse(self.camera.follow(pygame.Vector2(200.4, 99.6)))
+
+    def test_follow_stays_inside_the_world(self):
+        self.assertFalse(self.camera.follow(pygame.Vector2(10, 10)))
+        self.assertEqual(self.camera.rect.topleft, (0, 0))
+        self.assertTrue(self.camera.follow(pygame.Vector2(1000, 1000)))
+        self.assertEqual(self.camera.rect.bottomright, (400, 200))
+
+    def test_world_smaller_than_the_view(self):
+        camera = Camera((100, 50), (80, 40))
+        camera.follow(pygame.Vector2(70, 30))
+        self.assertEqual(camera.rect.center, camera.world_rect.center)
+
+    def test_transforms(self):
+        self.camera.follow(pygame.Vector2(200, 100))
+        rect = pygame.Rect(160, 80, 10, 10)
+        self.assertEqual(self.camera.to_screen(rect), pygame.Rect(10, 5, 10, 10))
+        self.assertEqual(rect, pygame.Rect(160, 80, 10, 10))
+        self.assertEqual(self.camera.to_screen_pos(pygame.Vector2(160.7, 80.2)), (10, 5))
+        self.assertIsInstance(self.camera.to_screen_pos((160.7, 80.2))[0], int)
+
+    def test_is_visible(self):
+        self.camera.follow(pygame.Vector2(200, 100))
+        self.assertTrue(self.camera.is_visible(pygame.Rect(140, 70, 20, 20)))
+        self.assertFalse(self.camera.is_visible(pygame.Rect(0, 0, 20, 20)))
+        # Touching the edge is not on screen
+        self.assertFalse(self.camera.is_visible(pygame.Rect(130, 75, 20, 20)))
+
+if __name__ == "__main__":
+    unittest.main()
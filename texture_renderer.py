@@ -0,0 +1,315 @@
+import weakref
+import pygame
+from window import LOGICAL_SIZE, open_window, toggle_fullscreen
+
+# Optional backend that draws every frame with an SDL2 Renderer instead of composing it on the CPU, turned on by
+# setting "renderer" to "texture". Scenes draw onto a TextureFrame instead of a Surface. Every surface blitted onto
+# it, like an image from the asset manager, a line of text from the text cache or a scene's static layer, is
+# uploaded to a texture the first time and only copied on the GPU after that. The frame is drawn into a texture of
+# LOGICAL_SIZE, which the renderer scales to the window when it is presented.
+#
+# The window is the usual SCALED display window from open_window(). pygame already draws it through a Renderer,
+# and the backend borrows that renderer, so convert() and everything else in the display module keep working.
+#
+# A TextureFrame has the parts of the Surface interface that scenes use: blit, blits, fill and the size getters.
+# pygame.draw only works on real surfaces, so scenes draw shapes onto the screen with draw_rect() and draw_circle()
+# from this module, and copy the screen with capture(). Those work on both backends. The surface backend stays
+# the default and the fallback for pygame builds without the SDL2 module. Without a GPU, SDL's software renderer
+# does the blending of the texture backend on the CPU, which is slower than the surface backend's own blitters.
+# Compare the two with "python benchmark_renderers.py".
+
+try:
+    from pygame._sdl2.video import Window, Renderer, Texture
+except ImportError:
+    # pygame builds without the experimental SDL2 module can only use the surface backend
+    Renderer = None
+
+# Surfaces whose pixels change after they were drawn, like the scratch surfaces of the surface pool. They are
+# uploaded again every time they are blitted instead of keeping a texture
+_volatile_surfaces = weakref.WeakSet()
+
+# How many shapes drawn by draw_rect() and draw_circle() keep their surface
+MAX_CACHED_SHAPES = 64
+
+def texture_backend_available():
+    """Returns whether this pygame build has the SDL2 video module the texture backend needs.
+    """
+    return Renderer is not None
+
+def mark_volatile(surface):
+    """Tells the texture backend that surface is drawn onto after it has been blitted, so its texture can't be
+    kept. Every other surface blitted onto a TextureFrame must not change once it has been drawn.
+
+    Parameters:
+        surface (Surface): The surface, like a scratch surface that is filled again every frame.
+    """
+    _volatile_surfaces.add(surface)
+
+def draw_rect(target, color, rect, width = 0, border_radius = 0):
+    """Draws a rect onto a Surface with pygame.draw.rect(), or onto a TextureFrame with the renderer, so scenes
+    can draw shapes onto the screen without knowing which backend is on.
+
+    Parameters:
+        target (Surface or TextureFrame): The surface to draw onto, usually the screen.
+        color ((int, int, int)): The color.
+        rect (Rect): The rect.
+        width (int): The width of the outline, 0 to fill the rect. Defaults to 0.
+        border_radius (int): The radius of rounded corners, 0 for square ones. Defaults to 0.
+
+    Returns:
+        Rect: The area that was drawn to.
+    """
+    if isinstance(target, TextureFrame):
+        return target.draw_rect(color, rect, width, border_radius)
+    return pygame.draw.rect(target, color, rect, width, border_radius = border_radius)
+
+def draw_circle(target, color, center, radius, width = 0):
+    """Draws a circle onto a Surface with pygame.draw.circle(), or onto a TextureFrame with the renderer.
+
+    Parameters:
+        target (Surface or TextureFrame): The surface to draw onto, usually the screen.
+        color ((int, int, int)): The color.
+        center ((int, int)): The center of the circle.
+        radius (int): The radius of the circle.
+        width (int): The width of the outline, 0 to fill the circle. Defaults to 0.
+
+    Returns:
+        Rect: The area that was drawn to.
+    """
+    if isinstance(target, TextureFrame):
+        return target.draw_circle(color, center, radius, width)
+    return pygame.draw.circle(target, color, center, radius, width)
+
+def capture(target):
+    """Returns a copy of what has been drawn onto target so far, which can be blitted onto it later, like the
+    world behind a menu.
+
+    Parameters:
+        target (Surface or TextureFrame): The surface that was drawn onto, usually the screen.
+
+    Returns:
+        Surface: The copy.
+    """
+    if isinstance(target, TextureFrame):
+        return target.capture()
+    copy = pygame.Surface(target.get_size())
+    copy.blit(target, (0, 0))
+    return copy
+
+class TextureFrame:
+    """The frame scenes draw onto with the texture backend. Blits are texture copies, fills and shapes are drawn
+    by the renderer, and all of it goes into a target texture that present() shows in the window.
+    """
+
+    def __init__(self, renderer, size):
+        """Default constructor.
+
+        Parameters:
+            renderer (Renderer): The renderer of the window.
+            size ((int, int)): The size of the frame, the logical size of the window.
+        """
+        self.renderer = renderer
+        self.size = tuple(size)
+        self.rect = pygame.Rect((0, 0), self.size)
+        self.canvas = Texture(renderer, self.size, target = True)
+        # Textures by id of their surface, each with a weak reference to the surface that says when it is gone
+        self.textures = {}
+        # Ids of surfaces that were garbage collected. Their textures are dropped by present(), because a surface
+        # can die on the asset streamer's thread and SDL textures may only be destroyed on the main thread
+        self.dead = []
+        # Shape surfaces by what they look like
+        self.shapes = {}
+        # Whether the renderer is drawing into the canvas, which it only does between the first draw of a frame
+        # and present(), so pygame can still draw to the window while events are handled
+        self.drawing = False
+        self.uploads = 0
+
+    def get_size(self):
+        return self.size
+
+    def get_width(self):
+        return self.size[0]
+
+    def get_height(self):
+        return self.size[1]
+
+    def get_rect(self, **anchor):
+        rect = self.rect.copy()
+        for name, value in anchor.items():
+            setattr(rect, name, value)
+        return rect
+
+    def _begin(self):
+        if not self.drawing:
+            self.renderer.target = self.canvas
+            self.drawing = True
+
+    def _forget(self, key):
+        self.dead.append(key)
+
+    def get_texture(self, surface):
+        """Returns the texture of a surface, uploading the surface the first time.
+
+        Parameters:
+            surface (Surface): The surface.
+
+        Returns:
+            Texture: The texture.
+        """
+        key = id(surface)
+        cached = self.textures.get(key)
+        if cached is not None and cached[0]() is surface:
+            return cached[1]
+        texture = Texture.from_surface(self.renderer, surface)
+        self.uploads += 1
+        if surface not in _volatile_surfaces:
+            self.textures[key] = (weakref.ref(surface, lambda ref, key = key: self._forget(key)), texture)
+        return texture
+
+    def blit(self, source, dest, area = None, special_flags = 0):
+        """Draws source at dest like Surface.blit(). special_flags are not supported.
+        """
+        if special_flags:
+            raise ValueError("TextureFrame can't blit with special_flags")
+        self._begin()
+        if area is None:
+            srcrect = None
+            width, height = source.get_size()
+        else:
+            srcrect = pygame.Rect(area).clip(source.get_rect())
+            width, height = srcrect.size
+        dstrect = pygame.Rect(dest[0], dest[1], width, height)
+        if width and height:
+            self.get_texture(source).draw(srcrect, dstrect)
+        return dstrect.clip(self.rect)
+
+    def blits(self, blit_sequence, doreturn = True):
+        """Draws every (source, dest) or (source, dest, area) of blit_sequence like Surface.blits().
+        """
+        rects = [self.blit(*entry) for entry in blit_sequence]
+        return rects if doreturn else None
+
+    def fill(self, color, rect = None, special_flags = 0):
+        """Fills rect, or the whole frame, with an opaque color like Surface.fill(). special_flags are not supported.
+        """
+        if special_flags:
+            raise ValueError("TextureFrame can't fill with special_flags")
+        self._begin()
+        rect = self.rect if rect is None else pygame.Rect(rect).clip(self.rect)
+        color = pygame.Color(color)
+        # The screen has no alpha channel, so colors are opaque like they are on a Surface
+        self.renderer.draw_color = (color.r, color.g, color.b, 255)
+        self.renderer.fill_rect(rect)
+        return rect
+
+    def _get_shape(self, key, size, draw):
+        # Returns the shape surface for key, drawing it with draw the first time
+        surface = self.shapes.get(key)
+        if surface is None:
+            if len(self.shapes) >= MAX_CACHED_SHAPES:
+                self.shapes.clear()
+            surface = pygame.Surface(size, pygame.SRCALPHA)
+            draw(surface)
+            self.shapes[key] = surface
+        return surface
+
+    def draw_rect(self, color, rect, width = 0, border_radius = 0):
+        """Draws a rect like pygame.draw.rect(). See draw_rect() in this module.
+        """
+        rect = pygame.Rect(rect)
+        if width == 0 and border_radius <= 0:
+            return self.fill(color, rect)
+        if border_radius <= 0 and width * 2 < min(rect.width, rect.height):
+            # An outline is four thin fills, inside the rect like pygame draws it
+            self.fill(color, (rect.x, rect.y, rect.width, width))
+            self.fill(color, (rect.x, rect.bottom - width, rect.width, width))
+            self.fill(color, (rect.x, rect.y + width, width, rect.height - width * 2))
+            self.fill(color, (rect.right - width, rect.y + width, width, rect.height - width * 2))
+            return rect.clip(self.rect)
+
+        color = tuple(pygame.Color(color))[:3]
+        key = ("rect", rect.size, color, width, border_radius)
+        shape = self._get_shape(key, rect.size, lambda surface: pygame.draw.rect(
+            surface, color, surface.get_rect(), width, border_radius = border_radius))
+        return self.blit(shape, rect.topleft)
+
+    def draw_circle(self, color, center, radius, width = 0):
+        """Draws a circle like pygame.draw.circle(). See draw_circle() in this module.
+        """
+        color = tuple(pygame.Color(color))[:3]
+        key = ("circle", radius, color, width)
+        shape = self._get_shape(key, (radius * 2, radius * 2), lambda surface: pygame.draw.circle(
+            surface, color, (radius, radius), radius, width))
+        return self.blit(shape, (int(center[0]) - radius, int(center[1]) - radius))
+
+    def capture(self):
+        """Returns a copy of what has been drawn this frame. See capture() in this module.
+        """
+        self._begin()
+        return self.renderer.to_surface().convert()
+
+    def present(self):
+        """Shows the frame in the window, scaled to it.
+        """
+        for key in self.dead:
+            cached = self.textures.get(key)
+            if cached is not None and cached[0]() is None:
+                del self.textures[key]
+        self.dead.clear()
+
+        self.renderer.target = None
+        self.drawing = False
+        self.renderer.draw_color = (0, 0, 0, 255)
+        self.renderer.clear()
+        self.canvas.draw()
+        self.renderer.present()
+
+    def format_report(self):
+        """Returns the texture counters as text for the debug dump.
+        """
+        return f"Textures: {len(self.textures)} cached, {self.uploads} uploads, {len(self.shapes)} shapes"
+
+    def close(self):
+        """Drops every texture. Has to be called before pygame.quit(), which shuts SDL down under them.
+        """
+        self.renderer.target = None
+        self.textures.clear()
+        self.dead.clear()
+        self.canvas = None
+
+class TextureBackend:
+    """The game window drawn through its SDL2 Renderer, and the frame that scenes draw onto.
+    """
+
+    def __init__(self, fullscreen = False, vsync = True):
+        """Default constructor. Opens the window.
+
+        Parameters:
+            fullscreen (bool): Whether to fill the whole monitor. Defaults to False.
+            vsync (bool): Whether presenting a frame waits for the monitor's refresh. Defaults to True.
+        """
+        # A SCALED window comes with a renderer, on the GPU when there is one and SDL's software renderer when
+        # there isn't, that already scales LOGICAL_SIZE to the window
+        self.screen = open_window(fullscreen, vsync)
+        self.renderer = Renderer.from_window(Window.from_display_module())
+        self.frame = TextureFrame(self.renderer, LOGICAL_SIZE)
+
+    def present(self):
+        """Shows the frame that was drawn in the window.
+        """
+        self.frame.present()
+
+    def toggle_fullscreen(self):
+        """Switches the window between a window and full screen.
+
+        Returns:
+            bool: Whether the window switched, False when the video driver can't do it.
+        """
+        return toggle_fullscreen()
+
+    def close(self):
+        """Drops the frame's textures. Has to be called before pygame.quit().
+        """
+        self.frame.close()
+        self.frame = None
+        self.renderer = None
@@ -0,0 +1,41 @@
+import pygame
+
+# Every scene is laid out for one fixed logical size. The window is opened with pygame.SCALED, so SDL scales each
+# finished frame to the real window or monitor once, on the GPU where it can, and mouse positions come back in
+# logical coordinates. A 4K monitor shows the game full screen without any scene drawing a bigger frame, and the
+# asset caches, which are keyed by size, never see a new size after the window changes.
+LOGICAL_SIZE = (1280, 720)
+
+def open_window(fullscreen = False, vsync = True):
+    """Opens the game window.
+
+    Parameters:
+        fullscreen (bool): Whether to fill the whole monitor. Defaults to False.
+        vsync (bool): Whether presenting a frame waits for the monitor's refresh. Defaults to True.
+
+    Returns:
+        Surface: The display surface, always LOGICAL_SIZE.
+    """
+    flags = pygame.SCALED
+    if fullscreen:
+        flags |= pygame.FULLSCREEN
+    if vsync:
+        try:
+            return pygame.display.set_mode(LOGICAL_SIZE, flags, vsync=1)
+        except pygame.error:
+            # Not every video driver can wait for the refresh, the game is still capped by its frame clock
+            pass
+    return pygame.display.set_mode(LOGICAL_SIZE, flags)
+
+def toggle_fullscreen():
+    """Switches the open window between a window and full screen. SCALED windows switch in place, so the display
+    surface and everything drawn for it stay valid.
+
+    Returns:
+        bool: Whether the window switched, False when the video driver can't do it.
+    """
+    try:
+        pygame.display.toggle_fullscreen()
+    except pygame.error:
+        return False
+    return True